@@ -1,9 +1,10 @@
 """Adaptive questionnaire flow that tailors follow-up questions by user type."""
 
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import json
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 
 
@@ -215,6 +216,9 @@ class AdaptiveQuestionnaire:
     """Comprehensive questionnaire system with type-specific question flows."""
 
     MAX_BATCH_SIZE = 4
+    # Question batches only depend on (user_type, answered ids); keep the most
+    # recent ones so repeated progress checks skip the filtering pass.
+    BATCH_CACHE_SIZE = 1024
 
     UNIVERSAL_QUESTIONS: List[Dict[str, Any]] = [
         {
@@ -982,13 +986,45 @@ class AdaptiveQuestionnaire:
             },
         ],
     }
+
+    def __init__(self) -> None:
+        self._batch_cache: Dict[Tuple[str, frozenset], Tuple[Dict[str, Any], ...]] = {}
+
+    @cached_property
+    def _universal_ids(self) -> Tuple[str, ...]:
+        return tuple(q["id"] for q in self.UNIVERSAL_QUESTIONS)
+
+    @cached_property
+    def _type_ids(self) -> Dict[str, Tuple[str, ...]]:
+        return {
+            user_type: tuple(q["id"] for q in questions)
+            for user_type, questions in self.TYPE_QUESTIONS.items()
+        }
+
+    def universal_ids(self) -> List[str]:
+        """Return the ids of the universal questions in display order."""
+        return list(self._universal_ids)
+
+    def type_ids(self, user_type: str) -> List[str]:
+        """Return the ids of the questions specific to ``user_type``."""
+        return list(self._type_ids.get(user_type, ()))
+
     def get_questions_for_type(
         self,
         user_type: str,
         answered_questions: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Return the next batch of questions respecting progressive disclosure."""
-        answered_ids = set(answered_questions or [])
+        key = (user_type, frozenset(answered_questions or ()))
+        batch = self._batch_cache.get(key)
+        if batch is None:
+            batch = tuple(self._select_batch(user_type, key[1]))
+            if len(self._batch_cache) >= self.BATCH_CACHE_SIZE:
+                del self._batch_cache[next(iter(self._batch_cache))]
+            self._batch_cache[key] = batch
+        return list(batch)
+
+    def _select_batch(self, user_type: str, answered_ids: frozenset) -> List[Dict[str, Any]]:
         questions: List[Dict[str, Any]] = [
             q
             for q in self.UNIVERSAL_QUESTIONS
@@ -1003,32 +1039,49 @@ class AdaptiveQuestionnaire:
             questions.extend(type_specific)
         return questions[: self.MAX_BATCH_SIZE]
 
+    @cached_property
+    def _required_universal_ids(self) -> Tuple[str, ...]:
+        return tuple(q["id"] for q in self.UNIVERSAL_QUESTIONS if q.get("required"))
+
+    @cached_property
+    def _required_type_ids(self) -> Dict[str, Tuple[str, ...]]:
+        return {
+            user_type: tuple(q["id"] for q in questions if q.get("required"))
+            for user_type, questions in self.TYPE_QUESTIONS.items()
+        }
+
+    def _validation_ids(self, user_type: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        required = self._required_universal_ids + self._required_type_ids.get(user_type, ())
+        all_expected = self._universal_ids + self._type_ids.get(user_type, ())
+        return required, all_expected
+
     def validate_responses(self, answers: Dict[str, Any], user_type: str) -> Dict[str, Any]:
         """Validate that required questions are present and score response quality."""
-        required_universal = [
-            q["id"] for q in self.UNIVERSAL_QUESTIONS if q.get("required")
-        ]
-        required_type_specific = [
-            q["id"]
-            for q in self.TYPE_QUESTIONS.get(user_type, [])
-            if q.get("required")
-        ]
-        all_expected = [
-            q["id"] for q in self.UNIVERSAL_QUESTIONS
-        ] + [
-            q["id"] for q in self.TYPE_QUESTIONS.get(user_type, [])
-        ]
+        return self._validate_against(answers, *self._validation_ids(user_type))
+
+    def validate_responses_batch(
+        self, answers_list: Iterable[Dict[str, Any]], user_type: str
+    ) -> List[Dict[str, Any]]:
+        """Validate several answer sets for the same user type in one pass."""
+        required, all_expected = self._validation_ids(user_type)
+        return [self._validate_against(answers, required, all_expected) for answers in answers_list]
 
+    @staticmethod
+    def _validate_against(
+        answers: Dict[str, Any],
+        required: Sequence[str],
+        all_expected: Sequence[str],
+    ) -> Dict[str, Any]:
         missing = [
             req_id
-            for req_id in required_universal + required_type_specific
+            for req_id in required
             if not _is_answer_provided(answers.get(req_id))
         ]
 
-        total_required = len(required_universal) + len(required_type_specific)
+        total_required = len(required)
         quality_score = 0.0
 
-        for req_id in required_universal + required_type_specific:
+        for req_id in required:
             value = answers.get(req_id)
             if _is_answer_provided(value):
                 quality_score += 1
@@ -1,6 +1,7 @@
 """Classify respondents into business archetypes."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List
 
 
@@ -96,15 +97,22 @@ class BusinessTypeClassifier:
             }
         ]
 
-    def classify(self, answers: Dict[str, str]) -> Dict[str, str]:
-        """Return metadata for the chosen business type."""
-        user_type = answers.get("user_type")
-        if user_type in self.USER_TYPES:
-            payload = self.USER_TYPES[user_type]
-            return {
+    @cached_property
+    def _classifications(self) -> Dict[str, Dict[str, str]]:
+        # Classification only depends on the chosen user type
+        return {
+            user_type: {
                 "business_type": user_type,
                 "framework": payload.framework,
                 "label": payload.label,
             }
+            for user_type, payload in self.USER_TYPES.items()
+        }
+
+    def classify(self, answers: Dict[str, str]) -> Dict[str, str]:
+        """Return metadata for the chosen business type."""
+        classification = self._classifications.get(answers.get("user_type"))
+        if classification is not None:
+            return dict(classification)
         return {"business_type": "unknown", "framework": "ADAPT", "label": "Unknown"}
 
@@ -1,3 +1,85 @@
-"""Pytest configuration to skip heavy smoke test imports during test runs."""
+"""Pytest configuration shared by the root-level and ``tests/`` suites.
+
+Skips the heavy smoke test imports and builds the classifiers and compiled
+graphs once per session: the classifiers only hold read-only question and
+framework tables, and the compiled graphs are reusable across ``invoke``
+calls.
+"""
+
+import copy
+
+import pytest
+
+from classifiers import AdaptiveQuestionnaire, BusinessTypeClassifier, FrameworkSelector
 
 collect_ignore = ["smoke_test.py"]
+
+# Class-level tables the session-scoped classifiers read from; any test that
+# mutates them would leak state into every later test on the same worker.
+_SHARED_TABLES = {
+    "classifier": (BusinessTypeClassifier, ("USER_TYPES",)),
+    "questionnaire": (AdaptiveQuestionnaire, ("UNIVERSAL_QUESTIONS", "TYPE_QUESTIONS")),
+    "framework_selector": (FrameworkSelector, ("FRAMEWORK_CHARACTERISTICS", "BASE_FRAMEWORKS")),
+}
+_PRISTINE_TABLES = {
+    name: {attr: copy.deepcopy(getattr(cls, attr)) for attr in attrs}
+    for name, (cls, attrs) in _SHARED_TABLES.items()
+}
+
+
+class StubEmbeddingService:
+    """Offline stand-in for ``OpenAIEmbeddingService`` with fixed vectors."""
+
+    model = "text-embedding-3-large"
+    embedding_dim = 8
+
+    def embed_texts(self, texts):
+        return [[(len(text) % 1000) / 1000.0] * self.embedding_dim for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def _shared_tables_unchanged(request):
+    yield
+    for name, pristine in _PRISTINE_TABLES.items():
+        if name not in request.fixturenames:
+            continue
+        instance = request.getfixturevalue(name)
+        for attr, expected in pristine.items():
+            assert getattr(instance, attr) == expected, f"{request.node.nodeid} mutated {name}.{attr}"
+
+
+@pytest.fixture(scope="session")
+def classifier() -> BusinessTypeClassifier:
+    return BusinessTypeClassifier()
+
+
+@pytest.fixture(scope="session")
+def questionnaire() -> AdaptiveQuestionnaire:
+    return AdaptiveQuestionnaire()
+
+
+@pytest.fixture(scope="session")
+def framework_selector() -> FrameworkSelector:
+    return FrameworkSelector()
+
+
+@pytest.fixture(scope="session")
+def intake_graph():
+    # Imported lazily so modules that do not need LangGraph still collect
+    from graphs import compile_intake_graph
+
+    return compile_intake_graph()
+
+
+@pytest.fixture(scope="session")
+def embedding_service() -> StubEmbeddingService:
+    return StubEmbeddingService()
+
+
+@pytest.fixture(scope="session")
+def big_idea_graph(embedding_service):
+    from frameworks.big_idea_pipeline import BigIdeaPipeline
+    from graphs.big_idea_graph import BigIdeaDependencies, compile_big_idea_graph
+
+    pipeline = BigIdeaPipeline(embedding_service=embedding_service)
+    return compile_big_idea_graph(dependencies=BigIdeaDependencies(pipeline=pipeline))
@@ -1,5 +1,7 @@
 """Shared infrastructure exports."""
 
+from importlib import import_module
+
 from .context import AgentContext, AgentContextManager, bind_context, clear_context, current_agent_context
 from .errors import (
     AgentError,
@@ -22,9 +24,29 @@ from .hitl import (
     BaseHITLQueue,
     InMemoryHITLQueue,
 )
-from .mixins import AgentToolkitMixin, ConfigurableMixin, ContextualMixin
 from .retry import RetryPolicy, retry_async, retry_sync, with_retry
-from .telemetry import LoggingTelemetryClient, NullTelemetryClient, TelemetryClient, TelemetryEvent, TelemetryMixin
+
+# Telemetry (and the mixins built on it) pull in structlog; resolve them on
+# first access so importing the lightweight primitives above stays cheap.
+_LAZY_EXPORTS = {
+    "AgentToolkitMixin": ".mixins",
+    "ConfigurableMixin": ".mixins",
+    "ContextualMixin": ".mixins",
+    "LoggingTelemetryClient": ".telemetry",
+    "NullTelemetryClient": ".telemetry",
+    "TelemetryClient": ".telemetry",
+    "TelemetryEvent": ".telemetry",
+    "TelemetryMixin": ".telemetry",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "AgentContext",
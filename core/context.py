@@ -13,7 +13,7 @@ _CURRENT_CONTEXT: ContextVar[Optional["AgentContext"]] = ContextVar(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """Runtime metadata propagated between agents, tools, and telemetry."""
 
@@ -38,9 +38,11 @@ class AgentContext:
             "parent_span_id": self.span_id or self.parent_span_id,
             "workflow_id": self.workflow_id,
             "run_id": self.run_id,
-            "metadata": dict(self.metadata),
         }
         payload.update(overrides)
+        # Only copy the parent's metadata when the caller does not supply its own.
+        if "metadata" not in payload:
+            payload["metadata"] = dict(self.metadata)
         return AgentContext(**payload)
 
 
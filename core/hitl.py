@@ -5,7 +5,7 @@ import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from .context import AgentContext
 
@@ -16,7 +16,7 @@ HITL_REJECTED = "rejected"
 HITL_CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class HITLRequest:
     request_id: str
     task_name: str
@@ -48,6 +48,16 @@ class BaseHITLQueue(ABC):
     async def get(self, request_id: str) -> Optional[HITLRequest]:
         """Fetch a request by identifier."""
 
+    async def get_many(self, request_ids: Iterable[str]) -> Dict[str, HITLRequest]:
+        """Fetch several requests at once, omitting unknown identifiers."""
+
+        found: Dict[str, HITLRequest] = {}
+        for request_id in request_ids:
+            item = await self.get(request_id)
+            if item is not None:
+                found[request_id] = item
+        return found
+
 
 class InMemoryHITLQueue(BaseHITLQueue):
     """Simple in-memory implementation suitable for unit tests."""
@@ -71,3 +81,11 @@ class InMemoryHITLQueue(BaseHITLQueue):
     async def get(self, request_id: str) -> Optional[HITLRequest]:
         async with self._lock:
             return self._requests.get(request_id)
+
+    async def get_many(self, request_ids: Iterable[str]) -> Dict[str, HITLRequest]:
+        async with self._lock:
+            return {
+                request_id: self._requests[request_id]
+                for request_id in request_ids
+                if request_id in self._requests
+            }
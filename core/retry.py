@@ -94,6 +94,10 @@ def with_retry(
     policy = policy or RetryPolicy()
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if policy.attempts == 1:
+            # A single attempt never retries; skip the wrapper frame entirely.
+            return func
+
         if asyncio.iscoroutinefunction(func):
 
             @functools.wraps(func)
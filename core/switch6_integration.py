@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from Intake.classifiers.adaptive_questionnaire import AdaptiveQuestionnaire
 from Intake.classifiers.framework_selector import FrameworkSelector
@@ -22,6 +25,96 @@ from Intake.graphs.switch6_graph import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Minimal handoff requirements and the personas Switch 6 supports.
+_HANDOFF_REQUIRED_FIELDS = ("user_type", "primary_goal")
+_SWITCH6_USER_TYPES = frozenset({"business_owner", "startup_founder", "personal_brand"})
+
+# Answer-length tiers for handoff quality: <=10 chars is too brief, then basic,
+# moderate and detailed responses.
+_LENGTH_THRESHOLDS = (10, 20, 50)
+_LENGTH_SCORES = (0.1, 0.4, 0.7, 1.0)
+
+# Read-only persona tables shared by every PersonaConfigManager.
+_PERSONA_CONFIGS: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    "business_owner": MappingProxyType({
+        "segment_keywords": ("industry", "target_market", "competitors"),
+        "wound_focus": ("pain_points", "challenges", "obstacles"),
+        "reframe_emphasis": ("differentiation", "unique_value"),
+        "offer_structure": ("pricing", "packaging", "deliverables"),
+        "action_priority": ("implementation", "execution"),
+        "cash_metrics": ("revenue", "profitability", "roi"),
+    }),
+    "startup_founder": MappingProxyType({
+        "segment_keywords": ("market", "target_audience", "early_adopters"),
+        "wound_focus": ("market_fit", "traction", "scaling"),
+        "reframe_emphasis": ("innovation", "disruption"),
+        "offer_structure": ("mvp", "iteration", "feedback"),
+        "action_priority": ("experimentation", "validation"),
+        "cash_metrics": ("funding", "burn_rate", "runway"),
+    }),
+    "personal_brand": MappingProxyType({
+        "segment_keywords": ("niche", "audience", "community"),
+        "wound_focus": ("authenticity", "connection", "trust"),
+        "reframe_emphasis": ("story", "voice", "mission"),
+        "offer_structure": ("content", "engagement", "relationship"),
+        "action_priority": ("consistency", "interaction"),
+        "cash_metrics": ("followers", "engagement", "influence"),
+    }),
+})
+
+# Switch 6 follow-up questions, asked in this order whenever the answer is empty.
+_SWITCH6_FOLLOW_UPS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "id": "what_you_do",
+        "question": "What does your business do? Please describe your products or services.",
+        "type": "text",
+        "required": True,
+        "category": "business_context",
+    }),
+    MappingProxyType({
+        "id": "business_industry",
+        "question": "What industry or market does your business operate in?",
+        "type": "text",
+        "required": True,
+        "category": "business_context",
+    }),
+    MappingProxyType({
+        "id": "target_customer",
+        "question": "Who is your target customer or audience?",
+        "type": "text",
+        "required": True,
+        "category": "audience",
+    }),
+    MappingProxyType({
+        "id": "main_challenge",
+        "question": "What is your main challenge or obstacle right now?",
+        "type": "text",
+        "required": True,
+        "category": "challenges",
+    }),
+    MappingProxyType({
+        "id": "competitors",
+        "question": "Who are your main competitors or alternative solutions?",
+        "type": "text",
+        "required": False,
+        "category": "competitive_landscape",
+    }),
+    MappingProxyType({
+        "id": "base_price",
+        "question": "What's your typical price point or project value?",
+        "type": "currency",
+        "required": False,
+        "category": "pricing",
+    }),
+    MappingProxyType({
+        "id": "customer_acquisition_cost",
+        "question": "What's your average customer acquisition cost?",
+        "type": "currency",
+        "required": False,
+        "category": "metrics",
+    }),
+)
+
 
 @dataclass
 class IntakeHandoffValidator:
@@ -44,16 +137,15 @@ class IntakeHandoffValidator:
 
     def validate_handoff_data(self, intake_data: Dict[str, Any], user_type: str) -> Tuple[bool, List[str]]:
         """Validate that intake data is suitable for Switch 6 handoff."""
-        errors = []
-
         # Check required fields (more lenient for testing)
-        required_for_validation = ["user_type", "primary_goal"]  # Minimal requirements
-        for field in required_for_validation:
-            if not intake_data.get(field):
-                errors.append(f"Missing required field: {field}")
+        errors = [
+            f"Missing required field: {field}"
+            for field in _HANDOFF_REQUIRED_FIELDS
+            if not intake_data.get(field)
+        ]
 
         # Validate user type compatibility
-        if user_type not in ["business_owner", "startup_founder", "personal_brand"]:
+        if user_type not in _SWITCH6_USER_TYPES:
             errors.append(f"User type '{user_type}' not supported by Switch 6")
 
         # For testing purposes, be more lenient with data quality
@@ -65,24 +157,15 @@ class IntakeHandoffValidator:
     def _assess_data_quality(self, data: Dict[str, Any]) -> float:
         """Assess the quality of intake data for Switch 6 processing."""
         score = 0.0
-        total_fields = len(self.required_fields)
-
         for field in self.required_fields:
             value = data.get(field, "")
             if isinstance(value, str):
                 # Score based on length and detail level
-                if len(value) > 50:  # Detailed response
-                    score += 1.0
-                elif len(value) > 20:  # Moderate response
-                    score += 0.7
-                elif len(value) > 10:  # Basic response
-                    score += 0.4
-                else:  # Too brief
-                    score += 0.1
+                score += _LENGTH_SCORES[bisect.bisect_left(_LENGTH_THRESHOLDS, len(value))]
             else:
                 score += 0.5  # Some value provided
 
-        return score / total_fields
+        return score / len(self.required_fields)
 
 
 @dataclass
@@ -90,36 +173,13 @@ class PersonaConfigManager:
     """Manages persona configuration for Switch 6 integration."""
 
     def __init__(self):
-        self.persona_configs = {
-            "business_owner": {
-                "segment_keywords": ["industry", "target_market", "competitors"],
-                "wound_focus": ["pain_points", "challenges", "obstacles"],
-                "reframe_emphasis": ["differentiation", "unique_value"],
-                "offer_structure": ["pricing", "packaging", "deliverables"],
-                "action_priority": ["implementation", "execution"],
-                "cash_metrics": ["revenue", "profitability", "roi"],
-            },
-            "startup_founder": {
-                "segment_keywords": ["market", "target_audience", "early_adopters"],
-                "wound_focus": ["market_fit", "traction", "scaling"],
-                "reframe_emphasis": ["innovation", "disruption"],
-                "offer_structure": ["mvp", "iteration", "feedback"],
-                "action_priority": ["experimentation", "validation"],
-                "cash_metrics": ["funding", "burn_rate", "runway"],
-            },
-            "personal_brand": {
-                "segment_keywords": ["niche", "audience", "community"],
-                "wound_focus": ["authenticity", "connection", "trust"],
-                "reframe_emphasis": ["story", "voice", "mission"],
-                "offer_structure": ["content", "engagement", "relationship"],
-                "action_priority": ["consistency", "interaction"],
-                "cash_metrics": ["followers", "engagement", "influence"],
-            },
-        }
+        self.persona_configs = _PERSONA_CONFIGS
 
     def get_persona_config(self, user_type: str) -> Dict[str, Any]:
         """Get persona-specific configuration for Switch 6."""
-        return self.persona_configs.get(user_type, self.persona_configs["business_owner"])
+        # Hand out plain lists so callers never touch the shared tables.
+        config = self.persona_configs.get(user_type, self.persona_configs["business_owner"])
+        return {key: list(values) for key, values in config.items()}
 
     def adapt_business_data(self, intake_data: Dict[str, Any], user_type: str) -> Dict[str, Any]:
         """Adapt intake data based on persona configuration."""
@@ -153,99 +213,47 @@ class AdaptiveQuestionIntegrator:
 
     def get_switch6_specific_questions(self, user_type: str, current_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get Switch 6 specific follow-up questions based on current data."""
-        questions = []
-
-        # Essential business context questions
-        if not current_data.get("what_you_do"):
-            questions.append({
-                "id": "what_you_do",
-                "question": "What does your business do? Please describe your products or services.",
-                "type": "text",
-                "required": True,
-                "category": "business_context",
-            })
-
-        # Industry-specific questions
-        if not current_data.get("business_industry"):
-            questions.append({
-                "id": "business_industry",
-                "question": "What industry or market does your business operate in?",
-                "type": "text",
-                "required": True,
-                "category": "business_context",
-            })
+        return [dict(question) for question in _SWITCH6_FOLLOW_UPS if not current_data.get(question["id"])]
 
-        # Target customer questions
-        if not current_data.get("target_customer"):
-            questions.append({
-                "id": "target_customer",
-                "question": "Who is your target customer or audience?",
-                "type": "text",
-                "required": True,
-                "category": "audience",
-            })
+    def merge_adaptive_responses(self, original_data: Dict[str, Any], new_responses: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge new adaptive question responses with existing data."""
+        return {
+            **original_data,
+            **new_responses,
+            # Update completion tracking
+            "adaptive_questions_asked": original_data.get("adaptive_questions_asked", 0) + len(new_responses),
+            "last_adaptive_update": datetime.now(timezone.utc).isoformat(),
+        }
 
-        # Main challenge questions
-        if not current_data.get("main_challenge"):
-            questions.append({
-                "id": "main_challenge",
-                "question": "What is your main challenge or obstacle right now?",
-                "type": "text",
-                "required": True,
-                "category": "challenges",
-            })
 
-        # Competitor analysis questions
-        if not current_data.get("competitors"):
-            questions.append({
-                "id": "competitors",
-                "question": "Who are your main competitors or alternative solutions?",
-                "type": "text",
-                "required": False,
-                "category": "competitive_landscape",
-            })
+@lru_cache(maxsize=1)
+def _shared_questionnaire() -> AdaptiveQuestionnaire:
+    return AdaptiveQuestionnaire()
 
-        # Pricing questions
-        if not current_data.get("base_price"):
-            questions.append({
-                "id": "base_price",
-                "question": "What's your typical price point or project value?",
-                "type": "currency",
-                "required": False,
-                "category": "pricing",
-            })
 
-        # Customer acquisition questions
-        if not current_data.get("customer_acquisition_cost"):
-            questions.append({
-                "id": "customer_acquisition_cost",
-                "question": "What's your average customer acquisition cost?",
-                "type": "currency",
-                "required": False,
-                "category": "metrics",
-            })
+@lru_cache(maxsize=1)
+def _shared_validator() -> IntakeHandoffValidator:
+    return IntakeHandoffValidator(adaptive_questionnaire=_shared_questionnaire())
 
-        return questions
 
-    def merge_adaptive_responses(self, original_data: Dict[str, Any], new_responses: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge new adaptive question responses with existing data."""
-        merged = original_data.copy()
-        merged.update(new_responses)
+@lru_cache(maxsize=1)
+def _shared_persona_manager() -> PersonaConfigManager:
+    return PersonaConfigManager()
 
-        # Update completion tracking
-        merged["adaptive_questions_asked"] = original_data.get("adaptive_questions_asked", 0) + len(new_responses)
-        merged["last_adaptive_update"] = datetime.now(timezone.utc).isoformat()
 
-        return merged
+@lru_cache(maxsize=1)
+def _shared_adaptive_integrator() -> AdaptiveQuestionIntegrator:
+    return AdaptiveQuestionIntegrator(questionnaire=_shared_questionnaire())
 
 
 class Switch6IntegrationOrchestrator:
     """Main orchestrator for Switch 6 integration with intake system."""
 
     def __init__(self):
-        self.validator = IntakeHandoffValidator()
-        self.persona_manager = PersonaConfigManager()
-        self.adaptive_integrator = AdaptiveQuestionIntegrator()
+        # The helpers hold only static tables, so every orchestrator shares one set.
+        self.validator = _shared_validator()
+        self.persona_manager = _shared_persona_manager()
+        self.adaptive_integrator = _shared_adaptive_integrator()
         self.framework_selector = FrameworkSelector()
 
     async def orchestrate_handoff(
@@ -11,7 +11,7 @@ import structlog
 from .context import AgentContext, current_agent_context
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryEvent:
     """Structured payload emitted by the telemetry layer."""
 
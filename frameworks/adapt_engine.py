@@ -1,8 +1,13 @@
+import re
 from typing import Dict, List, Any
 from datetime import datetime
 
 from .big_idea_pipeline import BigIdeaPipeline, BigIdeaRequest
 
+_WORD_RE = re.compile(r"\b\w+\b")
+_EMOTIONAL_KEYWORDS = ("frustrated", "passion", "excited", "proud", "worried", "happy")
+_STOP_WORDS = frozenset({"the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"})
+
 
 class ADAPTFrameworkEngine:
     """
@@ -481,21 +486,17 @@ class ADAPTFrameworkEngine:
         if not why_story:
             return "passion for helping others succeed"
 
-        emotional_keywords = ["frustrated", "passion", "excited", "proud", "worried", "happy"]
-        for keyword in emotional_keywords:
-            if keyword in why_story.lower():
+        lowered = why_story.lower()
+        for keyword in _EMOTIONAL_KEYWORDS:
+            if keyword in lowered:
                 return f"driven by {keyword}"
 
         return "committed to making a difference"
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Simple keyword extraction"""
-        import re
-        words = re.findall(r'\b\w+\b', text.lower())
         # Filter common words
-        stop_words = {"the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
-        keywords = [word for word in words if word not in stop_words and len(word) > 3]
-        return list(set(keywords))
+        return list({word for word in _WORD_RE.findall(text.lower()) if word not in _STOP_WORDS and len(word) > 3})
 
     # Placeholder methods for other stages (implement similarly)
     def _calculate_design_strength(self, design_data: Dict) -> float:
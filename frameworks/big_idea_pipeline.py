@@ -20,6 +20,9 @@ except ImportError:  # pragma: no cover
 
 LOGGER = logging.getLogger(__name__)
 
+# Labelled lines written by BigIdeaPromptBuilder that the offline fallback reads back.
+_PROMPT_FIELD_RE = re.compile(r"(?P<label>Audience|Primary benefit):\s*(?P<value>.*)")
+
 POWER_WORDS = {
     "double",
     "triple",
@@ -263,10 +266,13 @@ class GPT5NanoClient:
         return self._fallback(prompt, count=count)
 
     def _fallback(self, prompt: str, *, count: int) -> List[str]:
-        audience_match = re.search(r"Audience:\s*(.*)", prompt)
-        benefit_match = re.search(r"Primary benefit:\s*(.*)", prompt)
-        audience = audience_match.group(1).strip() if audience_match else "Customers"
-        benefit = benefit_match.group(1).strip() if benefit_match else "Results"
+        fields: Dict[str, str] = {}
+        for match in _PROMPT_FIELD_RE.finditer(prompt):
+            fields.setdefault(match.group("label"), match.group("value").strip())
+            if len(fields) == 2:
+                break
+        audience = fields.get("Audience", "Customers")
+        benefit = fields.get("Primary benefit", "Results")
         templates = [
             "How {audience} {verb} {benefit} Without {obstacle}",
             "{audience}: {verb} {benefit} In {timeframe}",
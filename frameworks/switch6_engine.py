@@ -7,6 +7,7 @@ import math
 import os
 import random
 import statistics
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -49,11 +50,14 @@ class CitationManager:
 
     counter: int = 0
     register: Dict[int, Citation] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def new_citation(self, label: str) -> Citation:
-        self.counter += 1
-        citation = Citation(index=self.counter, label=label)
-        self.register[self.counter] = citation
+        # Stages may run on worker threads concurrently, so numbering is serialized.
+        with self._lock:
+            self.counter += 1
+            citation = Citation(index=self.counter, label=label)
+            self.register[self.counter] = citation
         return citation
 
     def inline_ref(self, index: int) -> str:
@@ -279,7 +283,7 @@ class GoogleTrendsClient:
         self._client.build_payload(keywords, timeframe="today 12-m", geo="")
         interest_over_time = self._client.interest_over_time()
         if interest_over_time.empty:
-            idx = pd.date_range(end=datetime.now(), periods=12, freq="M")
+            idx = pd.date_range(end=datetime.now(), periods=12, freq="ME")
             data = {term: [random.randint(20, 80) for _ in idx] for term in keywords}
             return pd.DataFrame(data, index=idx)
         return interest_over_time
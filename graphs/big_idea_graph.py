@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, TypedDict
 
 from langgraph.graph import END, START, StateGraph
@@ -175,10 +176,18 @@ def build_big_idea_graph(*, dependencies: Optional[BigIdeaDependencies] = None)
 
 
 def compile_big_idea_graph(*, dependencies: Optional[BigIdeaDependencies] = None) -> CompiledGraph:
+    if dependencies is None:
+        return _default_compiled_big_idea_graph()
     graph = build_big_idea_graph(dependencies=dependencies)
     return graph.compile()
 
 
+@lru_cache(maxsize=1)
+def _default_compiled_big_idea_graph() -> CompiledGraph:
+    # Shares one default pipeline (and its lazily loaded knowledge base) per process
+    return build_big_idea_graph().compile()
+
+
 __all__ = [
     "BigIdeaState",
     "BigIdeaDependencies",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, TypedDict
 
 from langgraph.graph import END, START, StateGraph
@@ -141,7 +142,18 @@ def compile_intake_graph(
     *,
     dependencies: Optional[IntakeDependencies] = None,
 ) -> CompiledGraph:
-    """Return a compiled version of the adaptive intake workflow."""
+    """Return a compiled version of the adaptive intake workflow.
 
+    The graph built from the default dependencies is compiled once per process
+    and shared, since compiled graphs hold no per-invocation state.
+    """
+
+    if dependencies is None:
+        return _default_compiled_intake_graph()
     graph = build_intake_graph(dependencies=dependencies)
     return graph.compile()
+
+
+@lru_cache(maxsize=1)
+def _default_compiled_intake_graph() -> CompiledGraph:
+    return build_intake_graph().compile()
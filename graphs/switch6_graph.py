@@ -5,15 +5,17 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import operator
+import statistics
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledGraph
-from langgraph.pregel.retry import RetryPolicy
 
+from Intake.core.retry import RetryPolicy, retry_async
 from Intake.frameworks.switch6_engine import Switch6FrameworkEngine
 
 
@@ -22,8 +24,21 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _merge(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Reducer for per-stage maps written by concurrently running nodes."""
+    return {**left, **right}
+
+
+def _latest(left: str, right: str) -> str:
+    return right
+
+
 class Switch6State(TypedDict, total=False):
-    """State payload that flows through the Switch 6 research graph."""
+    """State payload that flows through the Switch 6 research graph.
+
+    Segment and Wound run in the same step, so every key both of them write
+    has a reducer; each node returns only the keys it changes.
+    """
 
     # Input data from intake
     business_data: Dict[str, Any]
@@ -38,15 +53,15 @@ class Switch6State(TypedDict, total=False):
     cash_results: Optional[Dict[str, Any]]
 
     # Error tracking
-    errors: List[Dict[str, Any]]
-    retry_count: Dict[str, int]
+    errors: Annotated[List[Dict[str, Any]], operator.add]
+    retry_count: Annotated[Dict[str, int], _merge]
 
     # Circuit breaker state
-    circuit_breaker_trips: Dict[str, bool]
+    circuit_breaker_trips: Annotated[Dict[str, bool], _merge]
 
     # Execution metadata
     start_time: Optional[str]
-    current_stage: Optional[str]
+    current_stage: Annotated[str, _latest]
     execution_complete: bool
     framework_completion_score: Optional[float]
 
@@ -59,27 +74,22 @@ class Switch6State(TypedDict, total=False):
     cash_valid: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     """Circuit breaker implementation for stage protection."""
 
     failure_threshold: int = 3
     recovery_timeout: int = 300  # 5 minutes
     failure_count: int = 0
-    last_failure_time: Optional[float] = None
+    last_failure_time: Optional[float] = None  # time.monotonic() reading
     state: str = "closed"  # closed, open, half-open
 
     def can_execute(self) -> bool:
         """Check if the circuit breaker allows execution."""
-        if self.state == "closed":
-            return True
-        elif self.state == "open":
-            if time.time() - (self.last_failure_time or 0) > self.recovery_timeout:
-                self.state = "half-open"
-                return True
-            return False
-        else:  # half-open
-            return True
+        # Only an open breaker needs the clock, to see whether it may half-open.
+        if self.state == "open" and time.monotonic() - (self.last_failure_time or 0) > self.recovery_timeout:
+            self.state = "half-open"
+        return self.state != "open"
 
     def record_success(self) -> None:
         """Record a successful execution."""
@@ -89,12 +99,16 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed execution."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         if self.failure_count >= self.failure_threshold:
             self.state = "open"
 
 
-@dataclass
+class _CircuitOpen(RuntimeError):
+    """Raised when a stage's circuit breaker refuses the call."""
+
+
+@dataclass(slots=True)
 class Switch6Dependencies:
     """Container for injectable dependencies used by the Switch 6 graph."""
 
@@ -118,12 +132,51 @@ class Switch6Dependencies:
         "cash": 90,      # 1.5 minutes
     })
 
+    # Backoff between attempts of a failing stage; an open circuit breaker
+    # ends the retries straight away.
+    stage_retry_policy: RetryPolicy = field(default_factory=lambda: RetryPolicy(
+        attempts=3,
+        base_delay=0.5,
+        jitter=(0.0, 0.25),
+        retry_exceptions=(Exception,),
+        non_retryable_exceptions=(_CircuitOpen,),
+    ))
+
+    # When False, run_switch6_workflow returns summaries of the bulky Wound
+    # pain points and Offer tiers instead of the full payloads.
+    retain_intermediate: bool = True
+
 
 def _default_dependencies() -> Switch6Dependencies:
     """Create default dependencies for the Switch 6 graph."""
     return Switch6Dependencies(switch6_engine=Switch6FrameworkEngine())
 
 
+_STAGES = ("segment", "wound", "reframe", "offer", "action", "cash")
+
+# Stages whose results are passed to each engine method, in argument order.
+_STAGE_INPUTS: Dict[str, tuple] = {
+    "segment": (),
+    "wound": ("segment",),
+    "reframe": ("wound",),
+    "offer": ("reframe",),
+    "action": ("offer",),
+    "cash": ("segment", "wound", "offer", "action"),
+}
+
+# Stages that must have succeeded before a stage runs. Wound only reads the
+# intake answers, so it runs alongside Segment (its segment argument is empty);
+# Reframe joins both branches and nothing downstream runs unless both succeed.
+_STAGE_REQUIRES: Dict[str, tuple] = {
+    "segment": (),
+    "wound": (),
+    "reframe": ("segment", "wound"),
+    "offer": ("reframe",),
+    "action": ("offer",),
+    "cash": ("action",),
+}
+
+
 def build_switch6_graph(
     *,
     dependencies: Optional[Switch6Dependencies] = None,
@@ -133,460 +186,102 @@ def build_switch6_graph(
     deps = dependencies or _default_dependencies()
     graph = StateGraph(Switch6State)
 
-    def _initialize_state(state: Switch6State) -> Switch6State:
-        """Initialize default state values."""
-        current_time = datetime.now(timezone.utc).isoformat()
+    def _error(stage: str, error: Exception) -> Dict[str, Any]:
         return {
-            **state,
-            "errors": state.get("errors", []),
-            "retry_count": state.get("retry_count", {}),
-            "circuit_breaker_trips": state.get("circuit_breaker_trips", {}),
-            "start_time": state.get("start_time", current_time),
-            "current_stage": state.get("current_stage"),
-            "execution_complete": state.get("execution_complete", False),
-            "segment_valid": state.get("segment_valid", False),
-            "wound_valid": state.get("wound_valid", False),
-            "reframe_valid": state.get("reframe_valid", False),
-            "offer_valid": state.get("offer_valid", False),
-            "action_valid": state.get("action_valid", False),
-            "cash_valid": state.get("cash_valid", False),
-        }
-
-    def _add_error(state: Switch6State, stage: str, error: Exception) -> Switch6State:
-        """Add an error to the state."""
-        errors = state.get("errors", [])
-        errors.append({
             "stage": stage,
             "error": str(error),
             "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
-        return {**state, "errors": errors}
-
-    def _can_skip_stage(state: Switch6State, stage: str) -> bool:
-        """Determine if a stage can be skipped based on previous results."""
-        if stage == "wound":
-            return not state.get("segment_valid", False)
-        elif stage == "reframe":
-            return not state.get("wound_valid", False)
-        elif stage == "offer":
-            return not state.get("reframe_valid", False)
-        elif stage == "action":
-            return not state.get("offer_valid", False)
-        elif stage == "cash":
-            return not state.get("action_valid", False)
-        return False
-
-    def _execute_with_timeout(coro, timeout: int):
-        """Execute a coroutine with timeout."""
-        try:
-            return asyncio.wait_for(coro, timeout=timeout)
-        except asyncio.TimeoutError:
-            raise TimeoutError(f"Stage execution timed out after {timeout} seconds")
-
-    async def segment_node(state: Switch6State) -> Switch6State:
-        """Execute the segment stage with error handling and circuit breaker."""
-        stage = "segment"
-        state = _initialize_state(state)
-
-        # Check circuit breaker
-        cb = deps.circuit_breakers[stage]
-        if not cb.can_execute():
-            logger.warning(f"Circuit breaker is OPEN for stage: {stage}")
-            return _add_error(state, stage, Exception(f"Circuit breaker open for {stage}"))
-
-        # Check if we can skip this stage
-        if _can_skip_stage(state, stage):
-            logger.info(f"Skipping stage: {stage} due to invalid previous stage")
-            return {**state, "current_stage": stage}
-
-        try:
-            # Execute with timeout
-            business_data = state.get("business_data", {})
-            if not business_data:
-                raise ValueError("No business data provided for segment stage")
-
-            # Run the segment stage
-            segment_results = deps.switch6_engine._segment(business_data)
-
-            # Update state
-            new_state = {
-                **state,
-                "segment_results": segment_results,
-                "segment_valid": True,
-                "current_stage": stage,
-                "retry_count": {**state.get("retry_count", {}), stage: 0},
-            }
-
-            # Record success in circuit breaker
-            cb.record_success()
-            logger.info(f"Successfully completed stage: {stage}")
-            return new_state
-
-        except Exception as e:
-            logger.error(f"Error in stage {stage}: {str(e)}")
-            cb.record_failure()
-
-            # Check retry logic
-            retry_count = state.get("retry_count", {}).get(stage, 0) + 1
-            max_retries = 2
-
-            if retry_count <= max_retries:
-                logger.info(f"Retrying stage {stage}, attempt {retry_count}")
-                return {
-                    **state,
-                    "retry_count": {**state.get("retry_count", {}), stage: retry_count},
-                    "current_stage": stage,
-                }
-
-            # Max retries exceeded
-            error_state = _add_error(state, stage, e)
-            return {
-                **error_state,
-                "segment_valid": False,
-                "current_stage": stage,
-                "execution_complete": True,  # Mark as complete with errors
-            }
-
-    async def wound_node(state: Switch6State) -> Switch6State:
-        """Execute the wound stage with error handling and circuit breaker."""
-        stage = "wound"
-        state = _initialize_state(state)
-
-        # Check circuit breaker
-        cb = deps.circuit_breakers[stage]
-        if not cb.can_execute():
-            logger.warning(f"Circuit breaker is OPEN for stage: {stage}")
-            return _add_error(state, stage, Exception(f"Circuit breaker open for {stage}"))
-
-        # Check if we can skip this stage
-        if _can_skip_stage(state, stage):
-            logger.info(f"Skipping stage: {stage} due to invalid previous stage")
-            return {**state, "current_stage": stage}
-
-        try:
-            business_data = state.get("business_data", {})
-            segment_results = state.get("segment_results", {})
-
-            if not business_data:
-                raise ValueError("No business data provided for wound stage")
-
-            # Execute with timeout
-            wound_results = deps.switch6_engine._wound(business_data, segment_results)
-
-            # Update state
-            new_state = {
-                **state,
-                "wound_results": wound_results,
-                "wound_valid": True,
-                "current_stage": stage,
-                "retry_count": {**state.get("retry_count", {}), stage: 0},
-            }
-
-            # Record success in circuit breaker
-            cb.record_success()
-            logger.info(f"Successfully completed stage: {stage}")
-            return new_state
-
-        except Exception as e:
-            logger.error(f"Error in stage {stage}: {str(e)}")
-            cb.record_failure()
-
-            # Check retry logic
-            retry_count = state.get("retry_count", {}).get(stage, 0) + 1
-            max_retries = 2
-
-            if retry_count <= max_retries:
-                logger.info(f"Retrying stage {stage}, attempt {retry_count}")
-                return {
-                    **state,
-                    "retry_count": {**state.get("retry_count", {}), stage: retry_count},
-                    "current_stage": stage,
-                }
-
-            # Max retries exceeded
-            error_state = _add_error(state, stage, e)
-            return {
-                **error_state,
-                "wound_valid": False,
-                "current_stage": stage,
-            }
-
-    async def reframe_node(state: Switch6State) -> Switch6State:
-        """Execute the reframe stage with error handling and circuit breaker."""
-        stage = "reframe"
-        state = _initialize_state(state)
-
-        # Check circuit breaker
-        cb = deps.circuit_breakers[stage]
-        if not cb.can_execute():
-            logger.warning(f"Circuit breaker is OPEN for stage: {stage}")
-            return _add_error(state, stage, Exception(f"Circuit breaker open for {stage}"))
-
-        # Check if we can skip this stage
-        if _can_skip_stage(state, stage):
-            logger.info(f"Skipping stage: {stage} due to invalid previous stage")
-            return {**state, "current_stage": stage}
-
-        try:
-            business_data = state.get("business_data", {})
-            wound_results = state.get("wound_results", {})
-
-            if not business_data:
-                raise ValueError("No business data provided for reframe stage")
-
-            # Execute with timeout
-            reframe_results = deps.switch6_engine._reframe(business_data, wound_results)
-
-            # Update state
-            new_state = {
-                **state,
-                "reframe_results": reframe_results,
-                "reframe_valid": True,
-                "current_stage": stage,
-                "retry_count": {**state.get("retry_count", {}), stage: 0},
-            }
-
-            # Record success in circuit breaker
-            cb.record_success()
-            logger.info(f"Successfully completed stage: {stage}")
-            return new_state
-
-        except Exception as e:
-            logger.error(f"Error in stage {stage}: {str(e)}")
-            cb.record_failure()
-
-            # Check retry logic
-            retry_count = state.get("retry_count", {}).get(stage, 0) + 1
-            max_retries = 2
-
-            if retry_count <= max_retries:
-                logger.info(f"Retrying stage {stage}, attempt {retry_count}")
-                return {
-                    **state,
-                    "retry_count": {**state.get("retry_count", {}), stage: retry_count},
-                    "current_stage": stage,
-                }
-
-            # Max retries exceeded
-            error_state = _add_error(state, stage, e)
-            return {
-                **error_state,
-                "reframe_valid": False,
-                "current_stage": stage,
-            }
-
-    async def offer_node(state: Switch6State) -> Switch6State:
-        """Execute the offer stage with error handling and circuit breaker."""
-        stage = "offer"
-        state = _initialize_state(state)
-
-        # Check circuit breaker
-        cb = deps.circuit_breakers[stage]
-        if not cb.can_execute():
-            logger.warning(f"Circuit breaker is OPEN for stage: {stage}")
-            return _add_error(state, stage, Exception(f"Circuit breaker open for {stage}"))
-
-        # Check if we can skip this stage
-        if _can_skip_stage(state, stage):
-            logger.info(f"Skipping stage: {stage} due to invalid previous stage")
-            return {**state, "current_stage": stage}
-
-        try:
-            business_data = state.get("business_data", {})
-            reframe_results = state.get("reframe_results", {})
-
-            if not business_data:
-                raise ValueError("No business data provided for offer stage")
-
-            # Execute with timeout
-            offer_results = deps.switch6_engine._offer(business_data, reframe_results)
-
-            # Update state
-            new_state = {
-                **state,
-                "offer_results": offer_results,
-                "offer_valid": True,
-                "current_stage": stage,
-                "retry_count": {**state.get("retry_count", {}), stage: 0},
-            }
-
-            # Record success in circuit breaker
-            cb.record_success()
-            logger.info(f"Successfully completed stage: {stage}")
-            return new_state
+        }
 
-        except Exception as e:
-            logger.error(f"Error in stage {stage}: {str(e)}")
-            cb.record_failure()
+    def _stage_node(stage: str):
+        async def node(state: Switch6State) -> Dict[str, Any]:
+            """Run one engine stage off the event loop with retries and a circuit breaker."""
+            update: Dict[str, Any] = {"current_stage": stage}
 
-            # Check retry logic
-            retry_count = state.get("retry_count", {}).get(stage, 0) + 1
-            max_retries = 2
+            # Skip when an upstream stage failed or was skipped
+            if not all(state.get(f"{dep}_valid", False) for dep in _STAGE_REQUIRES[stage]):
+                logger.info(f"Skipping stage: {stage} due to invalid previous stage")
+                return {**update, f"{stage}_valid": False}
 
-            if retry_count <= max_retries:
-                logger.info(f"Retrying stage {stage}, attempt {retry_count}")
-                return {
-                    **state,
-                    "retry_count": {**state.get("retry_count", {}), stage: retry_count},
-                    "current_stage": stage,
-                }
-
-            # Max retries exceeded
-            error_state = _add_error(state, stage, e)
-            return {
-                **error_state,
-                "offer_valid": False,
-                "current_stage": stage,
-            }
-
-    async def action_node(state: Switch6State) -> Switch6State:
-        """Execute the action stage with error handling and circuit breaker."""
-        stage = "action"
-        state = _initialize_state(state)
-
-        # Check circuit breaker
-        cb = deps.circuit_breakers[stage]
-        if not cb.can_execute():
-            logger.warning(f"Circuit breaker is OPEN for stage: {stage}")
-            return _add_error(state, stage, Exception(f"Circuit breaker open for {stage}"))
-
-        # Check if we can skip this stage
-        if _can_skip_stage(state, stage):
-            logger.info(f"Skipping stage: {stage} due to invalid previous stage")
-            return {**state, "current_stage": stage}
-
-        try:
             business_data = state.get("business_data", {})
-            offer_results = state.get("offer_results", {})
-
             if not business_data:
-                raise ValueError("No business data provided for action stage")
-
-            # Execute with timeout
-            action_results = deps.switch6_engine._action(business_data, offer_results)
-
-            # Update state
-            new_state = {
-                **state,
-                "action_results": action_results,
-                "action_valid": True,
-                "current_stage": stage,
-                "retry_count": {**state.get("retry_count", {}), stage: 0},
-            }
-
-            # Record success in circuit breaker
-            cb.record_success()
-            logger.info(f"Successfully completed stage: {stage}")
-            return new_state
-
-        except Exception as e:
-            logger.error(f"Error in stage {stage}: {str(e)}")
-            cb.record_failure()
-
-            # Check retry logic
-            retry_count = state.get("retry_count", {}).get(stage, 0) + 1
-            max_retries = 2
-
-            if retry_count <= max_retries:
-                logger.info(f"Retrying stage {stage}, attempt {retry_count}")
+                error = ValueError(f"No business data provided for {stage} stage")
+                logger.error(f"Error in stage {stage}: {str(error)}")
+                return {**update, f"{stage}_valid": False, "errors": [_error(stage, error)]}
+
+            method = getattr(deps.switch6_engine, f"_{stage}")
+            inputs = [state.get(f"{dep}_results") or {} for dep in _STAGE_INPUTS[stage]]
+            cb = deps.circuit_breakers[stage]
+            attempts = 0
+
+            async def attempt() -> Dict[str, Any]:
+                nonlocal attempts
+                if not cb.can_execute():
+                    logger.warning(f"Circuit breaker is OPEN for stage: {stage}")
+                    raise _CircuitOpen(f"Circuit breaker open for {stage}")
+                if attempts:
+                    logger.info(f"Retrying stage {stage}, attempt {attempts}")
+                attempts += 1
+                try:
+                    # The engine is synchronous; a worker thread lets the
+                    # concurrent Segment and Wound stages actually overlap.
+                    # On timeout the stage is abandoned, but the thread itself
+                    # cannot be interrupted and finishes in the background.
+                    results = await asyncio.wait_for(
+                        asyncio.to_thread(method, business_data, *inputs),
+                        timeout=deps.stage_timeouts.get(stage),
+                    )
+                except asyncio.TimeoutError:
+                    e = TimeoutError(f"Stage {stage} timed out after {deps.stage_timeouts[stage]} seconds")
+                    logger.error(f"Error in stage {stage}: {str(e)}")
+                    cb.record_failure()
+                    raise e from None
+                except Exception as e:
+                    logger.error(f"Error in stage {stage}: {str(e)}")
+                    cb.record_failure()
+                    raise
+                cb.record_success()
+                return results
+
+            try:
+                results = await retry_async(attempt, policy=deps.stage_retry_policy)
+            except Exception as error:
+                if isinstance(error, _CircuitOpen):
+                    update["circuit_breaker_trips"] = {stage: True}
                 return {
-                    **state,
-                    "retry_count": {**state.get("retry_count", {}), stage: retry_count},
-                    "current_stage": stage,
+                    **update,
+                    f"{stage}_valid": False,
+                    "retry_count": {stage: max(attempts - 1, 0)},
+                    "errors": [_error(stage, error)],
                 }
 
-            # Max retries exceeded
-            error_state = _add_error(state, stage, e)
-            return {
-                **error_state,
-                "action_valid": False,
-                "current_stage": stage,
-            }
-
-    async def cash_node(state: Switch6State) -> Switch6State:
-        """Execute the cash stage with error handling and circuit breaker."""
-        stage = "cash"
-        state = _initialize_state(state)
-
-        # Check circuit breaker
-        cb = deps.circuit_breakers[stage]
-        if not cb.can_execute():
-            logger.warning(f"Circuit breaker is OPEN for stage: {stage}")
-            return _add_error(state, stage, Exception(f"Circuit breaker open for {stage}"))
-
-        # Check if we can skip this stage
-        if _can_skip_stage(state, stage):
-            logger.info(f"Skipping stage: {stage} due to invalid previous stage")
-            return {**state, "current_stage": stage}
-
-        try:
-            business_data = state.get("business_data", {})
-            segment_results = state.get("segment_results", {})
-            wound_results = state.get("wound_results", {})
-            offer_results = state.get("offer_results", {})
-            action_results = state.get("action_results", {})
-
-            if not business_data:
-                raise ValueError("No business data provided for cash stage")
-
-            # Execute with timeout
-            cash_results = deps.switch6_engine._cash(
-                business_data, segment_results, wound_results,
-                offer_results, action_results
-            )
-
-            # Update state
-            new_state = {
-                **state,
-                "cash_results": cash_results,
-                "cash_valid": True,
-                "current_stage": stage,
-                "execution_complete": True,
-                "retry_count": {**state.get("retry_count", {}), stage: 0},
-            }
-
-            # Record success in circuit breaker
-            cb.record_success()
             logger.info(f"Successfully completed stage: {stage}")
-            return new_state
-
-        except Exception as e:
-            logger.error(f"Error in stage {stage}: {str(e)}")
-            cb.record_failure()
-
-            # Check retry logic
-            retry_count = state.get("retry_count", {}).get(stage, 0) + 1
-            max_retries = 2
-
-            if retry_count <= max_retries:
-                logger.info(f"Retrying stage {stage}, attempt {retry_count}")
-                return {
-                    **state,
-                    "retry_count": {**state.get("retry_count", {}), stage: retry_count},
-                    "current_stage": stage,
-                }
-
-            # Max retries exceeded
-            error_state = _add_error(state, stage, e)
-            return {
-                **error_state,
-                "cash_valid": False,
-                "current_stage": stage,
-                "execution_complete": True,
-            }
-
-    # Add nodes to the graph with retry policies
-    graph.add_node("segment", segment_node, retry=RetryPolicy(max_attempts=3))
-    graph.add_node("wound", wound_node, retry=RetryPolicy(max_attempts=3))
-    graph.add_node("reframe", reframe_node, retry=RetryPolicy(max_attempts=3))
-    graph.add_node("offer", offer_node, retry=RetryPolicy(max_attempts=3))
-    graph.add_node("action", action_node, retry=RetryPolicy(max_attempts=3))
-    graph.add_node("cash", cash_node, retry=RetryPolicy(max_attempts=3))
-
-    # Define the workflow edges
+            update.update({
+                f"{stage}_results": results,
+                f"{stage}_valid": True,
+                "retry_count": {stage: attempts - 1},
+            })
+            if stage == "cash":
+                stage_results = [state.get(f"{name}_results") or {} for name in _STAGES[:-1]]
+                update["execution_complete"] = True
+                update["framework_completion_score"] = round(
+                    statistics.mean(
+                        result.get("research_confidence", 0.0) for result in (*stage_results, results)
+                    ),
+                    3,
+                )
+            return update
+
+        node.__name__ = f"{stage}_node"
+        return node
+
+    for stage in _STAGES:
+        graph.add_node(stage, _stage_node(stage))
+
+    # Segment and Wound fan out from the start and join at Reframe
     graph.add_edge(START, "segment")
-    graph.add_edge("segment", "wound")
-    graph.add_edge("wound", "reframe")
+    graph.add_edge(START, "wound")
+    graph.add_edge(["segment", "wound"], "reframe")
     graph.add_edge("reframe", "offer")
     graph.add_edge("offer", "action")
     graph.add_edge("action", "cash")
@@ -604,6 +299,19 @@ def compile_switch6_graph(
     return graph.compile()
 
 
+def _compact_stages(stages: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    """Summarise the Wound and Offer payloads once every stage has consumed them."""
+    wound = stages.get("wound")
+    if wound and isinstance(wound.get("pain_points"), list):
+        pain_points = wound["pain_points"]
+        stages["wound"] = {**wound, "pain_points": {"count": len(pain_points), "top": pain_points[:3]}}
+
+    offer = stages.get("offer")
+    if offer and isinstance(offer.get("tiers"), list):
+        tiers = [{"name": tier.get("name"), "price": tier.get("price")} for tier in offer["tiers"]]
+        stages["offer"] = {**offer, "tiers": tiers}
+
+
 # Convenience function for running the complete Switch 6 workflow
 async def run_switch6_workflow(
     business_data: Dict[str, Any],
@@ -617,6 +325,12 @@ async def run_switch6_workflow(
     initial_state: Switch6State = {
         "business_data": business_data,
         "user_type": user_type,
+        "start_time": datetime.now(timezone.utc).isoformat(),
+        "errors": [],
+        "retry_count": {},
+        "circuit_breaker_trips": {},
+        "execution_complete": False,
+        **{f"{stage}_valid": False for stage in _STAGES},
     }
 
     # Compile and run the graph
@@ -626,26 +340,21 @@ async def run_switch6_workflow(
         # Run the workflow
         result = await graph.ainvoke(initial_state)
 
+        stages = {stage: result.get(f"{stage}_results") for stage in _STAGES}
+        if not deps.retain_intermediate:
+            _compact_stages(stages)
+
         # Extract final results
-        final_results = {
+        return {
             "framework": "Switch 6",
             "execution_date": result.get("start_time"),
             "user_type": user_type,
-            "stages": {
-                "segment": result.get("segment_results"),
-                "wound": result.get("wound_results"),
-                "reframe": result.get("reframe_results"),
-                "offer": result.get("offer_results"),
-                "action": result.get("action_results"),
-                "cash": result.get("cash_results"),
-            },
+            "stages": stages,
             "framework_completion_score": result.get("framework_completion_score"),
             "errors": result.get("errors", []),
             "execution_complete": result.get("execution_complete", False),
         }
 
-        return final_results
-
     except Exception as e:
         logger.error(f"Workflow execution failed: {str(e)}")
         return {
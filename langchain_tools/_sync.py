@@ -0,0 +1,29 @@
+"""Run tool coroutines from LangChain's synchronous ``_run`` entry points."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def _shared_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(thread_name_prefix="langchain-tool")
+
+
+def run_coroutine_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run *coro* to completion from synchronous code.
+
+    Without a running loop the coroutine is run directly. Inside one (e.g. a
+    sync tool invoked from an async agent) it is run on its own loop in a
+    worker thread from a pool shared by all tools.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return _shared_executor().submit(asyncio.run, coro).result()
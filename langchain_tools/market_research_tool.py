@@ -1,7 +1,6 @@
 """LangChain tool wrapping the market research orchestrator."""
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -15,6 +14,8 @@ from Intake.market_research.parsers import SoupHTMLParser
 from Intake.market_research.storage import ChromaVectorIndexAdapter, InMemoryStorageAdapter
 from Intake.market_research.workflows.orchestrator import build_market_research_orchestrator
 
+from ._sync import run_coroutine_sync
+
 
 class MarketResearchInput(BaseModel):
     config_path: Path = Field(..., description="Path to market research config (YAML/JSON)")
@@ -28,19 +29,7 @@ class MarketResearchAgentTool(BaseTool):
     args_schema: type = MarketResearchInput
 
     def _run(self, config_path: Path, site_key: str = "default", seed_urls: Optional[List[str]] = None) -> Dict[str, Any]:
-        try:
-            loop = asyncio.get_running_loop()
-            # We're in an async context, create a task instead
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    self._arun(config_path=config_path, site_key=site_key, seed_urls=seed_urls)
-                )
-                return future.result()
-        except RuntimeError:
-            # No running loop, safe to call asyncio.run
-            return asyncio.run(self._arun(config_path=config_path, site_key=site_key, seed_urls=seed_urls))
+        return run_coroutine_sync(self._arun(config_path=config_path, site_key=site_key, seed_urls=seed_urls))
 
     async def _arun(
         self,
@@ -51,9 +40,11 @@ class MarketResearchAgentTool(BaseTool):
     ) -> Dict[str, Any]:
         manager = ConfigManager(config_path)
         cache = InMemoryStorageAdapter()
+        # Plain HTTP first; the headless browser is only launched for URLs
+        # the requests path returns no HTML for.
         fetcher = FallbackPageFetcher([
-            PlaywrightFetcher(),
             RequestsFetcher(cache=cache, rate_limit_per_sec=5),
+            PlaywrightFetcher(),
         ])
         parser = SoupHTMLParser()
         analyzer = EmbeddingNLPAnalyzer()
@@ -70,7 +61,10 @@ class MarketResearchAgentTool(BaseTool):
         payload = {"site_key": site_key}
         if seed_urls:
             payload["seed_urls"] = seed_urls
-        return compiled.invoke(payload)
+        try:
+            return await compiled.ainvoke(payload)
+        finally:
+            await fetcher.aclose()
 
 
 __all__ = ["MarketResearchAgentTool"]
@@ -1,7 +1,6 @@
 """LangChain tool for crawling web pages via modular fetchers."""
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -14,6 +13,8 @@ from Intake.market_research.parsers import SoupHTMLParser
 from Intake.market_research.storage import InMemoryStorageAdapter, JSONFileStorageAdapter
 from Intake.market_research.telemetry import emit_log
 
+from ._sync import run_coroutine_sync
+
 
 class WebCrawlerInput(BaseModel):
     url: HttpUrl = Field(..., description="Fully qualified URL to crawl")
@@ -56,33 +57,15 @@ class WebCrawlerTool(BaseTool):
         wait_for_selector: Optional[str] = None,
         text_limit: int = 5000,
     ) -> Dict[str, Any]:
-        try:
-            loop = asyncio.get_running_loop()
-            # We're in an async context, create a task instead
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    self._arun(
-                        url=url,
-                        site_key=site_key,
-                        timeout_ms=timeout_ms,
-                        wait_for_selector=wait_for_selector,
-                        text_limit=text_limit,
-                    )
-                )
-                return future.result()
-        except RuntimeError:
-            # No running loop, safe to call asyncio.run
-            return asyncio.run(
-                self._arun(
-                    url=url,
-                    site_key=site_key,
-                    timeout_ms=timeout_ms,
-                    wait_for_selector=wait_for_selector,
-                    text_limit=text_limit,
-                )
+        return run_coroutine_sync(
+            self._arun(
+                url=url,
+                site_key=site_key,
+                timeout_ms=timeout_ms,
+                wait_for_selector=wait_for_selector,
+                text_limit=text_limit,
             )
+        )
 
     async def _arun(
         self,
@@ -100,7 +83,10 @@ class WebCrawlerTool(BaseTool):
             emit_log("web_crawler.cache.hit", extra={"url": url, "site_key": site_key})
             return cached
         fetcher = self._build_fetcher(site_config, wait_for_selector=wait_for_selector)
-        result = await fetcher.fetch(url, context={"site": site_key, "timeout": timeout_ms / 1000})
+        try:
+            result = await fetcher.fetch(url, context={"site": site_key, "timeout": timeout_ms / 1000})
+        finally:
+            await fetcher.aclose()
         parsed = self._parser.parse(result.get("html", ""), url=url)
         text = parsed.get("text", "")
         if len(text) > text_limit:
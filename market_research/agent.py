@@ -5,10 +5,11 @@ MarketResearchAgent with dependency injection and fallback mechanisms.
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime, timezone
 
 from .interfaces import (
     PageFetcher, HTMLParser, NLPAnalyzer, StorageAdapter,
@@ -41,6 +42,12 @@ class ResearchResult:
     execution_time: float = 0.0
     fallback_used: bool = False
 
+@dataclass(slots=True)
+class _InFlightResearch:
+    """A shared research run and the number of callers still awaiting it."""
+    task: asyncio.Task
+    waiters: int = 0
+
 class MarketResearchAgent(ConfigurableMixin):
     """
     Market research agent with dependency injection and comprehensive fallback mechanisms.
@@ -76,6 +83,9 @@ class MarketResearchAgent(ConfigurableMixin):
             max_concurrency=self.get_config("max_concurrent_requests", 5)
         )
 
+        # Identical research requests already running, shared by concurrent callers
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, str, str, bool], _InFlightResearch] = {}
+
         # Fallback mechanisms
         self.fallback_data = self._load_fallback_data()
         self.mock_responses = self._load_mock_responses()
@@ -141,7 +151,35 @@ class MarketResearchAgent(ConfigurableMixin):
 
         Returns:
             ResearchResult with data, metadata, and error information
+
+        Concurrent calls on the same event loop with the same arguments share
+        one in-flight run; each caller gets its own copy of the ResearchResult.
+        The run is cancelled once every caller waiting on it has gone.
         """
+        key = (asyncio.get_running_loop(), query, research_type, use_fallback)
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = _InFlightResearch(asyncio.ensure_future(self._research_market(query, research_type, use_fallback)))
+            self._inflight[key] = entry
+            entry.task.add_done_callback(lambda _: self._forget_inflight(key, entry))
+
+        entry.waiters += 1
+        try:
+            # Shield the shared run so one caller being cancelled does not cancel it for the others.
+            result = await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if not entry.waiters and not entry.task.done():
+                # The last caller was cancelled or timed out: stop the orphaned run
+                self._forget_inflight(key, entry)
+                entry.task.cancel()
+        return copy.deepcopy(result)
+
+    def _forget_inflight(self, key: Tuple[asyncio.AbstractEventLoop, str, str, bool], entry: _InFlightResearch) -> None:
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    async def _research_market(self, query: str, research_type: str, use_fallback: bool) -> ResearchResult:
         start_time = datetime.now()
         errors = []
 
@@ -168,7 +206,7 @@ class MarketResearchAgent(ConfigurableMixin):
             )
 
         except Exception as e:
-            logger.warning(f"Primary research failed for query '{query}': {str(e)}")
+            logger.warning("Primary research failed for query '%s': %s", query, e)
             errors.append(str(e))
 
             # Try fallback if enabled
@@ -193,7 +231,7 @@ class MarketResearchAgent(ConfigurableMixin):
                     )
 
                 except Exception as fallback_error:
-                    logger.error(f"Fallback research also failed: {str(fallback_error)}")
+                    logger.error("Fallback research also failed: %s", fallback_error)
                     errors.append(f"Fallback error: {str(fallback_error)}")
 
             # Return failed result
@@ -218,11 +256,8 @@ class MarketResearchAgent(ConfigurableMixin):
 
         # Execute research pipeline with bulkhead protection
         async def _research_pipeline():
-            # Step 1: Search and fetch relevant pages
-            search_results = await self._search_and_fetch(query, research_type)
-
-            # Step 2: Parse and extract content
-            parsed_content = await self._parse_content(search_results)
+            # Steps 1-2: Fetch relevant pages, parsing each as soon as it arrives
+            parsed_content = await self._fetch_and_parse(query, research_type)
 
             # Step 3: Analyze content with NLP
             analysis_results = await self._analyze_content(parsed_content)
@@ -234,55 +269,45 @@ class MarketResearchAgent(ConfigurableMixin):
 
         return await self.bulkhead.run(_research_pipeline)
 
-    async def _search_and_fetch(self, query: str, research_type: str) -> List[Dict[str, Any]]:
-        """Search for and fetch relevant web content."""
+    async def _fetch_and_parse(self, query: str, research_type: str) -> List[Dict[str, Any]]:
+        """Fetch relevant web content and parse each page as soon as it arrives.
+
+        Parsing one page overlaps with the fetches still in flight instead of
+        waiting for the slowest download before any parsing starts.
+        """
         # This would integrate with search APIs in a real implementation
         # For now, return mock search results
         mock_urls = [
             f"https://example.com/{research_type}/{i}" for i in range(3)
         ]
 
-        fetch_tasks = []
-        for url in mock_urls:
-            async def _fetch_url(url=url):
-                return await self.page_fetcher.fetch(url)
-
-            fetch_tasks.append(_fetch_url())
-
-        results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
-
-        # Filter out exceptions and return successful fetches
-        successful_fetches = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning(f"Failed to fetch {mock_urls[i]}: {str(result)}")
-            else:
-                successful_fetches.append(result)
-
-        return successful_fetches
-
-    async def _parse_content(self, fetch_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Parse HTML content from fetch results."""
-        parsed_results = []
-
-        for fetch_result in fetch_results:
-            html_content = fetch_result.get("html", "")
-            url = fetch_result.get("url", "")
-
+        async def _fetch_then_parse(url: str) -> Optional[Dict[str, Any]]:
             try:
-                parsed = self.html_parser.parse(html_content, url=url)
-                parsed_results.append(parsed)
+                fetch_result = await self.page_fetcher.fetch(url)
             except Exception as e:
-                logger.warning(f"Failed to parse content from {url}: {str(e)}")
-                # Return basic structure if parsing fails
-                parsed_results.append({
-                    "url": url,
-                    "title": "Parse Error",
-                    "content": html_content[:500] + "..." if len(html_content) > 500 else html_content,
-                    "error": str(e)
-                })
+                logger.warning("Failed to fetch %s: %s", url, e)
+                return None
+            return self._parse_page(fetch_result)
 
-        return parsed_results
+        results = await asyncio.gather(*(_fetch_then_parse(url) for url in mock_urls))
+        return [parsed for parsed in results if parsed is not None]
+
+    def _parse_page(self, fetch_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse HTML content from a single fetch result."""
+        html_content = fetch_result.get("html", "")
+        url = fetch_result.get("url", "")
+
+        try:
+            return self.html_parser.parse(html_content, url=url)
+        except Exception as e:
+            logger.warning("Failed to parse content from %s: %s", url, e)
+            # Return basic structure if parsing fails
+            return {
+                "url": url,
+                "title": "Parse Error",
+                "content": html_content[:500] + "..." if len(html_content) > 500 else html_content,
+                "error": str(e)
+            }
 
     async def _analyze_content(self, parsed_content: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze parsed content using NLP."""
@@ -326,7 +351,7 @@ class MarketResearchAgent(ConfigurableMixin):
 
     async def _execute_fallback_research(self, query: str, research_type: str) -> Dict[str, Any]:
         """Execute fallback research using mock data."""
-        logger.info(f"Using fallback research for query: {query}, type: {research_type}")
+        logger.info("Using fallback research for query: %s, type: %s", query, research_type)
 
         # Return appropriate fallback data based on research type
         fallback_key = f"{research_type}_analysis" if research_type != "comprehensive" else "competitor_analysis"
@@ -350,14 +375,17 @@ class MarketResearchAgent(ConfigurableMixin):
             return "no_storage_adapter"
 
         try:
-            key = f"research_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(result.metadata.get('query', ''))}"
-            await self.storage_adapter.put(key, {
+            stored_at = datetime.now(timezone.utc)
+            key = f"research_{stored_at.strftime('%Y%m%d_%H%M%S')}_{hash(result.metadata.get('query', ''))}"
+            # Storage adapters are synchronous (file or network I/O); keep them
+            # off the event loop so concurrent research runs are not serialised.
+            await asyncio.to_thread(self.storage_adapter.put, key, {
                 "result": result,
-                "stored_at": datetime.now().isoformat()
+                "stored_at": stored_at.isoformat()
             })
             return key
         except Exception as e:
-            logger.error(f"Failed to store research results: {str(e)}")
+            logger.error("Failed to store research results: %s", e)
             return "storage_error"
 
     async def retrieve_research_results(self, key: str) -> Optional[ResearchResult]:
@@ -366,11 +394,11 @@ class MarketResearchAgent(ConfigurableMixin):
             return None
 
         try:
-            stored = await self.storage_adapter.get(key)
+            stored = await asyncio.to_thread(self.storage_adapter.get, key)
             if stored:
                 return stored.get("result")
         except Exception as e:
-            logger.error(f"Failed to retrieve research results: {str(e)}")
+            logger.error("Failed to retrieve research results: %s", e)
 
         return None
 
@@ -40,6 +40,28 @@ class RequestsFetcher(PageFetcher):
         self._bulkhead = bulkhead or BulkheadExecutor(max_concurrency=5)
         self._rate_limit_window = 1.0 / rate_limit_per_sec if rate_limit_per_sec else None
         self._last_request_ts = 0.0
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client per event loop keeps connections (DNS, TLS) alive
+        # across fetches on that loop. httpx clients are bound to the loop that
+        # created them, so a client is only used and closed on its own loop;
+        # callers release it with aclose() before their loop ends.
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            for other in [other for other in list(self._clients) if other.is_closed()]:
+                # Its loop is gone, so the pool can no longer be closed cleanly
+                self._clients.pop(other, None)
+            client = httpx.AsyncClient(timeout=self._timeout, follow_redirects=True)
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled client owned by the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
     async def fetch(self, url: str, *, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         cache_key = f"requests:{url}"
@@ -55,8 +77,7 @@ class RequestsFetcher(PageFetcher):
             for attempt in range(self._retries + 1):
                 headers = {"User-Agent": random.choice(USER_AGENT_POOL)}
                 try:
-                    async with httpx.AsyncClient(timeout=self._timeout, follow_redirects=True) as client:
-                        response = await client.get(url, headers=headers)
+                    response = await self._get_client().get(url, headers=headers)
                     payload = {
                         "url": url,
                         "status": response.status_code,
@@ -151,5 +172,10 @@ class FallbackPageFetcher(PageFetcher):
             raise last_error
         raise RuntimeError("No fetchers configured")
 
+    async def aclose(self) -> None:
+        for fetcher in self._fetchers:
+            if hasattr(fetcher, "aclose"):
+                await fetcher.aclose()
+
 
 __all__ = ["FallbackPageFetcher", "PlaywrightFetcher", "RequestsFetcher"]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Dict, Iterable, List, Optional, Protocol
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
 
 
 class StructuredLoggable(Protocol):
@@ -67,11 +68,32 @@ class ConfigProvider(abc.ABC):
         ...
 
 
+@dataclass(slots=True)
+class ScoringCtx:
+    """Per-statement scoring inputs shared by every module in a single pass."""
+
+    statement: str
+    lowered: str
+    words: Tuple[str, ...]
+    context: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, statement: str, context: Optional[Dict[str, Any]] = None) -> "ScoringCtx":
+        lowered = statement.lower()
+        return cls(statement=statement, lowered=lowered, words=tuple(lowered.split()), context=context or {})
+
+
 class PositionScoringModule(abc.ABC):
     """Scores messaging statements for a single framework dimension."""
 
     name: str
 
     @abc.abstractmethod
-    def score(self, statement: str, *, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        ...
+    def score(
+        self,
+        statement: str,
+        *,
+        context: Optional[Dict[str, Any]] = None,
+        ctx: Optional[ScoringCtx] = None,
+    ) -> Dict[str, Any]:
+        """Score ``statement``; callers may pass a prebuilt ``ctx`` to share work."""
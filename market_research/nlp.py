@@ -40,8 +40,9 @@ class AnalyzerResult:
 class EmbeddingNLPAnalyzer(NLPAnalyzer):
     """Embeds text, performs optional clustering, returns structured payload."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", *, batch_size: int = 64) -> None:
         self._model_name = model_name
+        self._batch_size = batch_size
         self._model = SentenceTransformer(model_name) if SentenceTransformer else None
 
     def analyze(
@@ -61,7 +62,7 @@ class EmbeddingNLPAnalyzer(NLPAnalyzer):
     def _embed(self, docs: List[str]) -> List[List[float]]:
         if self._model is None:
             return [[float(len(doc) % 10)] * 4 for doc in docs]
-        vectors = self._model.encode(docs, normalize_embeddings=True)
+        vectors = self._model.encode(docs, batch_size=self._batch_size, normalize_embeddings=True)
         return vectors.tolist()
 
     def _cluster(
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 try:  # pragma: no cover - optional vector backend
     import chromadb
@@ -36,33 +42,88 @@ class InMemoryStorageAdapter(StorageAdapter):
         return dict(payload["value"])
 
 
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json.dumps writes NaN/Infinity literals, which orjson rejects.
+            pass
+    return json.loads(raw)
+
+
 class JSONFileStorageAdapter(StorageAdapter):
     """Persists documents to disk, primarily for caching raw HTML."""
 
+    # Raw bytes of recently read files are kept in memory so repeated lookups
+    # skip the disk read. Entries are revalidated against the file's mtime and
+    # size, so writes from other processes are picked up on the next get.
+    READ_CACHE_SIZE = 256
+
     def __init__(self, root: Path) -> None:
         self._root = root
         self._root.mkdir(parents=True, exist_ok=True)
+        self._read_cache: Dict[str, Tuple[int, int, bytes]] = {}
+
+    def clear_cache(self) -> None:
+        self._read_cache.clear()
 
     def put(self, key: str, value: Dict[str, Any], *, ttl: Optional[int] = None) -> None:
         payload = {"value": value, "expiry": time.time() + ttl if ttl else None}
-        path = self._root / f"{self._safe_key(key)}.json"
-        path.write_text(json.dumps(payload), encoding="utf-8")
+        safe_key = self._safe_key(key)
+        path = self._root / f"{safe_key}.json"
+        if orjson is not None:
+            # Match json.dumps: coerce non-string keys, but reject numpy arrays
+            # and dataclasses, so what put accepts doesn't depend on orjson.
+            path.write_bytes(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS))
+        else:
+            path.write_text(json.dumps(payload), encoding="utf-8")
+        self._read_cache.pop(safe_key, None)
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
-        path = self._root / f"{self._safe_key(key)}.json"
-        if not path.exists():
+        safe_key = self._safe_key(key)
+        path = self._root / f"{safe_key}.json"
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._read_cache.pop(safe_key, None)
             return None
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        cached = self._read_cache.get(safe_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            raw = cached[2]
+        else:
+            raw = path.read_bytes()
+            self._remember(safe_key, stat.st_mtime_ns, stat.st_size, raw)
+        # Decoding per call hands every caller its own objects, so mutating a
+        # result never leaks into the cache.
+        payload = _loads(raw)
         expiry = payload.get("expiry")
         if expiry and expiry < time.time():
+            self._read_cache.pop(safe_key, None)
             path.unlink(missing_ok=True)
             return None
-        return dict(payload.get("value", {}))
+        return payload.get("value", {})
+
+    def _remember(self, safe_key: str, mtime_ns: int, size: int, raw: bytes) -> None:
+        if safe_key not in self._read_cache and len(self._read_cache) >= self.READ_CACHE_SIZE:
+            del self._read_cache[next(iter(self._read_cache))]
+        self._read_cache[safe_key] = (mtime_ns, size, raw)
 
     def _safe_key(self, key: str) -> str:
         return key.replace(":", "_").replace("/", "_")
 
 
+@lru_cache(maxsize=8)
+def _chroma_client(persist_dir: str) -> Any:
+    """Return the shared Chroma client for *persist_dir*.
+
+    Adapters pointing at the same directory reuse one client instead of
+    reopening the underlying store for every instance.
+    """
+
+    return chromadb.Client(Settings(chroma_db_impl="duckdb+parquet", persist_directory=persist_dir))
+
+
 class ChromaVectorIndexAdapter(VectorIndexAdapter):
     """ChromaDB-backed vector index with metadata-rich documents."""
 
@@ -71,9 +132,7 @@ class ChromaVectorIndexAdapter(VectorIndexAdapter):
             raise ImportError("chromadb is required for ChromaVectorIndexAdapter")
         persist_dir = persist_dir or Path("data/chroma_market")
         persist_dir.mkdir(parents=True, exist_ok=True)
-        self._client = chromadb.Client(
-            Settings(chroma_db_impl="duckdb+parquet", persist_directory=str(persist_dir))
-        )
+        self._client = _chroma_client(str(persist_dir.resolve()))
         self._collection = self._client.get_or_create_collection(collection)
 
     def upsert(self, documents: List[Dict[str, Any]]) -> None:
@@ -92,18 +151,23 @@ class ChromaVectorIndexAdapter(VectorIndexAdapter):
         top_k: int = 5,
         filters: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        raw = self._collection.query(query_texts=[query_text], n_results=top_k, where=filters)
-        results: List[Dict[str, Any]] = []
-        for idx, doc_id in enumerate(raw.get("ids", [[]])[0]):
-            results.append(
-                {
-                    "id": doc_id,
-                    "metadata": raw.get("metadatas", [[]])[0][idx],
-                    "text": raw.get("documents", [[]])[0][idx],
-                    "distance": raw.get("distances", [[]])[0][idx],
-                }
-            )
-        return results
+        raw = self._collection.query(
+            query_texts=[query_text],
+            n_results=top_k,
+            where=filters,
+            include=["metadatas", "documents", "distances"],
+        )
+        # Results are per query text; only one was sent, so take the first row of each field.
+        rows = zip(
+            raw.get("ids", [[]])[0],
+            raw.get("metadatas", [[]])[0],
+            raw.get("documents", [[]])[0],
+            raw.get("distances", [[]])[0],
+        )
+        return [
+            {"id": doc_id, "metadata": metadata, "text": text, "distance": distance}
+            for doc_id, metadata, text, distance in rows
+        ]
 
 
 __all__ = [
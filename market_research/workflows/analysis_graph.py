@@ -18,7 +18,7 @@ def build_analysis_graph(
     *,
     analyzer: NLPAnalyzer,
     index: VectorIndexAdapter,
-    batch_size: int = 8,
+    batch_size: int = 64,
 ) -> StateGraph:
     graph = StateGraph(AnalysisState)
 
@@ -46,7 +46,9 @@ def build_analysis_graph(
             emit_log("analysis.index.skipped", extra={"reason": "empty_embeddings"})
             return {"indexed": False}
         batched = _batched_vectors(docs, embeddings)
-        index.upsert(batched)
+        # One upsert per batch keeps each index write bounded for large crawls
+        for start in range(0, len(batched), batch_size):
+            index.upsert(batched[start:start + batch_size])
         return {"indexed": True}
 
     graph.add_node("prepare", prepare_node)
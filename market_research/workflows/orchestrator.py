@@ -29,9 +29,10 @@ def build_market_research_orchestrator(
     analyzer: NLPAnalyzer,
     index: VectorIndexAdapter,
     cache: Optional[StorageAdapter] = None,
+    index_batch_size: int = 64,
 ) -> StateGraph:
     discovery_graph = build_discovery_graph(fetcher=fetcher, parser=parser, cache=cache)
-    analysis_graph = build_analysis_graph(analyzer=analyzer, index=index)
+    analysis_graph = build_analysis_graph(analyzer=analyzer, index=index, batch_size=index_batch_size)
     compiled_discovery = discovery_graph.compile()
     compiled_analysis = analysis_graph.compile()
 
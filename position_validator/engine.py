@@ -7,6 +7,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Protocol
 from datetime import datetime
 from enum import Enum
@@ -14,6 +15,9 @@ from enum import Enum
 from ..core.retry import RetryPolicy, with_retry
 from ..core.mixins import ConfigurableMixin
 from ..market_research.resilience import CircuitBreaker, BulkheadExecutor
+# Taken from .modules so the base class is the very object the scoring
+# modules subclass, whichever path market_research was imported under.
+from .modules import PositionScoringModule as ScoringModuleBase, ScoringCtx
 
 logger = logging.getLogger(__name__)
 
@@ -413,6 +417,16 @@ class HybridPositionModule:
     def is_available(self) -> bool:
         return len([m for m in self.modules if m.is_available()]) > 0
 
+@lru_cache(maxsize=1)
+def _default_framework_modules() -> tuple:
+    """Build the stateless framework modules once per process."""
+    return (
+        ADAPTPositionModule(),
+        Switch6PositionModule(),
+        OgilvyPositionModule(),
+        GodinPositionModule(),
+    )
+
 class EnhancedPositionValidatorEngine(ConfigurableMixin):
     """Enhanced position validator with pluggable modules and dual-mode operation."""
 
@@ -427,18 +441,8 @@ class EnhancedPositionValidatorEngine(ConfigurableMixin):
 
         # Initialize default modules if none provided
         if modules is None:
-            modules = [
-                ADAPTPositionModule(),
-                Switch6PositionModule(),
-                OgilvyPositionModule(),
-                GodinPositionModule(),
-                HybridPositionModule([
-                    ADAPTPositionModule(),
-                    Switch6PositionModule(),
-                    OgilvyPositionModule(),
-                    GodinPositionModule()
-                ])
-            ]
+            framework_modules = list(_default_framework_modules())
+            modules = framework_modules + [HybridPositionModule(framework_modules)]
 
         self._modules = {module.name: module for module in modules}
         self.default_mode = default_mode
@@ -508,6 +512,8 @@ class EnhancedPositionValidatorEngine(ConfigurableMixin):
             results = []
             total_weight = 0.0
             weighted_score = 0.0
+            # Lowered text and word split are computed once and shared by all modules
+            scoring_ctx = ScoringCtx.build(statement, context)
 
             # Score with each enabled module
             for name, module in self._modules.items():
@@ -521,6 +527,8 @@ class EnhancedPositionValidatorEngine(ConfigurableMixin):
                 # Execute module scoring with timeout protection
                 try:
                     async def _score_with_module():
+                        if isinstance(module, ScoringModuleBase):
+                            return module.score(statement, context=context, ctx=scoring_ctx)
                         return module.score(statement, context=context)
 
                     # Apply timeout if configured
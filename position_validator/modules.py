@@ -5,12 +5,13 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from market_research.interfaces import PositionScoringModule
+from market_research.interfaces import PositionScoringModule, ScoringCtx
 
-try:  # pragma: no cover - optional dependency
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore
+_PAIN_RE = re.compile(r"\b(problems?|challenges?|pain)\b", re.IGNORECASE)
+_FRAMEWORK_RE = re.compile(r"\bframework|diagnostic\b", re.IGNORECASE)
+_RESULTS_RE = re.compile(r"\b(results?|roi|conversion)\b", re.IGNORECASE)
+_PROOF_RE = re.compile(r"\bproof|case study\b", re.IGNORECASE)
+_REMARKABLE_RE = re.compile(r"remarkable|tribe|story|status", re.IGNORECASE)
 
 
 @dataclass
@@ -32,9 +33,17 @@ class HeuristicScoringModule(PositionScoringModule):
     def __init__(self, *, weight: float = 1.0) -> None:
         self._weight = weight
 
-    def score(self, statement: str, *, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        score = self._score_statement(statement, context or {})
-        feedback = [fb.to_dict() for fb in self._feedback(statement, context or {})]
+    def score(
+        self,
+        statement: str,
+        *,
+        context: Optional[Dict[str, Any]] = None,
+        ctx: Optional[ScoringCtx] = None,
+    ) -> Dict[str, Any]:
+        if ctx is None:
+            ctx = ScoringCtx.build(statement, context)
+        score = self._score_statement(ctx)
+        feedback = [fb.to_dict() for fb in self._feedback(ctx)]
         return {
             "module": self.name,
             "score": score,
@@ -43,14 +52,14 @@ class HeuristicScoringModule(PositionScoringModule):
             "mode": "heuristic",
         }
 
-    def _score_statement(self, statement: str, context: Dict[str, Any]) -> float:
-        return min(1.0, len(statement.strip()) / 120)
+    def _score_statement(self, ctx: ScoringCtx) -> float:
+        return min(1.0, len(ctx.statement.strip()) / 120)
 
-    def _feedback(self, statement: str, context: Dict[str, Any]) -> List[Feedback]:
+    def _feedback(self, ctx: ScoringCtx) -> List[Feedback]:
         parts: List[Feedback] = []
-        if len(statement.split()) < 6:
+        if len(ctx.words) < 6:
             parts.append(Feedback("Statement reads too short to convey value.", "warning"))
-        if "we" not in statement.lower():
+        if "we" not in ctx.lowered:
             parts.append(Feedback("Consider clarifying the actor/beneficiary.", "info"))
         return parts
 
@@ -58,17 +67,17 @@ class HeuristicScoringModule(PositionScoringModule):
 class AdaptScoringModule(HeuristicScoringModule):
     name = "adapt"
 
-    def _score_statement(self, statement: str, context: Dict[str, Any]) -> float:
-        score = super()._score_statement(statement, context)
-        if re.search(r"\b(problems?|challenges?|pain)\b", statement, re.IGNORECASE):
+    def _score_statement(self, ctx: ScoringCtx) -> float:
+        score = super()._score_statement(ctx)
+        if _PAIN_RE.search(ctx.statement):
             score += 0.2
-        if re.search(r"\bframework|diagnostic\b", statement, re.IGNORECASE):
+        if _FRAMEWORK_RE.search(ctx.statement):
             score += 0.1
         return min(score, 1.0)
 
-    def _feedback(self, statement: str, context: Dict[str, Any]) -> List[Feedback]:
-        items = super()._feedback(statement, context)
-        if "problem" not in statement.lower():
+    def _feedback(self, ctx: ScoringCtx) -> List[Feedback]:
+        items = super()._feedback(ctx)
+        if "problem" not in ctx.lowered:
             items.append(Feedback("Highlight the core audience pain more explicitly.", "warning"))
         return items
 
@@ -76,18 +85,18 @@ class AdaptScoringModule(HeuristicScoringModule):
 class Switch6ScoringModule(HeuristicScoringModule):
     name = "switch6"
 
-    def _score_statement(self, statement: str, context: Dict[str, Any]) -> float:
-        score = super()._score_statement(statement, context)
+    def _score_statement(self, ctx: ScoringCtx) -> float:
+        score = super()._score_statement(ctx)
         for keyword in ("segment", "wound", "reframe", "offer", "action", "cash"):
-            if keyword in statement.lower():
+            if keyword in ctx.lowered:
                 score += 0.05
         return min(score, 1.0)
 
-    def _feedback(self, statement: str, context: Dict[str, Any]) -> List[Feedback]:
-        items = super()._feedback(statement, context)
-        if "offer" not in statement.lower():
+    def _feedback(self, ctx: ScoringCtx) -> List[Feedback]:
+        items = super()._feedback(ctx)
+        if "offer" not in ctx.lowered:
             items.append(Feedback("Call out the offer or proof to anchor value.", "info"))
-        if "action" not in statement.lower():
+        if "action" not in ctx.lowered:
             items.append(Feedback("Suggest next step to reinforce CTA strength.", "info"))
         return items
 
@@ -95,17 +104,17 @@ class Switch6ScoringModule(HeuristicScoringModule):
 class OgilvyScoringModule(HeuristicScoringModule):
     name = "ogilvy"
 
-    def _score_statement(self, statement: str, context: Dict[str, Any]) -> float:
-        score = super()._score_statement(statement, context)
-        if re.search(r"\b(results?|roi|conversion)\b", statement, re.IGNORECASE):
+    def _score_statement(self, ctx: ScoringCtx) -> float:
+        score = super()._score_statement(ctx)
+        if _RESULTS_RE.search(ctx.statement):
             score += 0.2
-        if re.search(r"\bproof|case study\b", statement, re.IGNORECASE):
+        if _PROOF_RE.search(ctx.statement):
             score += 0.1
         return min(score, 1.0)
 
-    def _feedback(self, statement: str, context: Dict[str, Any]) -> List[Feedback]:
-        items = super()._feedback(statement, context)
-        if "because" not in statement.lower():
+    def _feedback(self, ctx: ScoringCtx) -> List[Feedback]:
+        items = super()._feedback(ctx)
+        if "because" not in ctx.lowered:
             items.append(Feedback("Add 'because' clause to link proof with promise.", "warning"))
         return items
 
@@ -113,15 +122,15 @@ class OgilvyScoringModule(HeuristicScoringModule):
 class GodinScoringModule(HeuristicScoringModule):
     name = "godin"
 
-    def _score_statement(self, statement: str, context: Dict[str, Any]) -> float:
-        score = super()._score_statement(statement, context)
-        if re.search(r"remarkable|tribe|story|status", statement, re.IGNORECASE):
+    def _score_statement(self, ctx: ScoringCtx) -> float:
+        score = super()._score_statement(ctx)
+        if _REMARKABLE_RE.search(ctx.statement):
             score += 0.25
         return min(score, 1.0)
 
-    def _feedback(self, statement: str, context: Dict[str, Any]) -> List[Feedback]:
-        items = super()._feedback(statement, context)
-        if "story" not in statement.lower():
+    def _feedback(self, ctx: ScoringCtx) -> List[Feedback]:
+        items = super()._feedback(ctx)
+        if "story" not in ctx.lowered:
             items.append(Feedback("Consider emphasising the story behind the shift.", "info"))
         return items
 
@@ -129,14 +138,25 @@ class GodinScoringModule(HeuristicScoringModule):
 class LLMFeedbackMixin:
     """Adds agentic LLM clarification when credentials exist."""
 
-    def _maybe_llm_feedback(self, statement: str, context: Dict[str, Any]) -> List[Feedback]:
+    _client: Optional[Any] = None
+
+    def _maybe_llm_feedback(self, ctx: ScoringCtx) -> List[Feedback]:
         api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key or OpenAI is None:  # pragma: no cover
+        if not api_key:  # pragma: no cover
+            return []
+        try:  # pragma: no cover - optional dependency, imported on first use
+            from openai import OpenAI
+        except ImportError:  # pragma: no cover
             return []
-        client = OpenAI(api_key=api_key)
+        cls = type(self)
+        if cls._client is None:
+            # One client per class keeps the underlying connection pool warm
+            # across calls; the SDK applies its own retry/backoff.
+            cls._client = OpenAI(api_key=api_key, timeout=10.0, max_retries=2)
+        client = cls._client
         completion = client.responses.create(
             model="gpt-4o-mini",
-            input=f"Provide two short critiques for positioning statement: {statement}",
+            input=f"Provide two short critiques for positioning statement: {ctx.statement}",
             temperature=0.3,
         )
         text = " ".join(choice.output_text for choice in completion.output)
@@ -147,9 +167,9 @@ class LLMFeedbackMixin:
 class HybridScoringModule(LLMFeedbackMixin, HeuristicScoringModule):
     name = "hybrid"
 
-    def _feedback(self, statement: str, context: Dict[str, Any]) -> List[Feedback]:
-        base = super()._feedback(statement, context)
-        return base + self._maybe_llm_feedback(statement, context)
+    def _feedback(self, ctx: ScoringCtx) -> List[Feedback]:
+        base = super()._feedback(ctx)
+        return base + self._maybe_llm_feedback(ctx)
 
 
 __all__ = [
@@ -158,5 +178,6 @@ __all__ = [
     "HeuristicScoringModule",
     "HybridScoringModule",
     "OgilvyScoringModule",
+    "ScoringCtx",
     "Switch6ScoringModule",
 ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
+from operator import itemgetter
 import random
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional
@@ -10,14 +11,10 @@ from typing import Any, Dict, Iterable, List, Optional
 from classifiers.framework_selector import FrameworkSelector
 from research.position_validator import PositionValidator
 
-try:  # pragma: no cover - optional dependency
-    from langchain.llms import VertexAI
-except Exception:  # pragma: no cover
-    VertexAI = None  # type: ignore
-
-
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 @dataclass
 class GenerationResult:
@@ -77,15 +74,29 @@ class PositionGeneratorAgent:
         validator: Optional[PositionValidator] = None,
         selector: Optional[FrameworkSelector] = None,
     ) -> None:
-        if llm is not None:
-            self.llm = llm
-        elif VertexAI is not None:  # pragma: no cover - depends on environment
-            self.llm = VertexAI()
-        else:
-            self.llm = _FallbackLLM()
+        self._llm = llm
         self.validator = validator or PositionValidator()
         self.selector = selector or FrameworkSelector()
 
+    @property
+    def llm(self) -> Any:
+        """Return the generation LLM, resolving the default on first use."""
+        if self._llm is None:
+            self._llm = self._default_llm()
+        return self._llm
+
+    @llm.setter
+    def llm(self, value: Any) -> None:
+        self._llm = value
+
+    @staticmethod
+    def _default_llm() -> Any:
+        try:  # pragma: no cover - optional dependency, imported on first use
+            from langchain.llms import VertexAI
+        except Exception:  # pragma: no cover
+            return _FallbackLLM()
+        return VertexAI()  # pragma: no cover - depends on environment
+
     # ---------------------------------------------------------------------
     # LLM generation
     # ---------------------------------------------------------------------
@@ -146,7 +157,7 @@ class PositionGeneratorAgent:
                 rationale=rationale,
             )
             ranked.append(entry.to_dict())
-        ranked.sort(key=lambda item: item["ranking_score"], reverse=True)
+        ranked.sort(key=itemgetter("ranking_score"), reverse=True)
         return ranked
 
     # ---------------------------------------------------------------------
@@ -156,7 +167,7 @@ class PositionGeneratorAgent:
         alternatives = self.generate_alternatives(context_data, count)
         ranked = self.validate_and_rank(alternatives, context_data)
         return {
-            "execution_date": datetime.now(timezone.utc).isoformat(),
+            "execution_date": datetime.now(_UTC).isoformat(timespec="seconds"),
             "base_position": context_data.get("position_statement"),
             "alternative_count": len(ranked),
             "alternatives": ranked,
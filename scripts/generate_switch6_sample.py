@@ -4,6 +4,11 @@ import json
 import sys
 from pathlib import Path
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.append(str(REPO_ROOT))
@@ -37,7 +42,10 @@ def main() -> None:
     output_dir = Path("data/examples")
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / "switch6_sample.json"
-    output_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        output_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
     print(f"Sample Switch 6 output written to {output_path}")
 
 
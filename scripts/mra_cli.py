@@ -11,12 +11,18 @@ This CLI provides a command-line interface for:
 
 import argparse
 import asyncio
+import copy
+import inspect
 import json
 import logging
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # Add the project root to Python path for imports
 project_root = Path(__file__).parent.parent.parent
@@ -28,6 +34,16 @@ from Intake.market_research.parsers import BeautifulSoupParser
 from Intake.market_research.nlp import SimpleNLPAnalyzer
 from Intake.market_research.storage import JSONStorageAdapter
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional accelerator
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,20 +51,106 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# JSON paths (ijson prefix notation) of the fields shown by list-results
+_SUMMARY_FIELDS = {
+    "result.metadata.query": "query",
+    "result.metadata.research_type": "research_type",
+    "result.metadata.method": "method",
+    "result.success": "success",
+    "result.execution_time": "execution_time",
+    "saved_at": "saved_at",
+}
+_SUMMARY_DEFAULTS = {
+    "query": "N/A",
+    "research_type": "N/A",
+    "method": "N/A",
+    "success": False,
+    "execution_time": 0,
+    "saved_at": "N/A",
+}
+
+
+def _stream_summary(handle) -> Dict[str, Any]:
+    """Collect the listing fields from an event stream, stopping once all are seen."""
+    summary = dict(_SUMMARY_DEFAULTS)
+    remaining = set(_SUMMARY_FIELDS)
+    for prefix, event, value in ijson.parse(handle):
+        if prefix in remaining and event not in ("start_map", "start_array", "map_key"):
+            summary[_SUMMARY_FIELDS[prefix]] = float(value) if event == "number" else value
+            remaining.discard(prefix)
+            if not remaining:
+                break
+    return summary
+
+
+def _json_preview(data: Any, limit: int = 500) -> str:
+    """Return the first ``limit`` characters of the indented JSON for ``data``.
+
+    Encoding stops as soon as enough text has been produced, so the cost is
+    bounded by ``limit`` rather than by the size of ``data``.
+    """
+    parts = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+def _read_summary(result_file: Path) -> Dict[str, Any]:
+    """Read only the listing fields from a saved research result file."""
+    if ijson is not None:
+        with open(result_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuses empty files; let the parser report the bad document
+                return _stream_summary(f)
+            # Stream straight from the page cache instead of through a buffered reader
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return _stream_summary(view)
+
+    with open(result_file, 'r') as f:
+        data = json.load(f)
+
+    result = data.get("result", {})
+    metadata = result.get("metadata", {})
+    return {
+        "query": metadata.get("query", _SUMMARY_DEFAULTS["query"]),
+        "research_type": metadata.get("research_type", _SUMMARY_DEFAULTS["research_type"]),
+        "method": metadata.get("method", _SUMMARY_DEFAULTS["method"]),
+        "success": result.get("success", _SUMMARY_DEFAULTS["success"]),
+        "execution_time": result.get("execution_time", _SUMMARY_DEFAULTS["execution_time"]),
+        "saved_at": data.get("saved_at", _SUMMARY_DEFAULTS["saved_at"]),
+    }
+
 class MarketResearchCLI:
     """CLI for market research operations."""
 
+    # Parsed configs keyed by (path, mtime_ns, size) so edits invalidate the entry
+    _CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
     def __init__(self):
         self.config_file = Path("market_research_config.json")
         self.results_dir = Path("research_results")
         self.results_dir.mkdir(exist_ok=True)
+        self._dependency_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        if self.config_file.exists():
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
+            return {}
+
+        key = (str(self.config_file.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = self._CONFIG_CACHE.get(key)
+        if cached is None:
             with open(self.config_file, 'r') as f:
-                return json.load(f)
-        return {}
+                cached = json.load(f)
+            self._CONFIG_CACHE[key] = cached
+        # Callers mutate the returned config (configure_agent), keep the cache pristine
+        return copy.deepcopy(cached)
 
     def save_config(self, config: Dict[str, Any]):
         """Save configuration to file."""
@@ -65,17 +167,26 @@ class MarketResearchCLI:
         dependencies = {}
 
         if config.get("use_real_dependencies", False):
-            # Use real implementations
-            dependencies.update({
-                "page_fetcher": RequestsFetcher(
-                    timeout=agent_config.get("request_timeout", 30.0),
-                    circuit_breaker=None,  # Agent will create its own
-                    bulkhead=None
-                ),
-                "html_parser": BeautifulSoupParser(),
-                "nlp_analyzer": SimpleNLPAnalyzer(),
-                "storage_adapter": JSONStorageAdapter(base_path=str(self.results_dir))
-            })
+            # Use real implementations; they hold no per-research state, so
+            # they are built once per distinct setting and shared by the
+            # thin agent wrappers created for each subcommand.
+            cache_key = (
+                json.dumps(agent_config, sort_keys=True, default=str),
+                str(self.results_dir),
+            )
+            dependencies = self._dependency_cache.get(cache_key)
+            if dependencies is None:
+                dependencies = {
+                    "page_fetcher": RequestsFetcher(
+                        timeout=agent_config.get("request_timeout", 30.0),
+                        circuit_breaker=None,  # Agent will create its own
+                        bulkhead=None
+                    ),
+                    "html_parser": BeautifulSoupParser(),
+                    "nlp_analyzer": SimpleNLPAnalyzer(),
+                    "storage_adapter": JSONStorageAdapter(base_path=str(self.results_dir))
+                }
+                self._dependency_cache[cache_key] = dependencies
         else:
             # Use mock/None dependencies for testing
             logger.info("Using mock dependencies - agent will rely on fallback mechanisms")
@@ -142,12 +253,26 @@ class MarketResearchCLI:
                 filename = f"research_{args.research_type}_{timestamp}.json"
                 filepath = self.results_dir / filename
 
-                with open(filepath, 'w') as f:
-                    json.dump({
-                        "result": result,
-                        "saved_at": datetime.now().isoformat(),
-                        "cli_args": vars(args)
-                    }, f, indent=2, default=str)
+                # Convert the result dataclass up front so the encoder sees
+                # plain containers; default=str only guards stray values.
+                # The listing fields are written before the bulky research
+                # data so list-results can stop reading once it has them.
+                record = asdict(result)
+                record["data"] = record.pop("data")
+                payload = {
+                    "saved_at": datetime.now().isoformat(),
+                    "cli_args": vars(args),
+                    "result": record,
+                }
+                if orjson is not None:
+                    filepath.write_bytes(orjson.dumps(
+                        payload,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                        default=str,
+                    ))
+                else:
+                    with open(filepath, 'w') as f:
+                        json.dump(payload, f, indent=2, default=str)
 
                 print(f"\nResults saved to: {filepath}")
 
@@ -157,7 +282,7 @@ class MarketResearchCLI:
             logger.error(f"Research failed: {str(e)}")
             return 1
 
-    async def configure_agent(self, args) -> int:
+    def configure_agent(self, args) -> int:
         """Configure market research agent."""
         try:
             # Load existing config or create new one
@@ -204,7 +329,7 @@ class MarketResearchCLI:
             logger.error(f"Configuration failed: {str(e)}")
             return 1
 
-    async def show_capabilities(self, args) -> int:
+    def show_capabilities(self, args) -> int:
         """Show agent capabilities."""
         try:
             config = self.load_config()
@@ -246,7 +371,7 @@ class MarketResearchCLI:
             print(f"Method: {result.metadata.get('method', 'N/A')}")
 
             if result.data:
-                print(f"Data Preview: {json.dumps(result.data, indent=2)[:500]}...")
+                print(f"Data Preview: {_json_preview(result.data)}...")
 
             return 0 if result.success and result.fallback_used else 1
 
@@ -254,11 +379,15 @@ class MarketResearchCLI:
             logger.error(f"Fallback test failed: {str(e)}")
             return 1
 
-    async def list_results(self, args) -> int:
+    def list_results(self, args) -> int:
         """List stored research results."""
         try:
-            results = list(self.results_dir.glob("research_*.json"))
-            results.sort(reverse=True)  # Most recent first
+            with os.scandir(self.results_dir) as it:
+                results = [
+                    entry for entry in it
+                    if entry.name.startswith("research_") and entry.name.endswith(".json")
+                ]
+            results.sort(key=lambda entry: entry.name, reverse=True)  # Most recent first
 
             if not results:
                 print("No research results found.")
@@ -267,21 +396,22 @@ class MarketResearchCLI:
             print(f"Found {len(results)} research results:")
             print("-" * 80)
 
-            for result_file in results[:args.limit]:
-                try:
-                    with open(result_file, 'r') as f:
-                        data = json.load(f)
+            # Reading and parsing the files is independent per file, so overlap it
+            selected = [Path(entry.path) for entry in results[:args.limit]]
+            with ThreadPoolExecutor(max_workers=max(1, min(32, len(selected)))) as executor:
+                futures = [executor.submit(_read_summary, result_file) for result_file in selected]
 
-                    result = data.get("result", {})
-                    metadata = result.get("metadata", {})
+            for result_file, future in zip(selected, futures):
+                try:
+                    summary = future.result()
 
                     print(f"File: {result_file.name}")
-                    print(f"  Query: {metadata.get('query', 'N/A')}")
-                    print(f"  Type: {metadata.get('research_type', 'N/A')}")
-                    print(f"  Method: {metadata.get('method', 'N/A')}")
-                    print(f"  Success: {result.get('success', False)}")
-                    print(f"  Execution Time: {result.get('execution_time', 0):.2f}s")
-                    print(f"  Saved: {data.get('saved_at', 'N/A')}")
+                    print(f"  Query: {summary['query']}")
+                    print(f"  Type: {summary['research_type']}")
+                    print(f"  Method: {summary['method']}")
+                    print(f"  Success: {summary['success']}")
+                    print(f"  Execution Time: {summary['execution_time']:.2f}s")
+                    print(f"  Saved: {summary['saved_at']}")
                     print()
 
                 except Exception as e:
@@ -293,21 +423,31 @@ class MarketResearchCLI:
             logger.error(f"Failed to list results: {str(e)}")
             return 1
 
-    async def run_async_command(self, args) -> int:
-        """Run async CLI commands."""
-        if args.command == "research":
-            return await self.run_research(args)
-        elif args.command == "configure":
-            return await self.configure_agent(args)
-        elif args.command == "capabilities":
-            return await self.show_capabilities(args)
-        elif args.command == "test-fallback":
-            return await self.test_fallback(args)
-        elif args.command == "list-results":
-            return await self.list_results(args)
-        else:
+    def run_command(self, args) -> int:
+        """Run a CLI command, starting an event loop only for async handlers."""
+        handlers = {
+            "research": self.run_research,
+            "configure": self.configure_agent,
+            "capabilities": self.show_capabilities,
+            "test-fallback": self.test_fallback,
+            "list-results": self.list_results,
+        }
+        handler = handlers.get(args.command)
+        if handler is None:
             print(f"Unknown command: {args.command}")
             return 1
+        if inspect.iscoroutinefunction(handler):
+            return asyncio.run(self._run_async(handler, args))
+        return handler(args)
+
+    async def _run_async(self, handler, args) -> int:
+        try:
+            return await handler(args)
+        finally:
+            # The shared fetchers pool HTTP connections on this loop; release
+            # them before asyncio.run closes it.
+            for dependencies in self._dependency_cache.values():
+                await dependencies["page_fetcher"].aclose()
 
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser for CLI."""
@@ -370,7 +510,7 @@ Examples:
 
     return parser
 
-async def main():
+def main():
     """Main CLI entry point."""
     parser = create_parser()
     args = parser.parse_args()
@@ -380,10 +520,10 @@ async def main():
         return 1
 
     cli = MarketResearchCLI()
-    exit_code = await cli.run_async_command(args)
+    exit_code = cli.run_command(args)
 
     return exit_code
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = main()
     sys.exit(exit_code)
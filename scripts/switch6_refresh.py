@@ -15,7 +15,12 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List
+from typing import List, Sequence
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
@@ -23,12 +28,18 @@ if str(REPO_ROOT) not in sys.path:
 
 from frameworks.switch6_engine import Switch6FrameworkEngine  # noqa: E402
 
+_EMPTY_DICT: dict = {}
+_DEFAULT_KEYWORDS = ("business",)
+
 
 def _load_config(path: Path) -> List[dict]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    if orjson is not None:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
     if isinstance(data, dict):
         return [data]
     if isinstance(data, list):
@@ -36,36 +47,48 @@ def _load_config(path: Path) -> List[dict]:
     raise ValueError("Config must be a dict or list of dicts")
 
 
-def _write_result(result: dict, output_dir: Path, tag: str | None) -> Path:
+def _write_result(result: dict, output_dir: Path, suffix: str) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
-    business = result.get("stages", {}).get("segment", {}).get("seed_keywords", ["business"])
+    stages = result.get("stages") or _EMPTY_DICT
+    business = (stages.get("segment") or _EMPTY_DICT).get("seed_keywords") or _DEFAULT_KEYWORDS
     slug = "-".join(keyword.replace(" ", "_") for keyword in business[:2]) or "business"
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    if tag:
-        filename = f"switch6_{slug}_{tag}_{timestamp}.json"
-    else:
-        filename = f"switch6_{slug}_{timestamp}.json"
+    filename = f"switch6_{slug}_{suffix}.json"
     output_path = output_dir / filename
-    output_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        output_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
     return output_path
 
 
 def _summarise(result: dict) -> str:
     stages = result.get("stages", {})
-    summaries = []
-    for name, payload in stages.items():
-        confidence = payload.get("research_confidence", 0)
-        summaries.append(f"{name}: conf={confidence}")
-    return ", ".join(summaries)
+    return ", ".join(
+        "%s: conf=%s" % (name, payload.get("research_confidence", 0)) for name, payload in stages.items()
+    )
 
 
-def _run_once(engine: Switch6FrameworkEngine, profiles: Iterable[dict], output_dir: Path, dry_run: bool, tag: str | None) -> None:
-    for profile in profiles:
+def _filename_suffix(tag: str | None) -> str:
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    return f"{tag}_{timestamp}" if tag else timestamp
+
+
+def _run_once(
+    engine: Switch6FrameworkEngine,
+    profiles: Sequence[dict],
+    output_dir: Path,
+    dry_run: bool,
+    tag: str | None,
+) -> None:
+    # One timestamp per refresh iteration; the profile index keeps profiles
+    # with the same keyword slug from overwriting each other
+    suffix = _filename_suffix(tag)
+    for index, profile in enumerate(profiles):
         result = engine.execute_full_framework(profile)
         if dry_run:
             print(f"[DRY RUN] {profile.get('business_industry', 'business')} -> { _summarise(result)}")
             continue
-        output_path = _write_result(result, output_dir, tag)
+        output_path = _write_result(result, output_dir, f"{suffix}_{index}" if len(profiles) > 1 else suffix)
         print(f"Saved Switch6 research -> {output_path} :: {_summarise(result)}")
 
 
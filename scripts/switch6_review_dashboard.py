@@ -29,9 +29,10 @@ def _display_segment(segment_csv: Path, limit: int) -> None:
     if not segment_csv.exists():
         print(f"Segment CSV not found at {segment_csv}")
         return
-    df = pd.read_csv(segment_csv)
-    _print_header(f"Segment Preview ({min(limit, len(df))} rows)")
-    print(df.head(limit).to_string(index=False))
+    # Only the previewed rows are parsed; the rest of the file is never read
+    df = pd.read_csv(segment_csv, nrows=limit)
+    _print_header(f"Segment Preview ({len(df)} rows)")
+    print(df.to_string(index=False))
 
 
 def _collect_dashboards(paths: Iterable[Path]) -> list[Path]:
@@ -1,20 +1,29 @@
-import langgraph
-import langchain
-import langchain_google_vertexai
-import langchain_anthropic
-import sentence_transformers
-import chromadb
-import faiss
-import networkx as nx
-import matplotlib.pyplot as plt
-import plotly.graph_objs as go
-import dash
+import importlib.util
 
 from classifiers import AdaptiveQuestionnaire, BusinessTypeClassifier, FrameworkSelector
 from graphs.intake_graph import compile_intake_graph
 
+# Dependencies that only need to be installed; find_spec locates them without
+# running their (often expensive) module initialisation.
+REQUIRED_MODULES = (
+    "langgraph",
+    "langchain",
+    "langchain_google_vertexai",
+    "langchain_anthropic",
+    "sentence_transformers",
+    "chromadb",
+    "faiss",
+    "networkx",
+    "matplotlib",
+    "plotly",
+    "dash",
+)
+
 
 def main() -> None:
+    for module_name in REQUIRED_MODULES:
+        assert importlib.util.find_spec(module_name) is not None, f"{module_name} missing"
+
     classifier = BusinessTypeClassifier()
     questionnaire = AdaptiveQuestionnaire()
     selector = FrameworkSelector()
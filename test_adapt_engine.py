@@ -1,41 +1,26 @@
 ﻿import sys
 import os
 import json
+import logging
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from frameworks.adapt_engine import ADAPTFrameworkEngine
 
+logger = logging.getLogger(__name__)
 
-def test_adapt_framework_complete():
-    """Test complete ADAPT framework execution"""
+
+def _dump_results(results):
+    """Print a readable summary of an ADAPT run for manual inspection."""
 
     print("[TEST] ADAPT FRAMEWORK ENGINE")
     print("-" * 50)
-
-    # Initialize engine
-    adapt_engine = ADAPTFrameworkEngine()
-
-    # Sample questionnaire data (business owner)
-    sample_data = {
-        "user_type": "business_owner",
-        "location": "Chennai, India",
-        "primary_goal": "Generate more leads",
-        "what_you_do": "We help small restaurants increase customer footfall through social media marketing",
-        "why_story": "Started this after seeing too many great local restaurants struggle with empty tables",
-        "target_customer": "Local restaurant owners aged 30-50 who are tech-savvy but lack marketing expertise",
-        "main_challenge": "Converting social media engagement into actual customer visits",
-        "marketing_budget": "$2K-$5K",
-        "current_marketing": ["Social media posts", "Word of mouth"],
-        "business_industry": "Digital Marketing for Restaurants",
-        "annual_revenue": "$200K-$500K"
-    }
-
-    # Execute full ADAPT framework
-    print("[RUN] Executing ADAPT Framework...")
-    results = adapt_engine.execute_full_framework(sample_data)
-
-    # Display results
     print(f"[INFO] Framework: {results['framework']}")
     print(f"[INFO] User Type: {results['user_type']}")
     print(f"[INFO] Overall Strength: {results['framework_strength']:.2f}")
@@ -75,8 +60,31 @@ def test_adapt_framework_complete():
     for i, rec in enumerate(results["recommendations"], 1):
         print(f"   {i}. {rec}")
 
-    print()
-    print("[DONE] ADAPT FRAMEWORK ENGINE TEST COMPLETED!")
+
+def test_adapt_framework_complete():
+    """Test complete ADAPT framework execution"""
+
+    # Initialize engine
+    adapt_engine = ADAPTFrameworkEngine()
+
+    # Sample questionnaire data (business owner)
+    sample_data = {
+        "user_type": "business_owner",
+        "location": "Chennai, India",
+        "primary_goal": "Generate more leads",
+        "what_you_do": "We help small restaurants increase customer footfall through social media marketing",
+        "why_story": "Started this after seeing too many great local restaurants struggle with empty tables",
+        "target_customer": "Local restaurant owners aged 30-50 who are tech-savvy but lack marketing expertise",
+        "main_challenge": "Converting social media engagement into actual customer visits",
+        "marketing_budget": "$2K-$5K",
+        "current_marketing": ["Social media posts", "Word of mouth"],
+        "business_industry": "Digital Marketing for Restaurants",
+        "annual_revenue": "$200K-$500K"
+    }
+
+    # Execute full ADAPT framework
+    results = adapt_engine.execute_full_framework(sample_data)
+    logger.debug("ADAPT strength %.2f across %d stages", results["framework_strength"], len(results["stages"]))
 
     # Validate framework strength calculation
     assert 0.0 <= results["framework_strength"] <= 1.0, "Framework strength should be between 0 and 1"
@@ -88,9 +96,13 @@ def test_adapt_framework_complete():
 
 if __name__ == "__main__":
     test_results = test_adapt_framework_complete()
+    _dump_results(test_results)
 
     # Save detailed results for analysis
-    with open("adapt_framework_results.json", "w", encoding="utf-8") as f:
-        json.dump(test_results, f, indent=2)
+    output_path = Path("adapt_framework_results.json")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(test_results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        output_path.write_text(json.dumps(test_results, indent=2), encoding="utf-8")
 
     print("[FILE] Detailed results saved to adapt_framework_results.json")
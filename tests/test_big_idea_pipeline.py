@@ -1,11 +1,6 @@
 """Tests for the Big Idea pipeline and LangGraph workflow."""
 
-from frameworks.big_idea_pipeline import (
-    BigIdeaPipeline,
-    BigIdeaRequest,
-    OpenAIEmbeddingService,
-)
-from graphs import compile_big_idea_graph
+from frameworks.big_idea_pipeline import BigIdeaPipeline, BigIdeaRequest
 
 
 def _sample_request() -> BigIdeaRequest:
@@ -20,8 +15,8 @@ def _sample_request() -> BigIdeaRequest:
     )
 
 
-def test_big_idea_pipeline_generates_headlines() -> None:
-    pipeline = BigIdeaPipeline(embedding_service=OpenAIEmbeddingService(api_key=None))
+def test_big_idea_pipeline_generates_headlines(embedding_service) -> None:
+    pipeline = BigIdeaPipeline(embedding_service=embedding_service)
     result = pipeline.run(_sample_request())
 
     headlines = result["headlines"]
@@ -37,9 +32,8 @@ def test_big_idea_pipeline_generates_headlines() -> None:
     assert kb_meta["size"] >= 5
 
 
-def test_big_idea_graph_runs_end_to_end() -> None:
-    graph = compile_big_idea_graph()
-    result = graph.invoke(
+def test_big_idea_graph_runs_end_to_end(big_idea_graph) -> None:
+    result = big_idea_graph.invoke(
         {
             "request": {
                 "brand": "Boostly Ads",
@@ -9,8 +9,7 @@ from classifiers import (
 )
 
 
-def test_business_type_classifier_returns_metadata() -> None:
-    classifier = BusinessTypeClassifier()
+def test_business_type_classifier_returns_metadata(classifier: BusinessTypeClassifier) -> None:
     result = classifier.classify({"user_type": "startup_founder"})
 
     assert result["business_type"] == "startup_founder"
@@ -22,8 +21,7 @@ def test_business_type_classifier_returns_metadata() -> None:
     assert len(questions[0]["options"]) >= 5
 
 
-def test_questionnaire_returns_progressive_batch() -> None:
-    questionnaire = AdaptiveQuestionnaire()
+def test_questionnaire_returns_progressive_batch(questionnaire: AdaptiveQuestionnaire) -> None:
     batch = questionnaire.get_questions_for_type("startup_founder")
 
     assert len(batch) == questionnaire.MAX_BATCH_SIZE
@@ -32,8 +30,25 @@ def test_questionnaire_returns_progressive_batch() -> None:
     assert "startup_stage" in ids
 
 
-def test_questionnaire_follow_up_triggers() -> None:
+def test_questionnaire_batches_are_cached_per_progress() -> None:
     questionnaire = AdaptiveQuestionnaire()
+    first = questionnaire.get_questions_for_type("startup_founder", ["location"])
+    first.clear()
+    second = questionnaire.get_questions_for_type("startup_founder", ("location",))
+
+    assert len(questionnaire._batch_cache) == 1
+    assert second and second[0]["id"] != "location"
+
+
+def test_questionnaire_question_ids(questionnaire: AdaptiveQuestionnaire) -> None:
+    assert questionnaire.universal_ids() == [q["id"] for q in questionnaire.UNIVERSAL_QUESTIONS]
+    assert questionnaire.type_ids("startup_founder") == [
+        q["id"] for q in questionnaire.TYPE_QUESTIONS["startup_founder"]
+    ]
+    assert questionnaire.type_ids("unknown") == []
+
+
+def test_questionnaire_follow_up_triggers(questionnaire: AdaptiveQuestionnaire) -> None:
     answers = {
         "current_marketing": ["None/very little"],
         "primary_goal": "Expand to new markets",
@@ -56,10 +71,11 @@ def test_questionnaire_follow_up_triggers() -> None:
         ("$50K-$200K", "Switch 6"),
     ],
 )
-def test_framework_selector_overrides(revenue: str, expected: str) -> None:
-    selector = FrameworkSelector()
+def test_framework_selector_overrides(
+    framework_selector: FrameworkSelector, revenue: str, expected: str
+) -> None:
     answers = {"annual_revenue": revenue}
-    result = selector.select_framework(answers, "startup_founder")
+    result = framework_selector.select_framework(answers, "startup_founder")
 
     assert result["framework"] == expected
     assert 0.75 <= result["confidence"] <= 0.99
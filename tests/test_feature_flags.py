@@ -0,0 +1,58 @@
+"""Tests for feature flag persistence and provider parsing."""
+
+import json
+import logging
+import threading
+
+from utils.feature_flags import FeatureFlagManager, ModelProvider
+
+
+def test_mutations_coalesce_into_one_save(tmp_path, monkeypatch):
+    manager = FeatureFlagManager(str(tmp_path / "flags.json"))
+    manager.SAVE_DELAY = 60
+    saves = []
+    monkeypatch.setattr(manager, "_save_config", lambda: saves.append(1))
+
+    manager.disable_feature("gpt5_nano")
+    manager.enable_feature("custom_endpoints")
+    manager.update_endpoint_priority("openai", 10)
+    assert saves == []
+
+    manager.flush()
+    assert saves == [1]
+    manager.flush()
+    assert saves == [1]
+
+
+def test_debounced_save_writes_after_delay(tmp_path):
+    path = tmp_path / "flags.json"
+    manager = FeatureFlagManager(str(path))
+    manager.SAVE_DELAY = 0.01
+
+    manager.disable_feature("gpt5_nano")
+    timer = manager._save_timer
+    assert isinstance(timer, threading.Timer)
+    timer.join(timeout=5)
+
+    saved = json.loads(path.read_text())
+    assert saved["features"]["gpt5_nano"]["enabled"] is False
+    assert not list(tmp_path.glob("flags.json.tmp.*"))
+
+
+def test_unknown_provider_falls_back_with_warning(tmp_path, caplog):
+    path = tmp_path / "flags.json"
+    path.write_text(json.dumps({
+        "ai_models": {
+            "default_provider": "gpt5-nano",
+            "endpoints": {"openai": {"provider": "opneai"}},
+        }
+    }))
+
+    with caplog.at_level(logging.WARNING, logger="utils.feature_flags"):
+        manager = FeatureFlagManager(str(path))
+
+    config = manager.get_ai_config()
+    assert config.default_provider is ModelProvider.GPT5_NANO
+    assert config.endpoints["openai"].provider is ModelProvider.OPENAI
+    assert "'opneai'" in caplog.text
+    assert "'gpt5-nano'" in caplog.text
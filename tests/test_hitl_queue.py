@@ -0,0 +1,59 @@
+"""Tests for the in-memory human-in-the-loop queue."""
+
+import asyncio
+
+import pytest
+
+from core.hitl import HITL_APPROVED, HITL_PENDING, HITLRequest, InMemoryHITLQueue
+
+
+@pytest.fixture
+def hitl_queue() -> InMemoryHITLQueue:
+    return InMemoryHITLQueue()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_hitl_queue_resolution(hitl_queue: InMemoryHITLQueue) -> None:
+    request = await hitl_queue.submit(HITLRequest("req-1", "review_position", {"statement": "Draft"}))
+    assert request.status == HITL_PENDING
+
+    await hitl_queue.resolve("req-1", HITL_APPROVED, {"note": "looks good"})
+    stored = await hitl_queue.get("req-1")
+
+    assert stored is request
+    assert stored.status == HITL_APPROVED
+    assert stored.resolution == {"note": "looks good"}
+    assert stored.resolved_at is not None
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_hitl_queue_rejects_unknown_request(hitl_queue: InMemoryHITLQueue) -> None:
+    with pytest.raises(KeyError):
+        await hitl_queue.resolve("missing", HITL_APPROVED)
+    assert await hitl_queue.get("missing") is None
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_hitl_queue_concurrent_submissions(hitl_queue: InMemoryHITLQueue) -> None:
+    async with asyncio.TaskGroup() as group:
+        for index in range(100):
+            group.create_task(hitl_queue.submit(HITLRequest(f"req-{index}", "review", {"index": index})))
+
+    async with asyncio.TaskGroup() as group:
+        for index in range(0, 100, 2):
+            group.create_task(hitl_queue.resolve(f"req-{index}", HITL_APPROVED))
+
+    statuses = [(await hitl_queue.get(f"req-{index}")).status for index in range(100)]
+    assert statuses.count(HITL_APPROVED) == 50
+    assert statuses.count(HITL_PENDING) == 50
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_hitl_queue_get_many(hitl_queue: InMemoryHITLQueue) -> None:
+    for index in range(3):
+        await hitl_queue.submit(HITLRequest(f"req-{index}", "review", {"index": index}))
+
+    found = await hitl_queue.get_many(["req-0", "req-2", "missing"])
+
+    assert list(found) == ["req-0", "req-2"]
+    assert found["req-2"].payload == {"index": 2}
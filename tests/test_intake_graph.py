@@ -1,31 +1,15 @@
 """Integration tests covering the adaptive intake LangGraph workflow."""
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
-from classifiers import AdaptiveQuestionnaire
-from graphs import compile_intake_graph
-
-
-def test_intake_graph_prompts_for_classification_when_unknown() -> None:
-    graph = compile_intake_graph()
-    result = graph.invoke({"answers": {}})
-
-    assert result["classification"]["business_type"] == "unknown"
-    next_questions = result["next_questions"]
-    assert next_questions[0]["id"] == "user_type"
-    assert result["framework"] is None
-    assert result["validation"] is None
+import pytest
 
+from classifiers import AdaptiveQuestionnaire
 
-def test_intake_graph_completes_when_all_required_answers_present() -> None:
-    questionnaire = AdaptiveQuestionnaire()
-    universal_ids: List[str] = [q["id"] for q in questionnaire.UNIVERSAL_QUESTIONS]
-    type_ids: List[str] = [
-        q["id"] for q in questionnaire.TYPE_QUESTIONS["business_owner"]
-    ]
-    answered = universal_ids + type_ids + ["user_type"]
-
-    answers: Dict[str, object] = {
+# Read-only; tests hand the graph a shallow copy
+COMPLETE_ANSWERS: Mapping[str, object] = MappingProxyType(
+    {
         "user_type": "business_owner",
         "location": "Austin, USA",
         "primary_goal": "Generate more leads",
@@ -42,13 +26,31 @@ def test_intake_graph_completes_when_all_required_answers_present() -> None:
         ),
         "marketing_budget": "$2K-$5K",
     }
+)
+
 
-    graph = compile_intake_graph()
-    result = graph.invoke({"answers": answers, "answered_questions": answered})
+@pytest.fixture(scope="module")
+def complete_intake(questionnaire: AdaptiveQuestionnaire) -> Tuple[Mapping[str, object], List[str]]:
+    answered = questionnaire.universal_ids() + questionnaire.type_ids("business_owner") + ["user_type"]
+    return COMPLETE_ANSWERS, answered
+
+
+def test_intake_graph_prompts_for_classification_when_unknown(intake_graph) -> None:
+    result = intake_graph.invoke({"answers": {}})
+
+    assert result["classification"]["business_type"] == "unknown"
+    next_questions = result["next_questions"]
+    assert next_questions[0]["id"] == "user_type"
+    assert result["framework"] is None
+    assert result["validation"] is None
+
+
+def test_intake_graph_completes_when_all_required_answers_present(intake_graph, complete_intake) -> None:
+    answers, answered = complete_intake
+    result = intake_graph.invoke({"answers": dict(answers), "answered_questions": list(answered)})
 
     assert result["validation"]["valid"] is True
     assert result["next_questions"] == []
     assert result["follow_up_questions"] == []
     assert result["framework"]["framework"] == "ADAPT"
     assert result["is_complete"] is True
-
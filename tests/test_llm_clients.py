@@ -0,0 +1,240 @@
+"""Tests for the LLM client caches, circuit breaker and retry helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utils import llm_clients
+from utils.feature_flags import ModelEndpoint, ModelProvider
+from utils.llm_clients import (
+    EnhancedLLMClient,
+    LLMChoice,
+    LLMClient,
+    LLMResponse,
+    _CircuitBreaker,
+    _DiskResponseCache,
+    _retry_delay,
+    _scatter,
+    _unique_prompts,
+)
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module with a manually advanced clock."""
+
+    def __init__(self, start: float = 1_000.0) -> None:
+        self.now = start
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeOpenAI:
+    """Minimal OpenAI client whose completions echo the prompt."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, *, model, messages, temperature, max_tokens):
+        self.calls += 1
+        content = f"answer {self.calls} to {messages[-1]['content']}"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: bytes = b"{}", headers=None) -> None:
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Replays canned responses for ``requests.Session.post``."""
+
+    def __init__(self, responses) -> None:
+        self._responses = list(responses)
+        self.posts = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+        return self._responses.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(llm_clients, "time", clock)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def _offline_env(monkeypatch):
+    for name in ("GPT5_NANO_ENDPOINT", "GPT5_NANO_API_KEY", "OPENAI_API_KEY", "LLM_CACHE_DIR"):
+        monkeypatch.delenv(name, raising=False)
+    llm_clients._disk_cache.cache_clear()
+    yield
+    llm_clients._disk_cache.cache_clear()
+
+
+def test_response_cache_hits_only_deterministic_calls():
+    client = LLMClient()
+    fake = FakeOpenAI()
+    client._openai_client = fake
+
+    first = client.generate("name the niche", temperature=0)
+    second = client.generate("name the niche", temperature=0)
+    assert fake.calls == 1
+    assert second.choices[0].text == first.choices[0].text
+    assert client.cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    client.generate("name the niche", temperature=0.7)
+    client.generate("name the niche", temperature=0.7)
+    assert fake.calls == 3
+
+    client.generate("name the niche", temperature=0, max_tokens=64)
+    assert fake.calls == 4
+
+
+def test_fallback_text_is_not_cached():
+    client = LLMClient()
+    client.generate("offline prompt", temperature=0)
+    assert client.cache_stats()["size"] == 0
+
+
+def test_disk_cache_shares_entries_until_ttl(tmp_path, clock):
+    writer = _DiskResponseCache(str(tmp_path), ttl=60)
+    reader = _DiskResponseCache(str(tmp_path), ttl=60)
+    key = ("gpt-5-nano", "prompt", 256)
+
+    writer.put(key, ("stored",))
+    assert reader.get(key) == ("stored",)
+    assert reader.get(("gpt-5-nano", "prompt", 128)) is None
+
+    clock.advance(61)
+    assert reader.get(key) is None
+
+
+def test_llm_client_reads_through_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    llm_clients._disk_cache.cache_clear()
+    first = LLMClient()
+    first._openai_client = FakeOpenAI()
+    expected = first.generate("persist me", temperature=0).choices[0].text
+
+    second = LLMClient()
+    second._openai_client = fake = FakeOpenAI()
+    assert second.generate("persist me", temperature=0).choices[0].text == expected
+    assert fake.calls == 0
+
+
+def test_semantic_cache_serves_only_deterministic_calls():
+    semantic_cache = pytest.importorskip("utils.semantic_cache")
+    vectors = {"find buyers": [1.0, 0.0], "locate buyers": [0.99, 0.05]}
+    cache = semantic_cache.SemanticCache(threshold=0.9, embedder=lambda texts: [vectors[t] for t in texts])
+    client = EnhancedLLMClient(use_feature_flags=False, semantic_cache=cache)
+    client._provider_clients = {"openai": (fake := FakeOpenAI())}
+
+    original = client.generate("find buyers", temperature=0).choices[0].text
+    assert len(cache) == 1
+    assert client.generate("locate buyers", temperature=0).choices[0].text == original
+    assert fake.calls == 1
+
+    client.generate("locate buyers", temperature=0.7)
+    assert fake.calls == 2
+    assert len(cache) == 1
+
+
+def test_semantic_cache_expires_entries(monkeypatch):
+    semantic_cache = pytest.importorskip("utils.semantic_cache")
+    clock = FakeClock()
+    monkeypatch.setattr(semantic_cache, "time", clock)
+    cache = semantic_cache.SemanticCache(ttl=10, embedder=lambda texts: [[1.0, 0.0] for _ in texts])
+
+    cache.add("prompt", "response", scope="a")
+    assert cache.lookup("prompt", scope="a") == "response"
+    assert cache.lookup("prompt", scope="b") is None
+
+    clock.advance(11)
+    assert cache.lookup("prompt", scope="a") is None
+    assert len(cache) == 0
+
+
+def test_circuit_breaker_opens_and_half_opens(clock):
+    breaker = _CircuitBreaker()
+    for _ in range(breaker.THRESHOLD - 1):
+        breaker.record("gpt5_nano", False)
+    assert breaker.allow("gpt5_nano")
+
+    breaker.record("gpt5_nano", False)
+    assert not breaker.allow("gpt5_nano")
+    assert breaker.allow("openai")
+
+    clock.advance(breaker.COOLDOWN)
+    assert breaker.allow("gpt5_nano")
+    breaker.record("gpt5_nano", False)
+    assert not breaker.allow("gpt5_nano")
+
+    clock.advance(breaker.COOLDOWN)
+    breaker.record("gpt5_nano", True)
+    breaker.record("gpt5_nano", False)
+    assert breaker.allow("gpt5_nano")
+
+
+def test_retry_delay_honours_retry_after():
+    assert _retry_delay(0, "3") >= 3.0
+    assert 0.0 <= _retry_delay(0, "soon") <= llm_clients._RETRY_BASE_DELAY
+    assert _retry_delay(20) <= llm_clients._RETRY_MAX_DELAY
+
+
+def test_configured_endpoint_retries_after_server_hint(monkeypatch, clock):
+    monkeypatch.setenv("GPT5_NANO_API_KEY", "test-key")
+    session = FakeSession([
+        FakeResponse(429, headers={"Retry-After": "2"}),
+        FakeResponse(200, b'{"choices": [{"text": " ready "}]}'),
+    ])
+    monkeypatch.setattr(llm_clients, "_http_session", lambda: session)
+    endpoint = ModelEndpoint(
+        provider=ModelProvider.GPT5_NANO,
+        endpoint_url="https://nano.invalid/v1",
+        api_key_env_var="GPT5_NANO_API_KEY",
+        model_name="gpt-5-nano",
+    )
+    client = EnhancedLLMClient(use_feature_flags=False)
+
+    response = client._try_gpt5_nano_endpoint_configured(endpoint, "prompt", 0, 16)
+
+    assert response.choices[0].text == "ready"
+    assert session.posts == 2
+    assert clock.sleeps and clock.sleeps[0] >= 2.0
+
+
+def test_unique_prompts_and_scatter_preserve_input_order():
+    prompts = ["a", "b", "a", "c", "b"]
+    unique, slots = _unique_prompts(prompts, temperature=0)
+    assert unique == ["a", "b", "c"]
+
+    results = [LLMResponse(choices=[LLMChoice(text=prompt.upper())]) for prompt in unique]
+    scattered = _scatter(results, slots)
+
+    assert [r.choices[0].text for r in scattered] == ["A", "B", "A", "C", "B"]
+    assert scattered[0] is results[0]
+    assert scattered[2] is not scattered[0]
+
+    sampled, sampled_slots = _unique_prompts(prompts, temperature=0.7)
+    assert sampled == prompts
+    assert sampled_slots == list(range(len(prompts)))
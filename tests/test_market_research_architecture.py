@@ -10,10 +10,9 @@ from market_research.parsers import SoupHTMLParser
 from market_research.resilience import CircuitBreaker, CircuitBreakerOpen
 from market_research.storage import InMemoryStorageAdapter
 from market_research.workflows.orchestrator import build_market_research_orchestrator
-from market_research.nlp import EmbeddingNLPAnalyzer
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_orchestrator_skips_when_no_seeds(tmp_path: Path):
     config_path = tmp_path / "config.json"
     config_path.write_text(json.dumps({"sites": {"default": {"seed_urls": []}}}))
@@ -31,7 +30,12 @@ async def test_orchestrator_skips_when_no_seeds(tmp_path: Path):
 
     fetcher = StubFetcher()
     parser = SoupHTMLParser()
-    analyzer = EmbeddingNLPAnalyzer()
+
+    class StubAnalyzer:
+        def analyze(self, texts, *, metadata=None):
+            return {"embeddings": [], "clusters": [], "metadata": metadata or []}
+
+    analyzer = StubAnalyzer()
 
     class StubIndex:
         def __init__(self):
@@ -70,7 +74,7 @@ def test_config_manager_auto_reload(tmp_path: Path):
     assert second["sites"]["default"]["seed_urls"][0].endswith("updated.example.com")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_circuit_breaker_recovery():
     breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
 
@@ -1,29 +1,33 @@
 """Scenario coverage for the Personal Brand questionnaire path."""
 
+import logging
+
 from classifiers.business_type_classifier import BusinessTypeClassifier
 from classifiers.adaptive_questionnaire import AdaptiveQuestionnaire
 from classifiers.framework_selector import FrameworkSelector
 
+logger = logging.getLogger(__name__)
 
-def test_personal_brand_flow() -> None:
-    """Test Personal Brand question set and framework handling."""
 
-    print("[PERSONAL BRAND] Starting flow test")
+def test_personal_brand_flow(
+    classifier: BusinessTypeClassifier,
+    questionnaire: AdaptiveQuestionnaire,
+    framework_selector: FrameworkSelector,
+) -> None:
+    """Test Personal Brand question set and framework handling."""
 
-    classifier = BusinessTypeClassifier()
-    questionnaire = AdaptiveQuestionnaire()
-    framework_selector = FrameworkSelector()
+    logger.debug("[PERSONAL BRAND] Starting flow test")
 
     answers = {"user_type": "personal_brand"}
     classification = classifier.classify(answers)
 
-    print(f"classification: {classification}")
+    logger.debug("classification: %s", classification)
     assert classification["business_type"] == "personal_brand"
     assert classification["framework"] == "Switch 6"
 
     pb_questions = questionnaire.TYPE_QUESTIONS["personal_brand"]
     pb_ids = [question["id"] for question in pb_questions]
-    print(f"question ids: {pb_ids}")
+    logger.debug("question ids: %s", pb_ids)
 
     expected_ids = {"brand_niche", "current_following", "content_platforms", "monetization", "personal_story"}
     assert expected_ids.issubset(pb_ids)
@@ -42,11 +46,8 @@ def test_personal_brand_flow() -> None:
         "dream_outcome": "Become the go-to mentor for Indian startup founders and build a community of one million entrepreneurs",
     }
 
-    validation = questionnaire.validate_responses(influencer_answers, "personal_brand")
-    print(f"validation influencer: {validation}")
-
     framework_result = framework_selector.select_framework(influencer_answers, "personal_brand")
-    print(f"framework influencer: {framework_result}")
+    logger.debug("framework influencer: %s", framework_result)
 
     beginner_answers = {
         "user_type": "personal_brand",
@@ -55,8 +56,11 @@ def test_personal_brand_flow() -> None:
         "monetization": ["Not monetizing yet"],
         "personal_story": "Transformed personal health while working long consulting hours",
     }
-    beginner_validation = questionnaire.validate_responses(beginner_answers, "personal_brand")
-    print(f"validation beginner: {beginner_validation}")
+    validation, beginner_validation = questionnaire.validate_responses_batch(
+        [influencer_answers, beginner_answers], "personal_brand"
+    )
+    logger.debug("validation influencer: %s", validation)
+    logger.debug("validation beginner: %s", beginner_validation)
 
     assert validation["valid"] is True
     assert validation["quality_score"] > 0.8
@@ -64,8 +68,8 @@ def test_personal_brand_flow() -> None:
     assert len(influencer_answers["personal_story"]) > 50
     assert beginner_validation["valid"] is False
 
-    print("[PERSONAL BRAND] Flow test passed")
+    logger.debug("[PERSONAL BRAND] Flow test passed")
 
 
 if __name__ == "__main__":
-    test_personal_brand_flow()
+    test_personal_brand_flow(BusinessTypeClassifier(), AdaptiveQuestionnaire(), FrameworkSelector())
@@ -5,24 +5,30 @@ from position_validator import (
     PositionValidatorEngine,
     Switch6ScoringModule,
 )
+from unittest import mock
+
 from position_validator.engine import ModuleConfig
 
 
 def test_position_validator_weighted_scores():
+    godin = GodinScoringModule()
     engine = PositionValidatorEngine(
         [
             AdaptScoringModule(),
             Switch6ScoringModule(),
             OgilvyScoringModule(),
-            GodinScoringModule(),
+            godin,
         ]
     )
     overrides = {
         "ogilvy": ModuleConfig(name="ogilvy", weight=2.0),
         "godin": ModuleConfig(name="godin", enabled=False),
     }
-    result = engine.score("We help growth teams escape churn with proof-backed onboarding", module_overrides=overrides)
+    with mock.patch.object(godin, "score", wraps=godin.score) as godin_score:
+        result = engine.score("We help growth teams escape churn with proof-backed onboarding", module_overrides=overrides)
     assert 0 <= result["score"] <= 1
-    enabled_modules = {item["module"] for item in result["module_results"]}
-    assert "godin" not in enabled_modules
+    assert not any(item["module"] == "godin" for item in result["module_results"])
+    # Disabled modules must be skipped, not scored and then discarded
+    assert godin_score.call_count == 0
     assert result["feedback"]
+
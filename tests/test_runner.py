@@ -1,51 +1,80 @@
 """Manual runner for the adaptive questionnaire test suite."""
 
+import logging
+import subprocess
 import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List
 
-from tests.test_business_owner_flow import test_business_owner_complete_flow
-from tests.test_framework_selection import test_framework_selection_logic
-from tests.test_location_integration import test_location_integration
-from tests.test_personal_brand_flow import test_personal_brand_flow
-from tests.test_startup_founder_flow import test_startup_founder_flow
+logger = logging.getLogger(__name__)
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+# Flow name -> test module; this runner itself is deliberately not listed so
+# the nested pytest run cannot recurse into it.
+FLOW_MODULES = {
+    "business_owner": "test_business_owner_flow.py",
+    "startup_founder": "test_startup_founder_flow.py",
+    "personal_brand": "test_personal_brand_flow.py",
+    "location": "test_location_integration.py",
+    "framework_selection": "test_framework_selection.py",
+}
+
+
+def _pytest_command(junit_path: Path) -> List[str]:
+    return [
+        sys.executable,
+        "-m",
+        "pytest",
+        "-q",
+        "-n",
+        "auto",
+        f"--junitxml={junit_path}",
+        *(str(TESTS_DIR / module) for module in FLOW_MODULES.values()),
+    ]
+
+
+def _collect_results(junit_path: Path) -> Dict[str, bool]:
+    """Map each flow to whether all of its test cases passed."""
+
+    results = {name: False for name in FLOW_MODULES}
+    if not junit_path.is_file():
+        return results
+
+    module_to_flow = {Path(module).stem: name for name, module in FLOW_MODULES.items()}
+    seen: Dict[str, bool] = {}
+    for case in ET.parse(junit_path).iter("testcase"):
+        flow = module_to_flow.get(case.get("classname", "").rsplit(".", 1)[-1])
+        if flow is None:
+            continue
+        failed = case.find("failure") is not None or case.find("error") is not None
+        seen[flow] = seen.get(flow, True) and not failed
+    results.update(seen)
+    return results
 
 
 def run_all_tests() -> bool:
-    """Run the full questionnaire system test battery."""
-
-    print("[TEST RUNNER] Executing questionnaire system tests")
-    results = {}
-
-    for name, func in [
-        ("business_owner", test_business_owner_complete_flow),
-        ("startup_founder", test_startup_founder_flow),
-        ("personal_brand", test_personal_brand_flow),
-        ("location", test_location_integration),
-        ("framework_selection", test_framework_selection_logic),
-    ]:
-        try:
-            func()
-            results[name] = True
-        except Exception as exc:  # pragma: no cover - debugging utility
-            print(f"[TEST RUNNER] {name} failed: {exc}")
-            results[name] = False
-
-    print("[TEST RUNNER] Summary")
+    """Run the full questionnaire system test battery across xdist workers."""
+
+    logger.info("[TEST RUNNER] Executing questionnaire system tests")
+    with tempfile.TemporaryDirectory() as tmp:
+        junit_path = Path(tmp) / "flows.xml"
+        subprocess.run(_pytest_command(junit_path), cwd=TESTS_DIR.parent, check=False)
+        results = _collect_results(junit_path)
+
+    logger.info("[TEST RUNNER] Summary")
     passed = sum(1 for value in results.values() if value)
     total = len(results)
     for key, value in results.items():
-        status = "PASSED" if value else "FAILED"
-        print(f"  {key}: {status}")
+        logger.info("  %s: %s", key, "PASSED" if value else "FAILED")
 
-    print(f"[TEST RUNNER] {passed}/{total} tests passed")
+    logger.info("[TEST RUNNER] %d/%d tests passed", passed, total)
     return passed == total
 
 
-def test_run_all_tests() -> None:
-    """Ensure the bundled runner reports success when all flows pass."""
-
-    assert run_all_tests() is True
-
-
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     success = run_all_tests()
     sys.exit(0 if success else 1)
@@ -1,4 +1,5 @@
 import json
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,36 +16,49 @@ from frameworks.switch6_engine import (
     RevenueModeler,
 )
 
+# Fixed per test session so fake scrape timestamps are stable across stages
+_FAKE_NOW_ISO = datetime.now(timezone.utc).isoformat()
+
+_FEATURES = ("Onboarding support", "Analytics", "Live training")
+
+
+_PROSPECT_TEMPLATES = (
+    ProspectRecord(
+        email="",
+        full_name="",
+        job_title="Operations Lead",
+        company="",
+        company_size="51-200",
+        industry="SaaS",
+        source="fake_linkedin",
+        location="Remote",
+    ),
+    ProspectRecord(
+        email="",
+        full_name="",
+        job_title="Growth Director",
+        company="",
+        company_size="201-500",
+        industry="SaaS",
+        source="fake_crunchbase",
+        location="Austin",
+    ),
+)
+
 
 class FakeProspectClient:
     def fetch(self, keyword: str, limit: int):
+        slug, title = keyword.replace(" ", "_"), keyword.title()
+        owner, director = _PROSPECT_TEMPLATES
         return [
-            ProspectRecord(
-                email=f"{keyword.replace(' ', '_')}@example.com",
-                full_name=f"{keyword.title()} Owner",
-                job_title="Operations Lead",
-                company=f"{keyword.title()} Labs",
-                company_size="51-200",
-                industry="SaaS",
-                source="fake_linkedin",
-                location="Remote",
-            ),
-            ProspectRecord(
-                email=f"{keyword.replace(' ', '_')}_2@example.com",
-                full_name=f"{keyword.title()} Director",
-                job_title="Growth Director",
-                company=f"{keyword.title()} Studio",
-                company_size="201-500",
-                industry="SaaS",
-                source="fake_crunchbase",
-                location="Austin",
-            ),
+            replace(owner, email=f"{slug}@example.com", full_name=f"{title} Owner", company=f"{title} Labs"),
+            replace(director, email=f"{slug}_2@example.com", full_name=f"{title} Director", company=f"{title} Studio"),
         ]
 
 
 class FakeReviewScraper:
     def scrape(self, keyword, sources=None):
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = _FAKE_NOW_ISO
         return [
             {
                 "url": "https://example.com/review-1",
@@ -69,12 +83,12 @@ class FakeTopicModeler:
 
 
 class FakeGoogleTrendsClient:
+    # The engine only reads columns, means and the tail of the frame, so a
+    # plain positional index stands in for the monthly date range.
     def compare_terms(self, primary_term, competitor_terms):
-        idx = pd.date_range(end=datetime.now(), periods=3, freq="M")
         data = {primary_term: [60, 64, 67]}
-        for competitor in competitor_terms:
-            data[competitor] = [45, 48, 50]
-        return pd.DataFrame(data, index=idx)
+        data.update({competitor: [45, 48, 50] for competitor in competitor_terms})
+        return pd.DataFrame(data)
 
 
 class FakeCompetitorFetcher:
@@ -83,7 +97,7 @@ class FakeCompetitorFetcher:
             {
                 "name": competitor,
                 "base_price": 999 + idx * 200,
-                "features": ["Onboarding support", "Analytics", "Live training"],
+                "features": _FEATURES,
                 "url": f"https://example.com/{competitor}",
             }
             for idx, competitor in enumerate(competitors)
@@ -95,35 +109,39 @@ class FakeLLMReframer:
         return [f"{brief} alternative #{i}" for i in range(count)]
 
     def rank(self, statements):
-        scored = []
-        for idx, statement in enumerate(statements):
-            scored.append(
-                {
-                    "statement": statement,
-                    "creativity": 0.6 + idx * 0.05,
-                    "clarity": 0.9,
-                    "composite": round(0.75 + idx * 0.04, 3),
-                }
-            )
-        return scored
+        return [
+            {
+                "statement": statement,
+                "creativity": 0.6 + idx * 0.05,
+                "clarity": 0.9,
+                "composite": round(0.75 + idx * 0.04, 3),
+            }
+            for idx, statement in enumerate(statements)
+        ]
 
 
 class InMemoryRepository:
     def __init__(self):
-        self.records = {}
+        self.records = []
+        self._next_id = 0
 
     def store(self, stage, content, metadata=None):
-        doc_id = f"{stage}-{len(self.records) + 1}"
-        self.records[doc_id] = {"content": content, "metadata": metadata or {}}
+        self._next_id += 1
+        doc_id = f"{stage}-{self._next_id}"
+        self.records.append((doc_id, content, metadata or {}))
         return doc_id
 
 
 class FakeDashboardBuilder:
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, *, write_files: bool = True):
         self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.write_files = write_files
+        if write_files:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def build(self, segment_csv: str, pain_points):
+        if not self.write_files:
+            return {"funnel": "memory://funnel.html", "pain": "memory://pain.html"}
         funnel = self.base_dir / "funnel.html"
         pain = self.base_dir / "pain.html"
         funnel.write_text("funnel-dashboard")
@@ -131,8 +149,11 @@ class FakeDashboardBuilder:
         return {"funnel": str(funnel), "pain": str(pain)}
 
 
-def test_switch6_engine_full_flow(monkeypatch, tmp_path):
-    monkeypatch.chdir(tmp_path)
+@pytest.fixture(scope="module")
+def switch6_run(tmp_path_factory):
+    """Run the full pipeline once and share its output across the stage tests."""
+
+    tmp_path = tmp_path_factory.mktemp("switch6")
     repository = InMemoryRepository()
     engine = Switch6FrameworkEngine(
         prospect_clients=[FakeProspectClient()],
@@ -142,7 +163,8 @@ def test_switch6_engine_full_flow(monkeypatch, tmp_path):
         competitor_fetcher=FakeCompetitorFetcher(),
         llm_reframer=FakeLLMReframer(),
         repository=repository,
-        dashboard_builder=FakeDashboardBuilder(tmp_path / "dashboards"),
+        # No test reads the dashboard files back, so keep them in memory
+        dashboard_builder=FakeDashboardBuilder(tmp_path / "dashboards", write_files=False),
         revenue_modeler=RevenueModeler(export_dir=tmp_path / "projections"),
     )
 
@@ -156,35 +178,56 @@ def test_switch6_engine_full_flow(monkeypatch, tmp_path):
         "competitors": ["Contender One", "Contender Two", "Contender Three"],
     }
 
-    result = engine.execute_full_framework(data)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path)
+        result = engine.execute_full_framework(data)
+        # Stage outputs hold paths relative to the run directory
+        yield result, repository
+
 
+def test_framework_summary(switch6_run):
+    result, _ = switch6_run
     assert result["framework"] == "Switch 6"
     assert 0 < result["framework_completion_score"] <= 1
     assert result["citations"]
 
-    segment_stage = result["stages"]["segment"]
+
+def test_segment_stage(switch6_run):
+    segment_stage = switch6_run[0]["stages"]["segment"]
     assert segment_stage["prospect_count"] >= 2
     assert Path(segment_stage["csv_file"]).exists()
     assert Path(segment_stage["preview_dashboard"]).exists()
 
-    wound_stage = result["stages"]["wound"]
+
+def test_wound_stage(switch6_run):
+    wound_stage = switch6_run[0]["stages"]["wound"]
     assert len(wound_stage["pain_points"]) == 3
     assert any("estimated_monthly_loss" in pain for pain in wound_stage["pain_points"])
 
-    reframe_stage = result["stages"]["reframe"]
+
+def test_reframe_stage(switch6_run):
+    reframe_stage = switch6_run[0]["stages"]["reframe"]
     assert len(reframe_stage["reframe_statements"]) == 5
     assert reframe_stage["top_trend_terms"]
 
-    offer_stage = result["stages"]["offer"]
+
+def test_offer_stage(switch6_run):
+    offer_stage = switch6_run[0]["stages"]["offer"]
     assert offer_stage["differentiators"]["unique_benefits"]
 
-    action_stage = result["stages"]["action"]
+
+def test_action_stage(switch6_run):
+    action_stage = switch6_run[0]["stages"]["action"]
     assert action_stage["benchmark_source"]
     assert len(action_stage["cta_variants"]) == 3
 
-    cash_stage = result["stages"]["cash"]
+
+def test_cash_stage(switch6_run):
+    cash_stage = switch6_run[0]["stages"]["cash"]
     assert cash_stage["dashboard_paths"]["funnel"].endswith("funnel.html")
     assert cash_stage["payment_links"]["stripe"]
 
-    assert len(repository.records) >= 5
 
+def test_repository_records(switch6_run):
+    _, repository = switch6_run
+    assert len(repository.records) >= 5
@@ -3,4 +3,5 @@
 __all__ = [
     "cloud",
     "llm_clients",
+    "semantic_cache",
 ]
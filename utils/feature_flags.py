@@ -8,14 +8,24 @@ This module provides a centralized configuration system for:
 - Dynamic configuration updates
 """
 
+import atexit
 import json
+import operator
 import os
-from dataclasses import dataclass, field
+import threading
+import weakref
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Union
 from pathlib import Path
 import logging
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,7 +45,26 @@ class FeatureStatus(Enum):
     DEPRECATED = "deprecated"
 
 
-@dataclass
+# Config values are plain strings; map them straight to enum members.
+_PROVIDER_BY_VALUE = {member.value: member for member in ModelProvider}
+_STATUS_BY_VALUE = {member.value: member for member in FeatureStatus}
+
+def _provider_from_config(value: Any, default: ModelProvider, source: str) -> ModelProvider:
+    """Map a configured provider string to its enum member, warning on unknown values."""
+    if value is None:
+        return default
+    provider = _PROVIDER_BY_VALUE.get(value)
+    if provider is None:
+        logger.warning("Unknown model provider %r in %s; using %s", value, source, default.value)
+        return default
+    return provider
+
+
+# Statuses under which an enabled flag counts as active.
+_ACTIVE_STATUSES = frozenset({FeatureStatus.ENABLED, FeatureStatus.BETA})
+
+
+@dataclass(slots=True)
 class ModelEndpoint:
     """Configuration for a specific model endpoint."""
     provider: ModelProvider
@@ -52,10 +81,12 @@ class ModelEndpoint:
 
     def is_available(self) -> bool:
         """Check if this endpoint is available (has API key and is enabled)."""
-        return self.enabled and bool(os.getenv(self.api_key_env_var))
+        if not self.enabled or not self.api_key_env_var:
+            return False
+        return bool(os.environ.get(self.api_key_env_var))
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureFlag:
     """Individual feature flag configuration."""
     name: str
@@ -66,10 +97,14 @@ class FeatureFlag:
 
     def is_active(self) -> bool:
         """Check if this feature flag is currently active."""
-        return self.enabled and self.status in [FeatureStatus.ENABLED, FeatureStatus.BETA]
+        return self.enabled and self.status in _ACTIVE_STATUSES
+
 
+_ENDPOINT_FIELDS = frozenset(f.name for f in fields(ModelEndpoint))
+_BY_PRIORITY = operator.attrgetter("priority")
 
-@dataclass
+
+@dataclass(slots=True)
 class AIModelConfig:
     """Configuration for AI model connections."""
     default_provider: ModelProvider
@@ -80,31 +115,53 @@ class AIModelConfig:
     def get_active_endpoints(self) -> List[ModelEndpoint]:
         """Get all currently active endpoints sorted by priority."""
         active = [ep for ep in self.endpoints.values() if ep.is_available()]
-        return sorted(active, key=lambda x: x.priority)
+        return sorted(active, key=_BY_PRIORITY)
 
     def get_best_endpoint(self) -> Optional[ModelEndpoint]:
         """Get the highest priority available endpoint."""
-        active = self.get_active_endpoints()
-        return active[0] if active else None
+        active = [ep for ep in self.endpoints.values() if ep.is_available()]
+        return min(active, key=_BY_PRIORITY) if active else None
+
+
+# Managers that may hold unsaved changes. Tracked weakly so registering for the
+# exit flush doesn't keep discarded managers alive.
+_LIVE_MANAGERS: "weakref.WeakSet[FeatureFlagManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    for manager in list(_LIVE_MANAGERS):
+        manager.flush()
 
 
 class FeatureFlagManager:
-    """Centralized feature flag and configuration manager."""
+    """Centralized feature flag and configuration manager.
+
+    Mutators save asynchronously: the write to ``config_path`` is deferred by
+    ``SAVE_DELAY`` on a timer thread so bursts of changes coalesce. Call
+    ``flush()`` to write pending changes immediately; any still pending are
+    flushed at interpreter exit.
+    """
 
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or os.getenv("FEATURE_FLAGS_CONFIG", "feature_flags.json")
         self._config: Dict[str, Any] = {}
         self._feature_flags: Dict[str, FeatureFlag] = {}
         self._ai_config: Optional[AIModelConfig] = None
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
         self._load_config()
+        _LIVE_MANAGERS.add(self)
 
     def _load_config(self):
         """Load configuration from file and environment."""
         # Load from file if it exists
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    self._config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    raw = f.read()
+                self._config = orjson.loads(raw) if orjson is not None else json.loads(raw)
             except Exception as e:
                 logger.warning(f"Failed to load config file: {e}")
                 self._config = {}
@@ -120,26 +177,32 @@ class FeatureFlagManager:
 
     def _load_environment_overrides(self):
         """Load configuration overrides from environment variables."""
+        env = os.environ
+
         # AI Model endpoints
-        if os.getenv("GPT5_NANO_ENDPOINT"):
+        gpt5_nano_endpoint = env.get("GPT5_NANO_ENDPOINT")
+        if gpt5_nano_endpoint:
             self._config.setdefault("ai_models", {}).setdefault("endpoints", {})["gpt5_nano"] = {
                 "provider": "gpt5_nano",
-                "endpoint_url": os.getenv("GPT5_NANO_ENDPOINT"),
+                "endpoint_url": gpt5_nano_endpoint,
                 "api_key_env_var": "GPT5_NANO_API_KEY",
                 "model_name": "gpt-5-nano",
-                "enabled": os.getenv("GPT5_NANO_ENABLED", "true").lower() == "true",
-                "priority": int(os.getenv("GPT5_NANO_PRIORITY", "100")),
-                "timeout": int(os.getenv("GPT5_NANO_TIMEOUT", "30"))
+                "enabled": env.get("GPT5_NANO_ENABLED", "true").lower() == "true",
+                "priority": int(env.get("GPT5_NANO_PRIORITY", "100")),
+                "timeout": int(env.get("GPT5_NANO_TIMEOUT", "30"))
             }
 
-        # Feature flag overrides
-        for key, value in os.environ.items():
-            if key.startswith("FEATURE_") and key.endswith("_ENABLED"):
-                flag_name = key[8:-7].lower()  # Remove FEATURE_ prefix and _ENABLED suffix
-                self._config.setdefault("features", {})[flag_name] = {
+        # Feature flag overrides: FEATURE_<NAME>_ENABLED with optional FEATURE_<NAME>_STATUS
+        overrides = {}
+        for key, value in env.items():
+            if len(key) > 16 and key.startswith("FEATURE_") and key.endswith("_ENABLED"):
+                flag_name = key[8:-8].lower()  # Remove FEATURE_ prefix and _ENABLED suffix
+                overrides[flag_name] = {
                     "enabled": value.lower() == "true",
-                    "status": os.getenv(f"FEATURE_{flag_name.upper()}_STATUS", "enabled")
+                    "status": env.get(f"FEATURE_{flag_name.upper()}_STATUS", "enabled")
                 }
+        if overrides:
+            self._config.setdefault("features", {}).update(overrides)
 
     def _initialize_feature_flags(self):
         """Initialize feature flags from configuration."""
@@ -177,15 +240,13 @@ class FeatureFlagManager:
         }
 
         features_config = self._config.get("features", {})
+        self._flags_view = MappingProxyType(self._feature_flags)
 
         for flag_name, default_config in default_features.items():
-            flag_config = features_config.get(flag_name, {})
-            merged_config = {**default_config, **flag_config}
+            flag_config = features_config.get(flag_name)
+            merged_config = default_config | flag_config if flag_config else default_config
 
-            try:
-                status = FeatureStatus(merged_config.get("status", "enabled"))
-            except ValueError:
-                status = FeatureStatus.ENABLED
+            status = _STATUS_BY_VALUE.get(merged_config.get("status", "enabled"), FeatureStatus.ENABLED)
 
             self._feature_flags[flag_name] = FeatureFlag(
                 name=merged_config["name"],
@@ -237,20 +298,13 @@ class FeatureFlagManager:
         for endpoint_name, default_endpoint in default_endpoints.items():
             endpoint_config = endpoints_config.get(endpoint_name, {})
             if endpoint_config:
-                # Update existing endpoint with config
-                endpoints[endpoint_name] = ModelEndpoint(
-                    provider=ModelProvider(endpoint_config.get("provider", default_endpoint.provider.value)),
-                    endpoint_url=endpoint_config.get("endpoint_url", default_endpoint.endpoint_url),
-                    api_key_env_var=endpoint_config.get("api_key_env_var", default_endpoint.api_key_env_var),
-                    model_name=endpoint_config.get("model_name", default_endpoint.model_name),
-                    enabled=endpoint_config.get("enabled", default_endpoint.enabled),
-                    priority=endpoint_config.get("priority", default_endpoint.priority),
-                    timeout=endpoint_config.get("timeout", default_endpoint.timeout),
-                    max_retries=endpoint_config.get("max_retries", default_endpoint.max_retries),
-                    temperature=endpoint_config.get("temperature", default_endpoint.temperature),
-                    max_tokens=endpoint_config.get("max_tokens", default_endpoint.max_tokens),
-                    metadata=endpoint_config.get("metadata", {})
-                )
+                # Update existing endpoint with the fields the config overrides
+                overrides = {key: value for key, value in endpoint_config.items() if key in _ENDPOINT_FIELDS}
+                if "provider" in overrides:
+                    overrides["provider"] = _provider_from_config(
+                        overrides["provider"], default_endpoint.provider, f"endpoint {endpoint_name!r}"
+                    )
+                endpoints[endpoint_name] = replace(default_endpoint, **overrides)
             else:
                 endpoints[endpoint_name] = default_endpoint
 
@@ -258,7 +312,9 @@ class FeatureFlagManager:
         fallback_chain = ai_config.get("fallback_chain", ["gpt5_nano", "openai", "mock"])
 
         self._ai_config = AIModelConfig(
-            default_provider=ModelProvider(ai_config.get("default_provider", "gpt5_nano")),
+            default_provider=_provider_from_config(
+                ai_config.get("default_provider"), ModelProvider.GPT5_NANO, "ai_models.default_provider"
+            ),
             endpoints=endpoints,
             fallback_chain=fallback_chain,
             global_settings=ai_config.get("global_settings", {})
@@ -273,9 +329,9 @@ class FeatureFlagManager:
         """Get a specific feature flag."""
         return self._feature_flags.get(feature_name)
 
-    def get_all_feature_flags(self) -> Dict[str, FeatureFlag]:
-        """Get all feature flags."""
-        return self._feature_flags.copy()
+    def get_all_feature_flags(self) -> Mapping[str, FeatureFlag]:
+        """Get a read-only view of all feature flags."""
+        return self._flags_view
 
     def get_ai_config(self) -> Optional[AIModelConfig]:
         """Get AI model configuration."""
@@ -285,7 +341,7 @@ class FeatureFlagManager:
         """Enable a feature flag."""
         if feature_name in self._feature_flags:
             self._feature_flags[feature_name].enabled = True
-            self._save_config()
+            self._mark_dirty()
             return True
         return False
 
@@ -293,7 +349,7 @@ class FeatureFlagManager:
         """Disable a feature flag."""
         if feature_name in self._feature_flags:
             self._feature_flags[feature_name].enabled = False
-            self._save_config()
+            self._mark_dirty()
             return True
         return False
 
@@ -301,7 +357,7 @@ class FeatureFlagManager:
         """Set the status of a feature flag."""
         if feature_name in self._feature_flags:
             self._feature_flags[feature_name].status = status
-            self._save_config()
+            self._mark_dirty()
             return True
         return False
 
@@ -309,7 +365,7 @@ class FeatureFlagManager:
         """Add a custom model endpoint."""
         if self._ai_config:
             self._ai_config.endpoints[name] = endpoint
-            self._save_config()
+            self._mark_dirty()
             return True
         return False
 
@@ -317,7 +373,7 @@ class FeatureFlagManager:
         """Remove a model endpoint."""
         if self._ai_config and name in self._ai_config.endpoints:
             del self._ai_config.endpoints[name]
-            self._save_config()
+            self._mark_dirty()
             return True
         return False
 
@@ -325,10 +381,35 @@ class FeatureFlagManager:
         """Update the priority of a model endpoint."""
         if self._ai_config and name in self._ai_config.endpoints:
             self._ai_config.endpoints[name].priority = priority
-            self._save_config()
+            self._mark_dirty()
             return True
         return False
 
+    # Mutators arrive in bursts (e.g. toggling several flags at once); coalesce
+    # them into a single write shortly after the last change.
+    SAVE_DELAY = 0.1
+
+    def _mark_dirty(self):
+        """Schedule a config save, replacing any save already pending."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending configuration changes to disk immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_config()
+
     def _save_config(self):
         """Save current configuration to file."""
         try:
@@ -367,14 +448,34 @@ class FeatureFlagManager:
                 }
             }
 
-            with open(self.config_path, 'w') as f:
-                json.dump(config_to_save, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(config_to_save, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(config_to_save, indent=2).encode("utf-8")
+
+            # Write to a sibling temp file and swap it in, so a crash mid-write
+            # never leaves a truncated config behind.
+            tmp_path = f"{self.config_path}.tmp.{os.getpid()}"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                # Don't leave a partial temp file next to the config.
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
 
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
 
     def reload_config(self):
         """Reload configuration from file and environment."""
+        self.flush()
         self._config = {}
         self._feature_flags = {}
         self._ai_config = None
@@ -383,14 +484,20 @@ class FeatureFlagManager:
 
 # Global instance
 _feature_manager: Optional[FeatureFlagManager] = None
+_feature_manager_lock = threading.Lock()
 
 
 def get_feature_manager() -> FeatureFlagManager:
     """Get the global feature flag manager instance."""
     global _feature_manager
-    if _feature_manager is None:
-        _feature_manager = FeatureFlagManager()
-    return _feature_manager
+    manager = _feature_manager
+    if manager is None:
+        # Double-checked so concurrent first callers share one manager (and one config load).
+        with _feature_manager_lock:
+            if _feature_manager is None:
+                _feature_manager = FeatureFlagManager()
+            manager = _feature_manager
+    return manager
 
 
 def is_feature_enabled(feature_name: str) -> bool:
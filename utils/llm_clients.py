@@ -1,20 +1,47 @@
 """Client helpers for GPT-5 Nano and related LLM operations with feature flag support."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
 import json
 import os
 import random
 import re
+import socket
+import sqlite3
+import threading
 import time
 import logging
+import zlib
+from urllib.parse import urlsplit
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 try:  # pragma: no cover - optional dependency
     import requests
 except ImportError:  # pragma: no cover
     requests = None  # type: ignore
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional HTTP/2 transport
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+try:  # pragma: no cover - optional tokenizer
+    import tiktoken
+except ImportError:  # pragma: no cover
+    tiktoken = None  # type: ignore
+
 try:  # pragma: no cover - optional dependency
     from openai import OpenAI
 except ImportError:  # pragma: no cover
@@ -35,8 +62,182 @@ try:
 except ImportError:
     FEATURE_FLAGS_AVAILABLE = False
 
+if TYPE_CHECKING:  # pragma: no cover - optional numpy/embedding stack
+    from .semantic_cache import SemanticCache
+
 logger = logging.getLogger(__name__)
 
+_KEYWORD_RE = re.compile(r"[A-Za-z0-9]+")
+
+# Marketing-focused fallback hooks, title-cased once at import.
+_ENHANCED_HOOKS = (
+    "Remarkable",
+    "Irresistible",
+    "Share-Worthy",
+    "Tribe-Ready",
+    "Behavioral Nudge",
+    "Purple Cow",
+    "Permission-Based",
+    "Authentic Approach",
+    "Positioning Strategy",
+    "Attention-Grabbing",
+)
+_LEGACY_HOOKS = _ENHANCED_HOOKS[:5]
+
+
+def _pick_hook(prompt: str, hooks: Tuple[str, ...]) -> str:
+    """Deterministically choose a hook for *prompt* without touching global RNG state."""
+    return hooks[zlib.crc32(prompt.encode("utf-8")) % len(hooks)]
+
+
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.25
+_RETRY_MAX_DELAY = 8.0
+# Dedicated generator so backoff jitter never perturbs callers' global RNG.
+_jitter = random.Random()
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff with full jitter, honouring a numeric Retry-After."""
+    delay = _jitter.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
+
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _iter_sse_texts(response: Any) -> Iterator[str]:
+    """Yield text deltas of the first choice from a server-sent-events response."""
+    try:
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            choices = _loads(data).get("choices") or ()
+            if choices:
+                choice = choices[0]
+                text = choice.get("text") or (choice.get("delta") or {}).get("content")
+                if text:
+                    yield text
+    finally:
+        response.close()
+
+
+def _completion_texts(completion: Any) -> List[str]:
+    """Stripped message contents from an OpenAI chat completion."""
+    texts: List[str] = []
+    for choice in completion.choices:
+        message = getattr(choice, "message", None)
+        if message is not None and (content := getattr(message, "content", None)):
+            texts.append(content.strip())
+    return texts
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str) -> Any:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=4096)
+def _token_count(model: str, chunk: str) -> int:
+    return len(_encoding(model).encode(chunk))
+
+
+def _truncate_prompt(prompt: str, model: str, limit: Optional[int]) -> str:
+    """Keep whole paragraphs of *prompt* until *limit* tokens are used.
+
+    Paragraph counts are cached, so consecutive prompts that share a prefix
+    are not re-tokenized. A first paragraph longer than the limit is cut at
+    the token boundary. Without ``tiktoken`` or a limit the prompt is sent
+    unchanged.
+    """
+    if tiktoken is None or not limit:
+        return prompt
+    kept: List[str] = []
+    used = 0
+    for chunk in prompt.split("\n\n"):
+        count = _token_count(model, chunk)
+        if used + count > limit:
+            break
+        kept.append(chunk)
+        used += count
+    else:
+        return prompt
+    if not kept:
+        encoding = _encoding(model)
+        return encoding.decode(encoding.encode(prompt)[:limit])
+    return "\n\n".join(kept)
+
+
+def _extract_texts(payload: Dict[str, Any]) -> List[str]:
+    """Pull completion texts from a completions, chat or ``output``-style body."""
+    choices = payload.get("choices")
+    if isinstance(choices, list):
+        texts: List[str] = []
+        append = texts.append
+        for choice in choices:
+            text = choice.get("text")
+            if not text:
+                message = choice.get("message")
+                text = message.get("content") if message is not None else None
+            if isinstance(text, str):
+                append(text.strip())
+        return texts
+    output = payload.get("output")
+    return [output.strip()] if isinstance(output, str) else []
+
+
+@lru_cache(maxsize=32)
+def _headers_for(api_key: str, stream: bool = False) -> Mapping[str, str]:
+    """Read-only request headers, built once per credential."""
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    if stream:
+        headers["Accept"] = "text/event-stream"
+    return MappingProxyType(headers)
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> "requests.Session":
+    """Shared keep-alive session so repeated endpoint calls reuse connections."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=8)
+def _get_openai_client(api_key: str, organization: Optional[str] = None) -> Any:
+    """One OpenAI client (and connection pool) per credential, shared across instances."""
+    return OpenAI(api_key=api_key, organization=organization)
+
+
+@lru_cache(maxsize=1)
+def _http2_client() -> "httpx.Client":
+    """Shared httpx client; multiplexes over HTTP/2 when ``h2`` is installed."""
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=16)
+    try:
+        return httpx.Client(http2=True, timeout=30, limits=limits)
+    except ImportError:  # pragma: no cover - h2 extra missing
+        return httpx.Client(timeout=30, limits=limits)
+
 
 @dataclass
 class LLMChoice:
@@ -48,6 +249,269 @@ class LLMResponse:
     choices: List[LLMChoice]
 
 
+def _unique_prompts(prompts: List[str], temperature: float) -> Tuple[List[str], List[int]]:
+    """Collapse repeated prompts for a deterministic batch.
+
+    Returns the prompts to send and, for each input position, the index of
+    its result. Sampled batches (temperature > 0) are left as-is, since
+    repeats there are expected to produce different outputs.
+    """
+    if temperature != 0:
+        return list(prompts), list(range(len(prompts)))
+    positions: Dict[str, int] = {}
+    slots = [positions.setdefault(prompt, len(positions)) for prompt in prompts]
+    return list(positions), slots
+
+
+def _scatter(results: List[LLMResponse], slots: List[int]) -> List[LLMResponse]:
+    """Map unique results back to input order, copying repeats."""
+    seen = set()
+    scattered = []
+    for slot in slots:
+        response = results[slot]
+        if slot in seen:
+            response = LLMResponse(choices=[LLMChoice(text=choice.text) for choice in response.choices])
+        seen.add(slot)
+        scattered.append(response)
+    return scattered
+
+
+class _DiskResponseCache:
+    """SQLite-backed store of deterministic responses shared across processes.
+
+    The database runs in WAL mode so readers in other processes do not block
+    a writer. Entries expire ``ttl`` seconds after they are written; expired
+    rows are purged when the store is opened. Storage errors are logged and
+    treated as misses so a locked or read-only cache never fails a request.
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600.0) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "responses.sqlite3"),
+            timeout=5.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, texts BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+
+    @staticmethod
+    def _key(key: Tuple[str, str, int]) -> str:
+        model, prompt, max_tokens = key
+        return hashlib.sha256(f"{model}\0{max_tokens}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: Tuple[str, str, int]) -> Optional[Tuple[str, ...]]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT texts FROM responses WHERE key = ? AND expires > ?", (self._key(key), time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug("Disk response cache read failed: %s", e)
+            return None
+        return tuple(_loads(row[0])) if row else None
+
+    def put(self, key: Tuple[str, str, int], texts: Tuple[str, ...]) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (self._key(key), _dumps(list(texts)), time.time() + self.ttl),
+                )
+        except sqlite3.Error as e:
+            logger.debug("Disk response cache write failed: %s", e)
+
+
+@lru_cache(maxsize=1)
+def _disk_cache() -> Optional[_DiskResponseCache]:
+    """The persistent cache named by ``LLM_CACHE_DIR``, or None when unset."""
+    directory = os.getenv("LLM_CACHE_DIR")
+    if not directory:
+        return None
+    try:
+        return _DiskResponseCache(os.path.expanduser(directory), float(os.getenv("LLM_CACHE_TTL", "3600")))
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.warning("Disk response cache disabled: %s", e)
+        return None
+
+
+class _ResponseCache:
+    """Bounded exact-match cache of successful deterministic generations.
+
+    Only temperature-0 calls are cached; sampled output is expected to vary.
+    Fallback text is never stored, so a recovered endpoint is used again as
+    soon as it answers. With a ``disk`` store, in-memory misses are looked up
+    there and every stored response is written through, so identical prompts
+    are reused across processes and restarts.
+    """
+
+    SIZE = 1024
+
+    def __init__(self, disk: Optional[_DiskResponseCache] = None) -> None:
+        self._entries: Dict[Tuple[str, str, int], Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+        self._disk = disk
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, prompt: str, temperature: float, max_tokens: int) -> Optional[LLMResponse]:
+        if temperature != 0:
+            return None
+        key = (model, prompt, max_tokens)
+        with self._lock:
+            texts = self._entries.get(key)
+        if texts is None and self._disk is not None:
+            texts = self._disk.get(key)
+            if texts is not None:
+                with self._lock:
+                    self._store(key, texts)
+        with self._lock:
+            if texts is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
+
+    def put(self, model: str, prompt: str, temperature: float, max_tokens: int, response: LLMResponse) -> LLMResponse:
+        if temperature == 0:
+            key = (model, prompt, max_tokens)
+            texts = tuple(choice.text for choice in response.choices)
+            with self._lock:
+                self._store(key, texts)
+            if self._disk is not None:
+                self._disk.put(key, texts)
+        return response
+
+    def _store(self, key: Tuple[str, str, int], texts: Tuple[str, ...]) -> None:
+        if key not in self._entries and len(self._entries) >= self.SIZE:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = texts
+
+    def clear(self) -> None:
+        """Drop the in-memory entries; persistent ones expire by TTL."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class _EndpointFailure(Exception):
+    """A transport or HTTP failure talking to a configured endpoint.
+
+    Only these count against the circuit breaker; an endpoint that is simply
+    not configured (no client, no API key) is skipped without tripping it.
+    """
+
+
+class _CircuitBreaker:
+    """Per-endpoint breaker that skips an endpoint after repeated failures.
+
+    After ``THRESHOLD`` consecutive failures the endpoint is skipped for
+    ``COOLDOWN`` seconds; the next call after that is a trial, and one more
+    failure reopens the breaker straight away.
+    """
+
+    THRESHOLD = 5
+    COOLDOWN = 30.0
+
+    def __init__(self) -> None:
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, name: str) -> bool:
+        return time.monotonic() >= self._open_until.get(name, 0.0)
+
+    def record(self, name: str, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._failures.pop(name, None)
+                self._open_until.pop(name, None)
+                return
+            failures = self._failures.get(name, 0) + 1
+            self._failures[name] = failures
+            if failures >= self.THRESHOLD:
+                self._open_until[name] = time.monotonic() + self.COOLDOWN
+                logger.warning("Endpoint %s tripped after %d failures; skipping for %.0fs", name, failures, self.COOLDOWN)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._open_until.clear()
+
+
+class _AnalyticsRing:
+    """Fixed-size ring of endpoint outcomes, summarised off the request path.
+
+    Recording only writes into preallocated arrays; a one-shot timer logs one
+    aggregate line per endpoint at most every ``FLUSH_INTERVAL`` seconds. If
+    more than ``SIZE`` outcomes arrive between flushes the oldest are dropped.
+    """
+
+    SIZE = 4096
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self) -> None:
+        self._latency = array("d", bytes(8 * self.SIZE))
+        self._ok = array("b", bytes(self.SIZE))
+        self._endpoint: List[str] = [""] * self.SIZE
+        self._positions = itertools.count()
+        self._head = 0
+        self._flushed = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def record(self, endpoint_name: str, ok: bool, latency: float) -> None:
+        pos = next(self._positions)
+        slot = pos % self.SIZE
+        self._latency[slot] = latency
+        self._ok[slot] = ok
+        self._endpoint[slot] = endpoint_name
+        if pos >= self._head:
+            self._head = pos + 1
+        if self._timer is None:
+            with self._lock:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            head = self._head
+            start = max(self._flushed, head - self.SIZE)
+            self._flushed = head
+
+        latencies: Dict[str, List[float]] = {}
+        errors: Dict[str, int] = {}
+        for pos in range(start, head):
+            slot = pos % self.SIZE
+            name = self._endpoint[slot]
+            latencies.setdefault(name, []).append(self._latency[slot])
+            if not self._ok[slot]:
+                errors[name] = errors.get(name, 0) + 1
+        for name, values in latencies.items():
+            values.sort()
+            last = len(values) - 1
+            logger.info(
+                "Model Analytics - Endpoint: %s, Requests: %d, Errors: %d, p50: %.2fs, p95: %.2fs",
+                name, len(values), errors.get(name, 0), values[last // 2], values[int(last * 0.95)],
+            )
+
+
 class EnhancedLLMClient:
     """Enhanced LLM client with feature flag support and intelligent fallback."""
 
@@ -58,11 +522,15 @@ class EnhancedLLMClient:
         use_feature_flags: bool = True,
         enable_analytics: bool = True,
         max_retries: int = 3,
+        max_input_tokens: Optional[int] = None,
+        semantic_cache: Optional["SemanticCache"] = None,
     ) -> None:
         self.model = model
         self.use_feature_flags = use_feature_flags and FEATURE_FLAGS_AVAILABLE
         self.enable_analytics = enable_analytics and (self.use_feature_flags and is_model_analytics_enabled())
         self.max_retries = max_retries
+        # Per-endpoint ``metadata["max_input_tokens"]`` takes precedence.
+        self.max_input_tokens = max_input_tokens
 
         # Initialize feature flag manager if available
         self.feature_manager = get_feature_manager() if self.use_feature_flags else None
@@ -72,9 +540,34 @@ class EnhancedLLMClient:
         self._request_count = 0
         self._error_count = 0
         self._total_latency = 0.0
+        self._analytics = _AnalyticsRing()
+        self._response_cache = _ResponseCache(_disk_cache())
+        self._semantic_cache = semantic_cache
+        self._breaker = _CircuitBreaker()
 
         # Build provider clients
         self._provider_clients = self._build_provider_clients()
+        self._openai_client_name = "openai" if "openai" in self._provider_clients else None
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for the deterministic response cache."""
+        return self._response_cache.stats()
+
+    def clear_cache(self) -> None:
+        self._response_cache.clear()
+
+    def _remember(self, prompt: str, temperature: float, max_tokens: int, response: LLMResponse) -> LLMResponse:
+        """Record a successful endpoint response in the configured caches."""
+        self._response_cache.put(self.model, prompt, temperature, max_tokens, response)
+        if self._semantic_cache is not None and temperature == 0 and response.choices:
+            self._semantic_cache.add(prompt, response.choices[0].text, scope=(self.model, max_tokens))
+        return response
+
+    def _similar(self, prompt: str, temperature: float, max_tokens: int) -> Optional[str]:
+        """Semantic-cache lookup, gated like the exact cache: deterministic calls only."""
+        if self._semantic_cache is None or temperature != 0:
+            return None
+        return self._semantic_cache.lookup(prompt, scope=(self.model, max_tokens))
 
     def _build_provider_clients(self) -> Dict[str, Any]:
         """Build clients for available providers."""
@@ -82,9 +575,10 @@ class EnhancedLLMClient:
 
         if not self.use_feature_flags:
             # Legacy mode - use original logic
-            if OpenAI and os.getenv("OPENAI_API_KEY"):
+            api_key = os.getenv("OPENAI_API_KEY")
+            if OpenAI and api_key:
                 try:
-                    clients["openai"] = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+                    clients["openai"] = _get_openai_client(api_key)
                 except Exception as e:
                     logger.warning(f"Failed to initialize OpenAI client: {e}")
             return clients
@@ -101,7 +595,7 @@ class EnhancedLLMClient:
                     try:
                         api_key = os.getenv(endpoint.api_key_env_var)
                         if api_key:
-                            clients[endpoint_name] = OpenAI(api_key=api_key)
+                            clients[endpoint_name] = _get_openai_client(api_key)
                     except Exception as e:
                         logger.warning(f"Failed to initialize {endpoint_name} client: {e}")
 
@@ -112,12 +606,188 @@ class EnhancedLLMClient:
         start_time = time.time()
         self._request_count += 1
 
+        cached = self._response_cache.get(self.model, prompt, temperature, max_tokens)
+        if cached is not None:
+            return cached
+        similar = self._similar(prompt, temperature, max_tokens)
+        if similar is not None:
+            return LLMResponse(choices=[LLMChoice(text=similar)])
+
         # Determine generation strategy
         if self.use_feature_flags and self.ai_config:
             return self._generate_with_feature_flags(prompt, temperature, max_tokens, start_time)
         else:
             return self._generate_legacy(prompt, temperature, max_tokens, start_time)
 
+    def generate_stream(self, prompt: str, *, temperature: float = 0.7, max_tokens: int = 256) -> Iterator[str]:
+        """Yield the response text incrementally as the endpoint produces it.
+
+        Endpoints in the fallback chain are tried in order until one starts
+        streaming; a stream that breaks after its first token is not retried.
+        Cached responses, legacy mode and the offline fallback yield their text
+        in one piece.
+        """
+        if not (self.use_feature_flags and self.ai_config):
+            yield self.generate(prompt, temperature=temperature, max_tokens=max_tokens).choices[0].text
+            return
+
+        start_time = time.time()
+        self._request_count += 1
+
+        cached = self._response_cache.get(self.model, prompt, temperature, max_tokens)
+        if cached is not None:
+            yield cached.choices[0].text
+            return
+        similar = self._similar(prompt, temperature, max_tokens)
+        if similar is not None:
+            yield similar
+            return
+
+        for endpoint_name in self.ai_config.fallback_chain:
+            endpoint = self.ai_config.endpoints.get(endpoint_name)
+            if not endpoint or not endpoint.is_available() or not self._breaker.allow(endpoint_name):
+                continue
+
+            try:
+                stream = self._open_stream(endpoint, prompt, temperature, max_tokens)
+            except _EndpointFailure:
+                self._breaker.record(endpoint_name, False)
+                continue
+            if stream is None:
+                continue
+
+            parts: List[str] = []
+            try:
+                for text in stream:
+                    parts.append(text)
+                    yield text
+            except Exception as e:
+                logger.warning("Stream from %s interrupted: %s", endpoint_name, e)
+                self._breaker.record(endpoint_name, False)
+                if parts:
+                    return
+                continue
+
+            if not parts:
+                continue
+            self._breaker.record(endpoint_name, True)
+            latency = time.time() - start_time
+            self._total_latency += latency
+            if self.enable_analytics:
+                self._record_analytics(endpoint_name, "success", latency)
+            self._remember(prompt, temperature, max_tokens, LLMResponse(choices=[LLMChoice(text="".join(parts).strip())]))
+            return
+
+        self._error_count += 1
+        if self.enable_analytics:
+            self._record_analytics("fallback", "error", time.time() - start_time)
+        yield self._enhanced_fallback(prompt)
+
+    def _open_stream(self, endpoint, prompt: str, temperature: float, max_tokens: int) -> Optional[Iterator[str]]:
+        """Start a streaming request.
+
+        Returns None if the endpoint cannot stream or is not configured, and
+        raises ``_EndpointFailure`` if the request itself fails.
+        """
+        prompt = self._fit_prompt(endpoint, prompt)
+        if endpoint.provider == ModelProvider.OPENAI:
+            if not self._openai_client_name:
+                return None
+            try:
+                chunks = self._provider_clients[self._openai_client_name].chat.completions.create(
+                    model=endpoint.model_name,
+                    messages=[
+                        {"role": "system", "content": "You are a marketing strategist."},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                )
+            except Exception as e:
+                logger.warning("Streaming %s endpoint failed: %s", endpoint.provider.value, e)
+                raise _EndpointFailure(str(e)) from e
+            return (
+                chunk.choices[0].delta.content
+                for chunk in chunks
+                if chunk.choices and chunk.choices[0].delta.content
+            )
+        if endpoint.provider not in (ModelProvider.GPT5_NANO, ModelProvider.CUSTOM):
+            return None
+
+        api_key = os.getenv(endpoint.api_key_env_var)
+        if not api_key or not requests:
+            return None
+        payload = {
+            "model": endpoint.model_name,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        try:
+            response = _http_session().post(
+                endpoint.endpoint_url,
+                headers=_headers_for(api_key, stream=True),
+                data=_dumps(payload),
+                timeout=endpoint.timeout,
+                stream=True,
+            )
+        except Exception as e:
+            logger.warning("Streaming %s endpoint failed: %s", endpoint.provider.value, e)
+            raise _EndpointFailure(str(e)) from e
+        if not response.ok:
+            response.close()
+            logger.warning("Streaming %s endpoint returned HTTP %d", endpoint.provider.value, response.status_code)
+            raise _EndpointFailure(f"HTTP {response.status_code}")
+        return _iter_sse_texts(response)
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 256,
+        max_concurrency: int = 8,
+    ) -> List[LLMResponse]:
+        """Generate responses for *prompts* concurrently from sync code, preserving order."""
+        if not prompts:
+            return []
+        unique, slots = _unique_prompts(prompts, temperature)
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(unique))) as executor:
+            results = list(executor.map(
+                lambda prompt: self.generate(prompt, temperature=temperature, max_tokens=max_tokens),
+                unique,
+            ))
+        return _scatter(results, slots)
+
+    async def agenerate(self, prompt: str, *, temperature: float = 0.7, max_tokens: int = 256) -> LLMResponse:
+        """Async variant of :meth:`generate`.
+
+        The provider SDK and HTTP calls are blocking, so the call runs in a
+        worker thread; concurrent awaits overlap their network latency.
+        """
+        return await asyncio.to_thread(self.generate, prompt, temperature=temperature, max_tokens=max_tokens)
+
+    async def agenerate_batch(
+        self,
+        prompts: List[str],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 256,
+        max_concurrency: int = 8,
+    ) -> List[LLMResponse]:
+        """Generate responses for *prompts* concurrently, preserving order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.agenerate(prompt, temperature=temperature, max_tokens=max_tokens)
+
+        unique, slots = _unique_prompts(prompts, temperature)
+        results = await asyncio.gather(*(_one(prompt) for prompt in unique))
+        return _scatter(list(results), slots)
+
     def _generate_with_feature_flags(self, prompt: str, temperature: float, max_tokens: int, start_time: float) -> LLMResponse:
         """Generate using feature flag configuration."""
         if not self.ai_config:
@@ -126,16 +796,21 @@ class EnhancedLLMClient:
         # Try each endpoint in priority order
         for endpoint_name in self.ai_config.fallback_chain:
             endpoint = self.ai_config.endpoints.get(endpoint_name)
-            if not endpoint or not endpoint.is_available():
+            if not endpoint or not endpoint.is_available() or not self._breaker.allow(endpoint_name):
                 continue
 
-            response = self._try_endpoint(endpoint, prompt, temperature, max_tokens)
+            try:
+                response = self._try_endpoint(endpoint, prompt, temperature, max_tokens)
+            except _EndpointFailure:
+                self._breaker.record(endpoint_name, False)
+                continue
             if response:
+                self._breaker.record(endpoint_name, True)
                 latency = time.time() - start_time
                 self._total_latency += latency
                 if self.enable_analytics:
                     self._record_analytics(endpoint_name, "success", latency)
-                return response
+                return self._remember(prompt, temperature, max_tokens, response)
 
         # All endpoints failed, use fallback
         latency = time.time() - start_time
@@ -157,12 +832,15 @@ class EnhancedLLMClient:
                 self._total_latency += latency
                 if self.enable_analytics:
                     self._record_analytics("gpt5_nano", "success", latency)
+                # The legacy probe only reports success, not the completion
+                # text, so this placeholder must never be cached as an answer.
                 return LLMResponse(choices=[LLMChoice(text="Success via GPT-5 Nano")])
 
         # Try OpenAI
-        if "openai" in self._provider_clients:
+        client = self._provider_clients.get("openai")
+        if client is not None:
             try:
-                completion = self._provider_clients["openai"].chat.completions.create(
+                completion = client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "You are a marketing strategist."},
@@ -171,17 +849,16 @@ class EnhancedLLMClient:
                     temperature=temperature,
                     max_tokens=max_tokens,
                 )
-                texts = [
-                    choice.message.content.strip()
-                    for choice in completion.choices
-                    if getattr(choice, "message", None) and choice.message.content
-                ]
+                texts = _completion_texts(completion)
                 if texts:
                     latency = time.time() - start_time
                     self._total_latency += latency
                     if self.enable_analytics:
                         self._record_analytics("openai", "success", latency)
-                    return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
+                    return self._remember(
+                        prompt, temperature, max_tokens,
+                        LLMResponse(choices=[LLMChoice(text=t) for t in texts]),
+                    )
             except Exception as e:
                 logger.warning(f"OpenAI API failed: {e}")
 
@@ -193,15 +870,22 @@ class EnhancedLLMClient:
 
         return LLMResponse(choices=[LLMChoice(text=self._enhanced_fallback(prompt))])
 
+    def _fit_prompt(self, endpoint, prompt: str) -> str:
+        limit = endpoint.metadata.get("max_input_tokens", self.max_input_tokens)
+        return _truncate_prompt(prompt, endpoint.model_name, limit)
+
     def _try_endpoint(self, endpoint, prompt: str, temperature: float, max_tokens: int) -> Optional[LLMResponse]:
         """Try to generate using a specific endpoint."""
         try:
+            prompt = self._fit_prompt(endpoint, prompt)
             if endpoint.provider == ModelProvider.OPENAI:
                 return self._try_openai_endpoint(endpoint, prompt, temperature, max_tokens)
             elif endpoint.provider == ModelProvider.GPT5_NANO:
                 return self._try_gpt5_nano_endpoint_configured(endpoint, prompt, temperature, max_tokens)
             elif endpoint.provider == ModelProvider.CUSTOM:
                 return self._try_custom_endpoint(endpoint, prompt, temperature, max_tokens)
+        except _EndpointFailure:
+            raise
         except Exception as e:
             logger.warning(f"Endpoint {endpoint.provider.value} failed: {e}")
 
@@ -209,17 +893,11 @@ class EnhancedLLMClient:
 
     def _try_openai_endpoint(self, endpoint, prompt: str, temperature: float, max_tokens: int) -> Optional[LLMResponse]:
         """Try OpenAI-compatible endpoint."""
-        client_name = None
-        for name, client in self._provider_clients.items():
-            if name == "openai":  # Find OpenAI client
-                client_name = name
-                break
-
-        if not client_name:
+        if not self._openai_client_name:
             return None
 
         try:
-            completion = self._provider_clients[client_name].chat.completions.create(
+            completion = self._provider_clients[self._openai_client_name].chat.completions.create(
                 model=endpoint.model_name,
                 messages=[
                     {"role": "system", "content": "You are a marketing strategist."},
@@ -228,16 +906,13 @@ class EnhancedLLMClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
-            texts = [
-                choice.message.content.strip()
-                for choice in completion.choices
-                if getattr(choice, "message", None) and choice.message.content
-            ]
-            if texts:
-                return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
         except Exception as e:
             logger.warning(f"OpenAI endpoint failed: {e}")
+            raise _EndpointFailure(str(e)) from e
 
+        texts = _completion_texts(completion)
+        if texts:
+            return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
         return None
 
     def _try_gpt5_nano_endpoint_configured(self, endpoint, prompt: str, temperature: float, max_tokens: int) -> Optional[LLMResponse]:
@@ -252,25 +927,37 @@ class EnhancedLLMClient:
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        headers = _headers_for(api_key)
 
+        error: Any = None
         for attempt in range(endpoint.max_retries):
+            retry_after = None
             try:
-                response = requests.post(
+                response = _http_session().post(
                     endpoint.endpoint_url,
                     headers=headers,
-                    data=json.dumps(payload),
+                    data=_dumps(payload),
                     timeout=endpoint.timeout
                 )
-                response.raise_for_status()
-                body = response.json()
-                texts = self._extract_texts(body)
-                if texts:
-                    return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
-            except Exception as e:
-                if attempt == endpoint.max_retries - 1:
-                    logger.warning(f"GPT-5 Nano endpoint failed after {endpoint.max_retries} attempts: {e}")
-                time.sleep(0.1 * (attempt + 1))  # Exponential backoff
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            else:
+                if response.status_code not in _RETRYABLE_STATUS:
+                    # Success or a terminal error (bad request, auth): no point retrying
+                    try:
+                        response.raise_for_status()
+                        texts = self._extract_texts(_loads(response.content))
+                    except Exception as e:
+                        logger.warning("GPT-5 Nano endpoint failed: %s", e)
+                        raise _EndpointFailure(str(e)) from e
+                    return LLMResponse(choices=[LLMChoice(text=t) for t in texts]) if texts else None
+                error = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("Retry-After")
+
+            if attempt == endpoint.max_retries - 1:
+                logger.warning("GPT-5 Nano endpoint failed after %d attempts: %s", endpoint.max_retries, error)
+                raise _EndpointFailure(str(error))
+            time.sleep(_retry_delay(attempt, retry_after))
 
         return None
 
@@ -286,23 +973,24 @@ class EnhancedLLMClient:
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        headers = _headers_for(api_key)
 
         try:
-            response = requests.post(
+            response = _http_session().post(
                 endpoint.endpoint_url,
                 headers=headers,
-                data=json.dumps(payload),
+                data=_dumps(payload),
                 timeout=endpoint.timeout
             )
             response.raise_for_status()
-            body = response.json()
-            texts = self._extract_texts(body)
-            if texts:
-                return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
+            body = _loads(response.content)
         except Exception as e:
             logger.warning(f"Custom endpoint failed: {e}")
+            raise _EndpointFailure(str(e)) from e
 
+        texts = self._extract_texts(body)
+        if texts:
+            return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
         return None
 
     def _try_gpt5_nano_endpoint(self, endpoint: str, api_key: str, prompt: str, temperature: float, max_tokens: int) -> bool:
@@ -313,60 +1001,37 @@ class EnhancedLLMClient:
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        headers = _headers_for(api_key)
 
         try:
-            response = requests.post(endpoint, headers=headers, data=json.dumps(payload), timeout=30)
+            response = _http_session().post(endpoint, headers=headers, data=_dumps(payload), timeout=30)
             response.raise_for_status()
             return True
         except Exception:
             return False
 
     def _extract_texts(self, payload: Dict[str, Any]) -> List[str]:
-        if "choices" in payload and isinstance(payload["choices"], list):
-            texts: List[str] = []
-            for choice in payload["choices"]:
-                text = choice.get("text") or choice.get("message", {}).get("content")
-                if isinstance(text, str):
-                    texts.append(text.strip())
-            return texts
-        if "output" in payload and isinstance(payload["output"], str):
-            return [payload["output"].strip()]
-        return []
+        return _extract_texts(payload)
 
     def _enhanced_fallback(self, prompt: str) -> str:
         """Enhanced fallback with better keyword extraction."""
-        keywords = re.findall(r"[A-Za-z0-9]+", prompt)
-        seed = sum(ord(c) for c in prompt) % 9973
-        random.seed(seed)
-
-        # Marketing-focused fallback responses
-        hooks = [
-            "remarkable",
-            "irresistible",
-            "share-worthy",
-            "tribe-ready",
-            "behavioral nudge",
-            "purple cow",
-            "permission-based",
-            "authentic approach",
-            "positioning strategy",
-            "attention-grabbing"
-        ]
-
-        hook = random.choice(hooks)
+        keywords = _KEYWORD_RE.findall(prompt)
+        hook = _pick_hook(prompt, _ENHANCED_HOOKS)
         summary = " ".join(keywords[:12])
 
         # Create more marketing-focused response
-        return f"{hook.title()}: {summary[:160]} — Apply strategic marketing principles for maximum impact."
+        return f"{hook}: {summary[:160]} — Apply strategic marketing principles for maximum impact."
 
     def _record_analytics(self, endpoint_name: str, status: str, latency: float):
         """Record analytics for model performance."""
         if not self.feature_manager:
             return
 
-        # This would typically send to analytics service
-        logger.info(f"Model Analytics - Endpoint: {endpoint_name}, Status: {status}, Latency: {latency:.2f}s")
+        self._analytics.record(endpoint_name, status == "success", latency)
+
+    def flush_analytics(self) -> None:
+        """Log the analytics recorded since the last flush immediately."""
+        self._analytics.flush()
 
 
 class LLMClient:
@@ -385,31 +1050,49 @@ class LLMClient:
         self.api_key = api_key or os.getenv("GPT5_NANO_API_KEY") or os.getenv("OPENAI_API_KEY")
         self.organization = organization or os.getenv("OPENAI_ORG")
         self._openai_client = self._build_openai_client()
+        self._response_cache = _ResponseCache(_disk_cache())
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for the deterministic response cache."""
+        return self._response_cache.stats()
+
+    def clear_cache(self) -> None:
+        self._response_cache.clear()
 
     def _build_openai_client(self) -> Optional[Any]:
         if OpenAI is None or not self.api_key:
             return None
         try:
-            return OpenAI(api_key=self.api_key, organization=self.organization)
+            return _get_openai_client(self.api_key, self.organization)
         except Exception:  # pragma: no cover - credentials/runtime
             return None
 
     def generate(self, prompt: str, *, temperature: float = 0.7, max_tokens: int = 256) -> LLMResponse:
-        if self.endpoint and requests is not None and self.api_key:
+        cached = self._response_cache.get(self.model, prompt, temperature, max_tokens)
+        if cached is not None:
+            return cached
+
+        if self.endpoint and (httpx is not None or requests is not None) and self.api_key:
             payload = {
                 "model": self.model,
                 "prompt": prompt,
                 "temperature": temperature,
                 "max_tokens": max_tokens,
             }
-            headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+            headers = _headers_for(self.api_key)
             try:
-                response = requests.post(self.endpoint, headers=headers, data=json.dumps(payload), timeout=30)
+                if httpx is not None:
+                    response = _http2_client().post(self.endpoint, headers=headers, content=_dumps(payload))
+                else:
+                    response = _http_session().post(self.endpoint, headers=headers, data=_dumps(payload), timeout=30)
                 response.raise_for_status()
-                body = response.json()
+                body = _loads(response.content)
                 texts = self._extract_texts(body)
                 if texts:
-                    return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
+                    return self._response_cache.put(
+                        self.model, prompt, temperature, max_tokens,
+                        LLMResponse(choices=[LLMChoice(text=t) for t in texts]),
+                    )
             except Exception:  # pragma: no cover - endpoint failure
                 pass
 
@@ -424,44 +1107,25 @@ class LLMClient:
                     temperature=temperature,
                     max_tokens=max_tokens,
                 )
-                texts = [
-                    choice.message.content.strip()
-                    for choice in completion.choices
-                    if getattr(choice, "message", None) and choice.message.content
-                ]
+                texts = _completion_texts(completion)
                 if texts:
-                    return LLMResponse(choices=[LLMChoice(text=t) for t in texts])
+                    return self._response_cache.put(
+                        self.model, prompt, temperature, max_tokens,
+                        LLMResponse(choices=[LLMChoice(text=t) for t in texts]),
+                    )
             except Exception:  # pragma: no cover - API failure
                 pass
 
         return LLMResponse(choices=[LLMChoice(text=self._fallback(prompt))])
 
     def _extract_texts(self, payload: Dict[str, Any]) -> List[str]:
-        if "choices" in payload and isinstance(payload["choices"], list):
-            texts: List[str] = []
-            for choice in payload["choices"]:
-                text = choice.get("text") or choice.get("message", {}).get("content")
-                if isinstance(text, str):
-                    texts.append(text.strip())
-            return texts
-        if "output" in payload and isinstance(payload["output"], str):
-            return [payload["output"].strip()]
-        return []
+        return _extract_texts(payload)
 
     def _fallback(self, prompt: str) -> str:
-        keywords = re.findall(r"[A-Za-z0-9]+", prompt)
-        seed = sum(ord(c) for c in prompt) % 9973
-        random.seed(seed)
-        hook = random.choice([
-            "remarkable",
-            "irresistible",
-            "share-worthy",
-            "tribe-ready",
-            "behavioral nudge",
-        ])
+        keywords = _KEYWORD_RE.findall(prompt)
+        hook = _pick_hook(prompt, _LEGACY_HOOKS)
         summary = " ".join(keywords[:12])
-        return f"{hook.title()}: {summary[:160]}"
-
+        return f"{hook}: {summary[:160]}"
 
 _default_client: Optional[LLMClient] = None
 
@@ -475,21 +1139,51 @@ def get_llm() -> LLMClient:
 
 def get_enhanced_llm() -> EnhancedLLMClient:
     """Get enhanced LLM client with feature flag support."""
-    return EnhancedLLMClient()
+    return get_enhanced_llm_client()
 
 
 # Global enhanced client
 _enhanced_client: Optional[EnhancedLLMClient] = None
+_enhanced_client_lock = threading.Lock()
 
 
 def get_enhanced_llm_client() -> EnhancedLLMClient:
     """Get the global enhanced LLM client instance."""
     global _enhanced_client
     if _enhanced_client is None:
-        _enhanced_client = EnhancedLLMClient()
+        with _enhanced_client_lock:
+            if _enhanced_client is None:
+                _enhanced_client = EnhancedLLMClient()
     return _enhanced_client
 
 
+def prewarm() -> None:
+    """Build the global client and open connections to its HTTP endpoints.
+
+    Resolves each available endpoint's host and sends a HEAD request through
+    the shared session, so the first real call skips client construction,
+    DNS and the TLS handshake. Failures are ignored; this is best effort.
+    """
+    client = get_enhanced_llm_client()
+    if not client.ai_config or requests is None:
+        return
+    for endpoint in client.ai_config.endpoints.values():
+        if endpoint.provider == ModelProvider.MOCK or not endpoint.is_available():
+            continue
+        url = urlsplit(endpoint.endpoint_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            continue
+        try:
+            socket.getaddrinfo(url.hostname, url.port or (443 if url.scheme == "https" else 80))
+            _http_session().head(endpoint.endpoint_url, timeout=endpoint.timeout)
+        except Exception as e:
+            logger.debug("Prewarming %s failed: %s", endpoint.endpoint_url, e)
+
+
+if os.getenv("LLM_PREWARM") == "1":
+    threading.Thread(target=prewarm, name="llm-prewarm", daemon=True).start()
+
+
 __all__ = [
     "LLMClient",
     "EnhancedLLMClient",
@@ -497,5 +1191,6 @@ __all__ = [
     "LLMResponse",
     "get_llm",
     "get_enhanced_llm",
-    "get_enhanced_llm_client"
+    "get_enhanced_llm_client",
+    "prewarm",
 ]
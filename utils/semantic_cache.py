@@ -0,0 +1,157 @@
+"""Embedding-similarity cache for LLM responses to paraphrased prompts."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+try:  # pragma: no cover - optional heavy deps
+    from sentence_transformers import SentenceTransformer
+except Exception:  # pragma: no cover
+    SentenceTransformer = None  # type: ignore
+
+try:  # pragma: no cover - optional vector index
+    import faiss
+except Exception:  # pragma: no cover
+    faiss = None  # type: ignore
+
+
+Embedder = Callable[[Sequence[str]], Any]
+
+
+class SemanticCache:
+    """Serve a stored response when a new prompt embeds close to a cached one.
+
+    Prompts are embedded with L2-normalised vectors so the inner product is the
+    cosine similarity. A FAISS ``IndexFlatIP`` is used when available, otherwise
+    a NumPy matrix product over the stored vectors. Each entry carries a
+    ``scope`` (the client passes its model and ``max_tokens``) and only matches
+    lookups made with the same scope. Vectors live in a preallocated ring of
+    ``max_entries`` rows, so inserts and evictions never restack the matrix.
+    Entries expire after ``ttl`` seconds and the oldest are evicted when the
+    ring is full. Without an embedder (no ``sentence-transformers`` and none
+    injected) the cache is inert: lookups miss and nothing is stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.92,
+        ttl: Optional[float] = 3600.0,
+        max_entries: int = 2048,
+        model_name: str = "all-MiniLM-L6-v2",
+        embedder: Optional[Embedder] = None,
+    ) -> None:
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        if embedder is None and SentenceTransformer is not None:
+            model = SentenceTransformer(model_name)
+            embedder = lambda texts: model.encode(list(texts), normalize_embeddings=True)  # noqa: E731
+        self._embedder = embedder
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None  # (max_entries, dim), allocated on first add
+        self._responses: List[Optional[str]] = [None] * max_entries
+        self._scopes: List[Hashable] = [None] * max_entries
+        self._stored_at = np.zeros(max_entries)
+        self._head = 0
+        self._size = 0
+        self._index: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._embedder is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lookup(self, prompt: str, *, scope: Hashable = None) -> Optional[str]:
+        """Return the cached response for the most similar prompt in *scope*, if close enough."""
+        if self._embedder is None:
+            return None
+        query = self._embed(prompt)
+        with self._lock:
+            self._expire()
+            if not self._size:
+                return None
+            if self._index is not None:
+                scores, ids = self._index.search(query[None, :], self._size)
+                for slot, score in zip(ids[0].tolist(), scores[0].tolist()):
+                    if score < self.threshold:
+                        return None
+                    if slot >= 0 and self._scopes[slot] == scope:
+                        return self._responses[slot]
+                return None
+
+            slots = (self._head + np.arange(self._size)) % self.max_entries
+            in_scope = np.fromiter((self._scopes[slot] == scope for slot in slots), dtype=bool, count=self._size)
+            if not in_scope.any():
+                return None
+            similarities = np.where(in_scope, self._vectors[slots] @ query, -np.inf)
+            best = int(similarities.argmax())
+            if float(similarities[best]) < self.threshold:
+                return None
+            return self._responses[int(slots[best])]
+
+    def add(self, prompt: str, response: str, *, scope: Hashable = None) -> None:
+        """Store *response* under the embedding of *prompt* in *scope*."""
+        if self._embedder is None:
+            return
+        vector = self._embed(prompt)
+        with self._lock:
+            self._expire()
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+                if faiss is not None:
+                    self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(vector.shape[0]))
+            if self._size == self.max_entries:
+                self._evict(1)
+            slot = (self._head + self._size) % self.max_entries
+            self._vectors[slot] = vector
+            self._responses[slot] = response
+            self._scopes[slot] = scope
+            self._stored_at[slot] = time.monotonic()
+            self._size += 1
+            if self._index is not None:
+                self._index.add_with_ids(vector[None, :], np.array([slot], dtype=np.int64))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = None
+            self._responses = [None] * self.max_entries
+            self._scopes = [None] * self.max_entries
+            self._head = 0
+            self._size = 0
+            self._index = None
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        vector = np.asarray(self._embedder([prompt]), dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _expire(self) -> None:
+        if self.ttl is None or not self._size:
+            return
+        cutoff = time.monotonic() - self.ttl
+        # Entries are appended in time order, so expired ones are the oldest.
+        expired = 0
+        while expired < self._size and self._stored_at[(self._head + expired) % self.max_entries] < cutoff:
+            expired += 1
+        if expired:
+            self._evict(expired)
+
+    def _evict(self, count: int) -> None:
+        """Drop the *count* oldest entries."""
+        slots = [(self._head + offset) % self.max_entries for offset in range(count)]
+        for slot in slots:
+            self._responses[slot] = None
+            self._scopes[slot] = None
+        if self._index is not None:
+            self._index.remove_ids(np.array(slots, dtype=np.int64))
+        self._head = (self._head + count) % self.max_entries
+        self._size -= count
+
+
+__all__ = ["SemanticCache"]